@@ -0,0 +1,50 @@
+"""
+ETag / conditional GET support
+
+ETags are derived from the id and updated_at of the returned rows, so a
+client that sends If-None-Match with the ETag of its cached copy gets an
+empty 304 response instead of the serialized data.
+"""
+
+from fastapi import Request, Response, status
+from typing import Iterable, Optional
+import hashlib
+
+
+def compute_etag(*parts) -> str:
+    """Weak ETag over the given values (ids, updated_at timestamps, query parameters)"""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def row_version(row, fields: Iterable[str] = ("updated_at",)) -> tuple:
+    """Identity and version of a row: its id plus the given change-tracking columns"""
+    return (str(row.id),) + tuple(str(getattr(row, field)) for field in fields)
+
+
+def rows_etag(rows: Iterable, *extra, fields: Iterable[str] = ("updated_at",)) -> str:
+    """ETag of a list page: versions of its rows plus e.g. the next cursor"""
+    return compute_etag([row_version(row, fields) for row in rows], *extra)
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Set the ETag header and answer a matching If-None-Match
+
+    Returns:
+        A 304 response to return as is, or None to send the full response
+    """
+    response.headers["ETag"] = etag
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison (RFC 9110): W/ prefixes are ignored on both sides
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag.removeprefix("W/") in candidates or "*" in candidates:
+            headers = {
+                key: value for key, value in response.headers.items()
+                if key.lower() not in ("content-length", "content-type")
+            }
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return None
@@ -0,0 +1,122 @@
+"""
+Keyset (cursor) pagination for list endpoints
+
+Lists are ordered by (sort column, id) and a page continues strictly after
+the last row of the previous one, so deep pages cost the same as the first
+and rows inserted meanwhile don't shift pages. The cursor is opaque to
+clients; list endpoints return it in the X-Next-Cursor header and keep their
+plain list bodies.
+"""
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import Query
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, Union
+import base64
+import json
+import uuid
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: Union[datetime, float, None], row_id) -> str:
+    """Encode the position after a row as an opaque cursor"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = [sort_value, str(row_id)]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, uuid.UUID]:
+    """
+    Decode a cursor from encode_cursor()
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        if isinstance(sort_value, str):
+            sort_value = datetime.fromisoformat(sort_value)
+        elif sort_value is not None and not isinstance(sort_value, (int, float)):
+            raise ValueError("Invalid sort value")
+        return sort_value, uuid.UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _after(sort_column, id_column, sort_value, row_id, descending: bool, nullable: bool):
+    """Filter for rows after (sort_value, row_id) in the list order"""
+    if sort_value is None:
+        # Only nullable columns produce NULL cursors; NULLs sort last
+        return and_(sort_column.is_(None), id_column < row_id if descending else id_column > row_id)
+
+    # Row value comparison, matched by the composite (user_id, sort, id) indexes
+    if descending:
+        condition = tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+    else:
+        condition = tuple_(sort_column, id_column) > tuple_(sort_value, row_id)
+
+    if nullable:
+        condition = or_(condition, sort_column.is_(None))
+    return condition
+
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    descending: bool = False,
+    nullable: bool = False,
+    response: Optional[Response] = None,
+) -> List:
+    """
+    Fetch one page of a query in (sort_column, id_column) order
+
+    Args:
+        query: Filtered query of the listed model
+        sort_column: Primary sort column (datetime or number, e.g. a rank)
+        id_column: Unique tiebreaker column
+        limit: Page size
+        cursor: Cursor of the previous page (None for the first page)
+        skip: Legacy offset, only applied without a cursor
+        descending: Newest first
+        nullable: The sort column may be NULL (NULLs come last)
+        response: Response to set the X-Next-Cursor header on
+
+    Returns:
+        Rows of the page
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(_after(sort_column, id_column, sort_value, row_id, descending, nullable))
+
+    sort_order = sort_column.desc() if descending else sort_column.asc()
+    if nullable:
+        sort_order = sort_order.nulls_last()
+    query = query.order_by(sort_order, id_column.desc() if descending else id_column.asc())
+
+    if skip and not cursor:
+        query = query.offset(skip)
+
+    # One extra row tells whether there is a next page
+    rows = query.limit(limit + 1).all()
+    page = rows[:limit]
+
+    if response is not None and len(rows) > limit:
+        last = page[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            getattr(last, sort_column.key),
+            getattr(last, id_column.key)
+        )
+
+    return page
@@ -8,6 +8,9 @@ from .tasks import router as tasks_router
 from .documents import router as documents_router
 from .calendar import router as calendar_router
 from .notifications import router as notifications_router
+from .search import router as search_router
+from .dashboard import router as dashboard_router
+from .sync import router as sync_router
 
 api_router = APIRouter()
 
@@ -17,3 +20,6 @@ api_router.include_router(tasks_router)
 api_router.include_router(documents_router, prefix="/documents", tags=["documents"])
 api_router.include_router(calendar_router)
 api_router.include_router(notifications_router)
+api_router.include_router(search_router)
+api_router.include_router(dashboard_router)
+api_router.include_router(sync_router)
@@ -2,11 +2,12 @@
 Calendar and Integration management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, timedelta
+import logging
 import uuid
 
 from google_auth_oauthlib.flow import Flow
@@ -27,29 +28,46 @@ from ...models import User, CalendarEvent, Integration
 from ...models.calendar_event import CalendarSyncStatus
 from ...models.integration import IntegrationType, SyncDirection
 from ..dependencies import get_current_user
+from ..pagination import NEXT_CURSOR_HEADER, paginate
+from ..etag import compute_etag, not_modified, row_version, rows_etag
 from ...services.caldav_service import CalDAVService
 from ...services.google_calendar_service import GoogleCalendarService
-from ...services.calendar_sync_service import CalendarSyncService
+from ...services.calendar_sync_service import CalendarSyncService, local_content_hash
+from ...services.integration_sync_scheduler import IntegrationSyncScheduler
+from ...services.calendar_io import run_blocking
 from ...services.task_event_mapping_service import TaskEventMappingService
+from ...services.google_watch_service import GoogleWatchService
+from ...tasks.integration_sync import sync_integration_now
 from ...core.config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/calendar", tags=["Calendar"])
 
+# Sync runs change status columns without touching updated_at, so ETags cover them too
+EVENT_VERSION_FIELDS = ("updated_at", "sync_status", "last_synced_at")
+
 
 # ===== Calendar Events Endpoints =====
 
 @router.get("/events/", response_model=List[CalendarEventResponse])
 def get_calendar_events(
+    request: Request,
+    response: Response,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     sync_status: Optional[str] = None,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Get all calendar events for current user
+    Get all calendar events for current user, by start time
+
+    Pass the X-Next-Cursor header of a page as cursor to get the next one.
+    Answers If-None-Match with 304 while the page is unchanged.
 
     Filters:
     - start_date: Only events starting after this date
@@ -66,11 +84,13 @@ def get_calendar_events(
     if sync_status:
         query = query.filter(CalendarEvent.sync_status == sync_status)
 
-    # Order by start time
-    query = query.order_by(CalendarEvent.start_time)
+    events = paginate(
+        query, CalendarEvent.start_time, CalendarEvent.id, limit,
+        cursor=cursor, skip=skip, response=response
+    )
 
-    events = query.offset(skip).limit(limit).all()
-    return events
+    etag = rows_etag(events, response.headers.get(NEXT_CURSOR_HEADER), fields=EVENT_VERSION_FIELDS)
+    return not_modified(request, response, etag) or events
 
 
 @router.post("/events/", response_model=CalendarEventResponse, status_code=status.HTTP_201_CREATED)
@@ -125,6 +145,7 @@ def create_calendar_event(
         location=event_data.location,
         external_calendar_id=str(event_data.external_calendar_id) if event_data.external_calendar_id else None,
     )
+    new_event.content_hash = local_content_hash(new_event)
 
     db.add(new_event)
     db.commit()
@@ -138,6 +159,8 @@ def create_calendar_event(
 @router.get("/events/{event_id}", response_model=CalendarEventResponse)
 def get_calendar_event(
     event_id: uuid.UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -155,7 +178,8 @@ def get_calendar_event(
             detail="Calendar event not found"
         )
 
-    return event
+    etag = compute_etag(*row_version(event, EVENT_VERSION_FIELDS))
+    return not_modified(request, response, etag) or event
 
 
 @router.patch("/events/{event_id}", response_model=CalendarEventResponse)
@@ -197,9 +221,12 @@ def update_calendar_event(
         else:
             setattr(event, field, value)
 
-    # Mark as pending sync if it was previously synced
-    if event.sync_status == CalendarSyncStatus.SYNCED:
-        event.sync_status = CalendarSyncStatus.PENDING
+    # Mark as pending sync only if the content really differs from the remote copy
+    content_hash = local_content_hash(event)
+    if content_hash != event.content_hash:
+        event.content_hash = content_hash
+        if event.sync_status == CalendarSyncStatus.SYNCED and content_hash != event.remote_hash:
+            event.sync_status = CalendarSyncStatus.PENDING
 
     db.commit()
     db.refresh(event)
@@ -336,6 +363,9 @@ def update_integration(
 ):
     """
     Update an integration
+
+    Changing config or credentials starts the sync of the integration over
+    (full pull, new watch channel).
     """
     integration = db.query(Integration).filter(
         Integration.id == str(integration_id),
@@ -350,6 +380,14 @@ def update_integration(
 
     # Update fields
     update_data = integration_data.model_dump(exclude_unset=True)
+
+    # Another calendar or account: tokens, ETags and the watch channel belong to the old one
+    if any(
+        field in update_data and update_data[field] != getattr(integration, field)
+        for field in ('config', 'credentials')
+    ):
+        CalendarSyncService(db).reset_sync_state(integration)
+
     for field, value in update_data.items():
         if field == 'sync_direction' and value:
             setattr(integration, field, SyncDirection(value))
@@ -431,7 +469,7 @@ async def test_integration(
             success = await caldav_service.test_connection()
 
             if success:
-                calendars = caldav_service.list_calendars()
+                calendars = await caldav_service.list_calendars()
                 return {
                     "success": True,
                     "message": "Connection successful",
@@ -450,13 +488,13 @@ async def test_integration(
                     detail="Missing Google OAuth credentials"
                 )
 
-            google_service = GoogleCalendarService(integration.credentials)
+            google_service = GoogleCalendarService(integration.credentials, cache_key=str(integration.id))
             result = await google_service.test_connection()
 
-            # Update credentials in case token was refreshed
-            updated_creds = google_service.get_updated_credentials()
-            integration.credentials = updated_creds
-            db.commit()
+            # Save credentials only if the token was refreshed
+            if google_service.credentials_changed:
+                integration.credentials = google_service.get_updated_credentials()
+                db.commit()
 
             return result
 
@@ -552,9 +590,20 @@ async def sync_integration(
             detail="Integration is disabled. Use force=true to sync anyway."
         )
 
+    # Share the lease with the background scheduler so a sync never runs twice
+    scheduler = IntegrationSyncScheduler(db)
+    if not scheduler.acquire_lease(integration):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A sync of this integration is already running"
+        )
+
     # Perform sync using CalendarSyncService
     sync_service = CalendarSyncService(db)
-    result = await sync_service.sync_integration(integration, current_user)
+    try:
+        result = await sync_service.sync_integration(integration, current_user)
+    finally:
+        scheduler.release_lease(integration)
 
     return SyncResponse(
         success=result.errors == 0,
@@ -565,6 +614,39 @@ async def sync_integration(
     )
 
 
+@router.post("/webhooks/google", status_code=status.HTTP_200_OK)
+def google_calendar_webhook(
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    Receiver for Google Calendar push notifications (events.watch)
+
+    Google only tells us that something changed; the notification is mapped
+    to its integration via channel ID and token and queues an incremental
+    sync. Unknown or stale channels are acknowledged and ignored so Google
+    doesn't keep retrying them.
+    """
+    headers = request.headers
+    state = headers.get("X-Goog-Resource-State")
+
+    integration = GoogleWatchService(db).get_integration_for_notification(
+        channel_id=headers.get("X-Goog-Channel-ID"),
+        token=headers.get("X-Goog-Channel-Token"),
+        resource_id=headers.get("X-Goog-Resource-ID")
+    )
+
+    if not integration:
+        logger.debug(f"Ignoring Google notification for unknown channel {headers.get('X-Goog-Channel-ID')}")
+        return None
+
+    # "sync" only confirms a new channel
+    if state in ("exists", "not_exists") and integration.enabled:
+        sync_integration_now.delay(str(integration.id))
+
+    return None
+
+
 # ===== Task-Event Mapping Endpoints =====
 
 @router.post("/tasks/sync-all", response_model=dict)
@@ -694,8 +776,8 @@ async def google_oauth_callback(
         )
         flow.redirect_uri = settings.GOOGLE_REDIRECT_URI
 
-        # Exchange authorization code for tokens
-        flow.fetch_token(code=code)
+        # Exchange authorization code for tokens (blocking HTTP call)
+        await run_blocking(flow.fetch_token, code=code)
         credentials = flow.credentials
 
         # Get user ID from state
@@ -710,6 +792,7 @@ async def google_oauth_callback(
             'refresh_token': credentials.refresh_token,
             'token_uri': credentials.token_uri,
             'scopes': credentials.scopes,
+            'expiry': credentials.expiry.isoformat() if credentials.expiry else None,
         }
 
         # Initialize Google Calendar service to get calendar list
@@ -0,0 +1,26 @@
+"""
+Dashboard endpoints
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from ...db.session import get_db
+from ...models.user import User
+from ...schemas.dashboard import DashboardSummaryResponse
+from ...services.dashboard_summary_service import DashboardSummaryService
+from ..dependencies import get_current_active_user
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("/summary", response_model=DashboardSummaryResponse)
+def get_dashboard_summary(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Overview counters of the current user: open tasks by priority, overdue
+    and due-soon tasks, open amounts and documents needing attention.
+    """
+    return DashboardSummaryService(db).get_summary(current_user.id)
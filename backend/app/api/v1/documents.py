@@ -2,24 +2,98 @@
 Document endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Response, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
+import logging
 
 from ...api.dependencies import get_current_active_user
+from ...api.pagination import NEXT_CURSOR_HEADER, paginate
+from ...api.etag import compute_etag, not_modified, rows_etag
 from ...db.session import get_db
 from ...models.user import User
 from ...models.document import Document as DocumentModel
 from ...models.file import File as FileModel
-from ...schemas.document import DocumentResponse, DocumentWithFileResponse, DocumentUpdate
+from ...schemas.document import DocumentResponse, DocumentWithFileResponse, DocumentListItem, DocumentUpdate
 from ...services.file_storage import FileStorageService
+from ...services.document_metadata_service import apply_promoted_fields
+from ...services.dashboard_summary_service import DashboardSummaryService
 from ...core.config import settings
+from ...core.security import file_url_expiry
+from ...services.rendition_service import RenditionService
 from ...tasks.document_processing import process_document
+from ...tasks.renditions import generate_renditions
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 file_storage = FileStorageService()
 
+# Columns of the document list view; File is joined in the same query
+DOCUMENT_LIST_COLUMNS = [
+    DocumentModel.id,
+    DocumentModel.user_id,
+    DocumentModel.file_id,
+    DocumentModel.type,
+    DocumentModel.title,
+    DocumentModel.processing_status,
+    DocumentModel.confidence_score,
+    DocumentModel.uploaded_at,
+    DocumentModel.processed_at,
+    DocumentModel.amount,
+    DocumentModel.currency,
+    DocumentModel.due_date,
+    DocumentModel.sender_name,
+    DocumentModel.needs_review,
+    DocumentModel.updated_at,
+    FileModel.original_filename,
+    FileModel.size_bytes,
+    FileModel.mime_type,
+    FileModel.path,
+    FileModel.thumbnail_path,
+    FileModel.created_at.label("file_created_at"),
+]
+
+# Heavy columns the list only returns on request (?fields=doc_metadata,extracted_text)
+OPTIONAL_DOCUMENT_LIST_COLUMNS = {
+    "doc_metadata": DocumentModel.doc_metadata,
+    "extracted_text": DocumentModel.extracted_text,
+}
+
+
+def document_list_item(row, fields=()) -> DocumentListItem:
+    """Build a list item from a row of DOCUMENT_LIST_COLUMNS (plus requested optional columns)"""
+    item = DocumentListItem(
+        id=row.id,
+        user_id=row.user_id,
+        file_id=row.file_id,
+        type=row.type,
+        title=row.title,
+        processing_status=row.processing_status,
+        confidence_score=row.confidence_score,
+        uploaded_at=row.uploaded_at,
+        processed_at=row.processed_at,
+        amount=row.amount,
+        currency=row.currency,
+        due_date=row.due_date,
+        sender_name=row.sender_name,
+        needs_review=row.needs_review,
+        file={
+            "id": row.file_id,
+            "original_filename": row.original_filename,
+            "size_bytes": row.size_bytes,
+            "mime_type": row.mime_type,
+            "path": row.path,
+            "thumbnail_path": row.thumbnail_path,
+            "created_at": row.file_created_at,
+        },
+    )
+    for field in fields:
+        setattr(item, field, getattr(row, field))
+    return item
+
 
 @router.post("/", response_model=DocumentWithFileResponse, status_code=status.HTTP_201_CREATED)
 async def upload_document(
@@ -82,47 +156,101 @@ async def upload_document(
         processing_status="pending",
     )
     db.add(db_document)
+    DashboardSummaryService(db).refresh_user(current_user.id, commit=False)
     db.commit()
     db.refresh(db_document)
 
     # Trigger background processing (OCR + AI analysis)
     process_document.delay(str(db_document.id))
+    generate_renditions.delay(str(db_file.id))
 
     return db_document
 
 
-@router.get("/", response_model=List[DocumentWithFileResponse])
+@router.get("/", response_model=List[DocumentListItem], response_model_exclude_unset=True)
 def list_documents(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
     type: Optional[str] = None,
     processing_status: Optional[str] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+    sender: Optional[str] = None,
+    needs_review: Optional[bool] = None,
+    fields: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """
-    List user's documents
+    List user's documents, newest first
+
+    Answers If-None-Match with 304 while the page is unchanged.
 
     Args:
-        skip: Number of documents to skip
+        cursor: X-Next-Cursor header of the previous page
+        skip: Number of documents to skip (legacy, prefer cursor)
         limit: Maximum number of documents to return
         type: Filter by document type
         processing_status: Filter by processing status
+        min_amount: Only documents with at least this amount
+        max_amount: Only documents with at most this amount
+        due_from: Only documents due at or after this date
+        due_to: Only documents due before this date
+        sender: Filter by exact sender name
+        needs_review: Filter by the manual review flag
+        fields: Comma-separated heavy fields to include (doc_metadata, extracted_text)
     """
-    query = db.query(DocumentModel).filter(DocumentModel.user_id == current_user.id)
+    extra = [name.strip() for name in fields.split(",") if name.strip()] if fields else []
+    unknown = set(extra) - OPTIONAL_DOCUMENT_LIST_COLUMNS.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+
+    query = db.query(
+        *DOCUMENT_LIST_COLUMNS, *(OPTIONAL_DOCUMENT_LIST_COLUMNS[name] for name in extra)
+    ).join(
+        FileModel, FileModel.id == DocumentModel.file_id
+    ).filter(DocumentModel.user_id == current_user.id)
 
     if type:
         query = query.filter(DocumentModel.type == type)
     if processing_status:
         query = query.filter(DocumentModel.processing_status == processing_status)
+    if min_amount is not None:
+        query = query.filter(DocumentModel.amount >= min_amount)
+    if max_amount is not None:
+        query = query.filter(DocumentModel.amount <= max_amount)
+    if due_from:
+        query = query.filter(DocumentModel.due_date >= due_from)
+    if due_to:
+        query = query.filter(DocumentModel.due_date < due_to)
+    if sender:
+        query = query.filter(DocumentModel.sender_name == sender)
+    if needs_review is not None:
+        query = query.filter(DocumentModel.needs_review.is_(needs_review))
+
+    rows = paginate(
+        query, DocumentModel.uploaded_at, DocumentModel.id, limit,
+        cursor=cursor, skip=skip, descending=True, response=response
+    )
 
-    documents = query.order_by(DocumentModel.uploaded_at.desc()).offset(skip).limit(limit).all()
-    return documents
+    # The signed file URLs in the body change with their expiry
+    etag = rows_etag(rows, response.headers.get(NEXT_CURSOR_HEADER), extra, file_url_expiry())
+    return not_modified(request, response, etag) or [document_list_item(row, extra) for row in rows]
 
 
 @router.get("/{document_id}", response_model=DocumentWithFileResponse)
 def get_document(
     document_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -135,7 +263,8 @@ def get_document(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    return document
+    etag = compute_etag(str(document.id), str(document.updated_at), file_url_expiry())
+    return not_modified(request, response, etag) or document
 
 
 @router.patch("/{document_id}", response_model=DocumentResponse)
@@ -161,6 +290,8 @@ def update_document(
         document.type = document_update.type
     if document_update.doc_metadata is not None:
         document.doc_metadata = document_update.doc_metadata
+        apply_promoted_fields(document)
+        DashboardSummaryService(db).refresh_user(current_user.id, commit=False)
 
     db.commit()
     db.refresh(document)
@@ -187,10 +318,21 @@ async def delete_document(
         await file_storage.delete_file(document.file.path)
     except Exception as e:
         # Log error but continue with deletion
-        print(f"Error deleting file: {e}")
+        logger.warning(f"Error deleting file {document.file.path}: {e}")
+
+    # Renditions are shared by files with the same content
+    checksum = document.file.checksum
+    if checksum and not db.query(FileModel.id).filter(
+        FileModel.checksum == checksum, FileModel.id != document.file_id
+    ).first():
+        try:
+            RenditionService().delete(checksum)
+        except Exception as e:
+            logger.warning(f"Error deleting renditions of {checksum}: {e}")
 
     # Delete from database (cascade will delete file record)
     db.delete(document)
+    DashboardSummaryService(db).refresh_user(current_user.id, commit=False)
     db.commit()
 
     return None
@@ -2,22 +2,72 @@
 File serving endpoints
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
 from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+import time
+
 from ...core.config import settings
+from ...core.security import verify_file_signature
+from ...db.session import get_db
+from ...models.file import File as FileModel
+from ...services.rendition_service import (
+    RENDITION_MIME_TYPE, RENDITION_SIZES, RenditionService, mark_renditions_ready
+)
+from ..etag import not_modified
 
 router = APIRouter()
 
+# Stored paths are content-addressed (checksum file names), so the bytes
+# behind a signed URL never change; it may be cached until it expires
+IMMUTABLE_CACHE_CONTROL = "private, max-age={max_age}, immutable"
+
+# Unsigned requests are only cached with revalidation (ETag)
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
 
 @router.get("/{file_path:path}")
-async def serve_file(file_path: str):
+def serve_file(
+    file_path: str,
+    request: Request,
+    response: Response,
+    size: Optional[str] = Query(None, description=f"Rendition instead of the original: {', '.join(RENDITION_SIZES)}"),
+    expires: Optional[int] = None,
+    sig: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
     """
     Serve uploaded files
 
-    Note: Authentication removed for now to allow Image.network() to work.
-    TODO: Implement proper authenticated image loading with headers
+    With size, a downscaled JPEG rendition is served instead of the
+    original (first page for PDFs). Renditions are normally generated after
+    upload; missing ones are generated here once and cached.
+
+    Signed URLs (expires + sig, see create_file_url) replace authentication,
+    so Image.network() works without headers. Unsigned requests are
+    rejected unless FILE_URLS_REQUIRE_SIGNATURE is disabled.
+
+    Responses carry a strong ETag from the file checksum; signed ones are
+    cached as immutable until the URL expires. Range and If-Range requests
+    are supported. With
+    FILE_ACCEL_REDIRECT_PREFIX set, only the headers are sent from here and
+    nginx streams the bytes (X-Accel-Redirect); nginx then also owns the
+    validators (ETag, Last-Modified), since it evaluates If-Range against
+    its own ETag and not ours.
     """
+    if sig is not None or settings.FILE_URLS_REQUIRE_SIGNATURE:
+        if expires is None or sig is None or not verify_file_signature(file_path, size, expires, sig):
+            raise HTTPException(status_code=403, detail="Invalid or expired file URL")
+
+    if size is not None and size not in RENDITION_SIZES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown size {size}. Allowed: {', '.join(RENDITION_SIZES)}"
+        )
+
     # Build full path
     full_path = Path(settings.UPLOAD_DIR) / file_path
 
@@ -39,8 +89,73 @@ async def serve_file(file_path: str):
     if not full_path.is_file():
         raise HTTPException(status_code=403, detail="Not a file")
 
-    # Return file
+    file = db.query(FileModel).filter(FileModel.path == file_path).first()
+    if not file:
+        raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
+
+    if sig is not None:
+        max_age = max(0, expires - int(time.time()))
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL.format(max_age=max_age)
+    else:
+        response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+    if file.checksum and not settings.FILE_ACCEL_REDIRECT_PREFIX:
+        etag = f'"{file.checksum}-{size}"' if size else f'"{file.checksum}"'
+        cached = not_modified(request, response, etag)
+        if cached is not None:
+            return cached
+        _resolve_if_range(request, etag)
+
+    if size is not None:
+        rendition_path = RenditionService().ensure(file, size)
+        if rendition_path is None:
+            raise HTTPException(status_code=415, detail=f"No renditions for {file.mime_type}")
+
+        # Uploaded before renditions existed; ensure() just generated them
+        if mark_renditions_ready(db, file):
+            db.commit()
+
+        return _send_file(
+            rendition_path, RENDITION_MIME_TYPE, f"{full_path.stem}-{size}.jpg", dict(response.headers)
+        )
+
+    return _send_file(full_path, file.mime_type, full_path.name, dict(response.headers))
+
+
+def _resolve_if_range(request: Request, etag: str) -> None:
+    """
+    Evaluate an entity-tag If-Range against our ETag
+
+    FileResponse compares If-Range with its own mtime/size ETag, so a
+    client resuming with the ETag we sent would always get the full body.
+    On a match the If-Range header is dropped and the range is served; on a
+    mismatch the Range header is dropped as well. Date validators are left
+    to FileResponse (it sends Last-Modified).
+    """
+    if_range = request.headers.get("if-range")
+    if if_range is None or not if_range.endswith('"'):
+        return
+
+    # If-Range requires a strong comparison, so weak tags never match
+    dropped = {b"if-range"} if if_range == etag else {b"if-range", b"range"}
+    request.scope["headers"] = [
+        (name, value) for name, value in request.scope["headers"] if name.lower() not in dropped
+    ]
+
+
+def _send_file(path: Path, media_type: str, filename: str, headers: dict) -> Response:
+    """Send a file from disk, or hand it to nginx when X-Accel-Redirect is configured"""
+    if settings.FILE_ACCEL_REDIRECT_PREFIX:
+        # nginx handles conditional and Range requests and sendfile with its
+        # own ETag; Content-Type, Content-Disposition and Cache-Control of
+        # this response are kept
+        accel_path = path.resolve().relative_to(Path(settings.FILE_ACCEL_ROOT).resolve())
+        headers["X-Accel-Redirect"] = settings.FILE_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(str(accel_path))
+        headers["Content-Disposition"] = f"attachment; filename*=utf-8''{quote(filename)}"
+        return Response(media_type=media_type, headers=headers)
+
     return FileResponse(
-        path=str(full_path),
-        filename=full_path.name,
+        path=str(path),
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
     )
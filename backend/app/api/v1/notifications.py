@@ -3,18 +3,22 @@ Push notification endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
+from typing import Optional
 
 from ...db.session import get_db
 from ...models.user import User
+from ...services.device_token_service import DeviceTokenService
 from ..dependencies import get_current_active_user
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
+device_token_service = DeviceTokenService()
 
 
 class FCMTokenRequest(BaseModel):
     token: str
+    platform: Optional[str] = Field(None, pattern="^(android|ios|web)$")
 
 
 @router.post("/fcm-token")
@@ -23,21 +27,20 @@ def register_fcm_token(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
-    """Register or update the FCM device token for the current user."""
+    """Register or refresh an FCM device token for the current user."""
     if not payload.token:
         raise HTTPException(status_code=400, detail="Token darf nicht leer sein")
 
-    current_user.fcm_token = payload.token
-    db.commit()
+    device_token_service.register_token(current_user, payload.token, db, platform=payload.platform)
     return {"status": "ok"}
 
 
 @router.delete("/fcm-token")
 def delete_fcm_token(
+    token: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
-    """Remove FCM token (e.g. on logout)."""
-    current_user.fcm_token = None
-    db.commit()
-    return {"status": "ok"}
+    """Remove an FCM token (e.g. on logout). Without a token all devices are removed."""
+    removed = device_token_service.unregister_token(current_user, db, token=token)
+    return {"status": "ok", "removed": removed}
@@ -0,0 +1,66 @@
+"""
+Search endpoints
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ...db.session import get_db
+from ...models.user import User
+from ...schemas.search import SearchResult
+from ...services.search_service import SEARCH_KINDS, SearchService
+from ..dependencies import get_current_active_user
+from ..pagination import paginate
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("/", response_model=List[SearchResult])
+def search(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200),
+    kinds: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Search documents (title, sender, invoice number, text) and tasks
+
+    Results are ordered by relevance; pass the X-Next-Cursor header of a
+    page as cursor to get the next one.
+
+    Args:
+        q: Search text; supports "quoted phrases", -exclusions and or
+        kinds: Comma-separated result kinds (document, task; default: both)
+    """
+    selected = [kind.strip() for kind in kinds.split(",") if kind.strip()] if kinds else list(SEARCH_KINDS)
+    unknown = set(selected) - set(SEARCH_KINDS)
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown kinds: {', '.join(sorted(unknown))}"
+        )
+
+    search_service = SearchService(db)
+    results = search_service.match(current_user.id, q, selected)
+
+    rows = paginate(
+        db.query(results), results.c.rank, results.c.id, limit,
+        cursor=cursor, descending=True, response=response
+    )
+    snippets = search_service.snippets(rows, q)
+
+    return [
+        SearchResult(
+            kind=row.kind,
+            id=row.id,
+            title=row.title,
+            snippet=snippets.get(row.id),
+            rank=row.rank,
+            date=row.date,
+        )
+        for row in rows
+    ]
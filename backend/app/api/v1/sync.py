@@ -0,0 +1,165 @@
+"""
+Delta sync endpoints for the mobile client
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+import base64
+import json
+import uuid
+
+from ...db.session import get_db
+from ...models import User, Task, CalendarEvent, DeletedRecord
+from ...models.document import Document as DocumentModel
+from ...models.file import File as FileModel
+from ...schemas.sync import SyncChangesResponse
+from ...core.config import settings
+from ..dependencies import get_current_user
+from .documents import DOCUMENT_LIST_COLUMNS, document_list_item
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+def _encode_cursor(positions: Dict, continuing: bool, synced_at: datetime) -> str:
+    payload = {
+        "p": {
+            kind: [watermark.isoformat(), str(row_id)]
+            for kind, (watermark, row_id) in positions.items()
+        },
+        "c": continuing,
+        "s": synced_at.isoformat(),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Dict, bool, Optional[datetime]]:
+    """
+    Decode a sync cursor into per-kind (watermark, id) positions, the
+    continuation flag and the time of the sync that issued it
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        positions = {}
+        for kind, (watermark, row_id) in payload["p"].items():
+            positions[kind] = (
+                datetime.fromisoformat(watermark),
+                int(row_id) if kind == "deleted" else uuid.UUID(row_id),
+            )
+        synced_at = datetime.fromisoformat(payload["s"]) if payload.get("s") else None
+        return positions, bool(payload.get("c")), synced_at
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync cursor"
+        )
+
+
+@router.get("/changes", response_model=SyncChangesResponse)
+def get_changes(
+    since: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Tasks, documents and events created or updated since a cursor, plus
+    tombstones of deleted ones
+
+    Without since everything is returned (initial sync). While has_more is
+    true, call again with next_cursor; afterwards keep the last next_cursor
+    for the next sync. Each kind is read through its (user_id, updated_at, id)
+    index, so the work follows the number of changes.
+
+    A new sync re-sends the last few minutes of changes
+    (SYNC_CHANGES_OVERLAP_SECONDS), covering transactions that committed
+    after the previous sync read past them; clients apply rows as upserts.
+
+    Raises 410 if the sync that issued the cursor is older than the
+    tombstone retention; the client must then discard its copy and sync
+    from scratch.
+    """
+    limit = limit or settings.SYNC_CHANGES_PAGE_SIZE
+    now = datetime.utcnow()
+    positions, continuing, synced_at = _decode_cursor(since) if since else ({}, False, None)
+    overlap = timedelta(seconds=settings.SYNC_CHANGES_OVERLAP_SECONDS)
+
+    # Cursors issued before synced_at was added only carry the tombstone position
+    if synced_at is None and "deleted" in positions:
+        synced_at = positions["deleted"][0]
+    if synced_at and synced_at < now - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync cursor expired, full resync required"
+        )
+
+    has_more = False
+
+    def fetch(kind, query, watermark, id_column):
+        nonlocal has_more
+        position = positions.get(kind)
+        if position:
+            if continuing:
+                # Next page of the same sync: continue exactly after the last row
+                query = query.filter(tuple_(watermark, id_column) > tuple_(*position))
+            else:
+                query = query.filter(watermark > position[0] - overlap)
+
+        rows = query.order_by(watermark, id_column).limit(limit + 1).all()
+        if len(rows) > limit:
+            has_more = True
+            rows = rows[:limit]
+        if rows:
+            positions[kind] = (getattr(rows[-1], watermark.key), rows[-1].id)
+        return rows
+
+    tasks = fetch(
+        "task",
+        db.query(Task).filter(Task.user_id == current_user.id),
+        Task.updated_at, Task.id
+    )
+    documents = fetch(
+        "document",
+        db.query(*DOCUMENT_LIST_COLUMNS).join(
+            FileModel, FileModel.id == DocumentModel.file_id
+        ).filter(DocumentModel.user_id == current_user.id),
+        DocumentModel.updated_at, DocumentModel.id
+    )
+    events = fetch(
+        "event",
+        db.query(CalendarEvent).filter(CalendarEvent.user_id == current_user.id),
+        CalendarEvent.updated_at, CalendarEvent.id
+    )
+
+    if since:
+        deleted = fetch(
+            "deleted",
+            db.query(DeletedRecord).filter(DeletedRecord.user_id == current_user.id),
+            DeletedRecord.deleted_at, DeletedRecord.id
+        )
+        if not deleted:
+            # No tombstones up to now: move on, so the scan (and the expiry
+            # check) doesn't stay at the last deletion
+            positions["deleted"] = max(positions.get("deleted", (now - overlap, 0)), (now - overlap, 0))
+    else:
+        # Initial sync: nothing to delete yet, tombstones count from now on
+        deleted = []
+        positions["deleted"] = (now, 0)
+
+    return {
+        "tasks": tasks,
+        "documents": [document_list_item(row) for row in documents],
+        "events": events,
+        "deleted": [
+            {"kind": record.entity_type, "id": record.entity_id, "deleted_at": record.deleted_at}
+            for record in deleted
+        ],
+        "next_cursor": _encode_cursor(positions, has_more, now),
+        "has_more": has_more,
+    }
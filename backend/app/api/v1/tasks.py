@@ -2,9 +2,9 @@
 Task management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 import uuid
 
@@ -12,13 +12,18 @@ from ...db.session import get_db
 from ...schemas import TaskCreate, TaskUpdate, TaskResponse
 from ...models import User, Task
 from ..dependencies import get_current_user
-from ...services.task_event_mapping_service import TaskEventMappingService
+from ..pagination import NEXT_CURSOR_HEADER, paginate
+from ..etag import compute_etag, not_modified, rows_etag
+from ...services.task_outbox_service import TaskOutboxService
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 
 @router.get("/", response_model=List[TaskResponse])
 def get_tasks(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     status_filter: str = None,
@@ -26,7 +31,10 @@ def get_tasks(
     db: Session = Depends(get_db)
 ):
     """
-    Get all tasks for current user
+    Get all tasks for current user, by due date (tasks without one last)
+
+    Pass the X-Next-Cursor header of a page as cursor to get the next one.
+    Answers If-None-Match with 304 while the page is unchanged.
     """
     query = db.query(Task).filter(Task.user_id == current_user.id)
 
@@ -34,8 +42,13 @@ def get_tasks(
     if status_filter:
         query = query.filter(Task.status == status_filter)
 
-    tasks = query.offset(skip).limit(limit).all()
-    return tasks
+    tasks = paginate(
+        query, Task.due_date, Task.id, limit,
+        cursor=cursor, skip=skip, nullable=True, response=response
+    )
+
+    etag = rows_etag(tasks, response.headers.get(NEXT_CURSOR_HEADER))
+    return not_modified(request, response, etag) or tasks
 
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -47,7 +60,8 @@ def create_task(
     """
     Create a new task
 
-    If task has a due_date, a calendar event will be automatically created.
+    If task has a due_date, a calendar event and reminders are created in
+    the background.
     """
     new_task = Task(
         user_id=current_user.id,
@@ -62,21 +76,22 @@ def create_task(
     )
 
     db.add(new_task)
+    db.flush()
+
+    # Calendar event and reminders follow from the outbox, committed with the task
+    TaskOutboxService(db).record_change(new_task, "created")
+
     db.commit()
     db.refresh(new_task)
 
-    # Automatically create calendar event if task has due_date
-    if new_task.due_date:
-        mapping_service = TaskEventMappingService(db)
-        mapping_service.create_event_from_task(new_task)
-        db.refresh(new_task)
-
     return new_task
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 def get_task(
     task_id: uuid.UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -94,7 +109,8 @@ def get_task(
             detail="Task not found"
         )
 
-    return task
+    etag = compute_etag(str(task.id), str(task.updated_at))
+    return not_modified(request, response, etag) or task
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
@@ -107,7 +123,7 @@ def update_task(
     """
     Update a task
 
-    Calendar event will be automatically updated if task has due_date changes.
+    Calendar event and reminders are updated in the background.
     """
     task = db.query(Task).filter(
         Task.id == task_id,
@@ -131,12 +147,11 @@ def update_task(
     elif task_data.status and task_data.status != "done":
         task.completed_at = None
 
-    db.commit()
-    db.refresh(task)
+    # Calendar event and reminders follow from the outbox, committed with the update
+    if update_data:
+        TaskOutboxService(db).record_change(task, "updated", update_data.keys())
 
-    # Automatically update/create/delete calendar event based on due_date
-    mapping_service = TaskEventMappingService(db)
-    mapping_service.update_event_from_task(task)
+    db.commit()
     db.refresh(task)
 
     return task
@@ -162,6 +177,8 @@ def delete_task(
             detail="Task not found"
         )
 
+    # Recorded first: the outbox row outlives the task and updates the dashboard
+    TaskOutboxService(db).record_change(task, "deleted")
     db.delete(task)
     db.commit()
 
@@ -27,10 +27,31 @@ celery_app.conf.update(
 # Auto-discover tasks in the tasks module
 celery_app.autodiscover_tasks(['app.tasks'])
 
-# Beat schedule: check for due reminders every minute
+# Beat schedule: check for due reminders and due calendar syncs every minute,
+# keep Google push notification channels open, apply task changes from the outbox
 celery_app.conf.beat_schedule = {
     "dispatch-reminders": {
         "task": "app.tasks.dispatch_reminders",
         "schedule": 60.0,  # every 60 seconds
     },
+    "sync-due-integrations": {
+        "task": "app.tasks.sync_due_integrations",
+        "schedule": 60.0,  # every 60 seconds
+    },
+    "renew-google-watch-channels": {
+        "task": "app.tasks.renew_google_watch_channels",
+        "schedule": 900.0,  # every 15 minutes
+    },
+    "process-task-changes": {
+        "task": "app.tasks.process_task_changes",
+        "schedule": 5.0,  # every 5 seconds
+    },
+    "purge-task-changes": {
+        "task": "app.tasks.purge_task_changes",
+        "schedule": 3600.0,  # every hour
+    },
+    "purge-deleted-records": {
+        "task": "app.tasks.purge_deleted_records",
+        "schedule": 86400.0,  # daily
+    },
 }
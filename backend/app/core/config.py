@@ -50,6 +50,12 @@ class Settings(BaseSettings):
     # File Storage
     UPLOAD_DIR: str = "./data/uploads"
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
+    RENDITION_DIR: str = "./data/renditions"  # Thumbnails and previews, keyed by file checksum
+    RENDITION_JPEG_QUALITY: int = 80
+    FILE_URL_TTL_SECONDS: int = 3600  # Signed file URLs stay valid between one and two of these
+    FILE_URLS_REQUIRE_SIGNATURE: bool = True  # Reject unsigned /files requests (disable only for clients without signed URLs)
+    FILE_ACCEL_REDIRECT_PREFIX: Optional[str] = None  # Internal nginx location (e.g. /protected-files/); if set, nginx sends file bytes
+    FILE_ACCEL_ROOT: str = "./data"  # Directory the nginx location above maps to
 
     # Celery (for background tasks)
     CELERY_BROKER_URL: str = "redis://workmate_private_redis:6379/0"
@@ -59,10 +65,29 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_ID: Optional[str] = None
     GOOGLE_CLIENT_SECRET: Optional[str] = None
     GOOGLE_REDIRECT_URI: str = "https://api.workmate-private.intern.phudevelopement.xyz/api/v1/calendar/oauth/google/callback"
+    GOOGLE_WEBHOOK_URL: Optional[str] = None  # Public HTTPS URL of /calendar/webhooks/google; push notifications off if unset
+    GOOGLE_WATCH_TTL_HOURS: int = 168  # Requested lifetime of a watch channel (Google caps it)
+    GOOGLE_WATCH_RENEW_BEFORE_HOURS: int = 24  # Renew channels expiring within this window
+    GOOGLE_WATCH_FALLBACK_SYNC_MINUTES: int = 360  # Polling interval while a watch channel is active
 
     # Firebase Push Notifications
     FIREBASE_CREDENTIALS_PATH: Optional[str] = None
 
+    # Reminders
+    REMINDER_DIGEST_WINDOW_MINUTES: int = 15  # Coalesce a user's reminders due within this window
+
+    # Background calendar sync
+    SYNC_SCHEDULER_BATCH_SIZE: int = 50  # Integrations claimed per scheduler run
+    SYNC_LEASE_SECONDS: int = 900  # A sync still running after this is considered dead
+    SYNC_JITTER_SECONDS: int = 120  # Max random offset added to the next sync time
+    CALENDAR_IO_THREADS: int = 16  # Threads for blocking CalDAV / Google API calls
+    CALDAV_DISCOVERY_TTL_SECONDS: int = 3600  # How long discovered CalDAV calendars are reused
+
+    # Mobile delta sync
+    SYNC_CHANGES_OVERLAP_SECONDS: int = 120  # Re-send changes this old, covering transactions committed late
+    SYNC_CHANGES_PAGE_SIZE: int = 500  # Max rows per kind in one /sync/changes response
+    TOMBSTONE_RETENTION_DAYS: int = 90  # Older delta cursors must resync from scratch
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -4,6 +4,11 @@ Security utilities for authentication and authorization
 
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import quote, urlencode
+import base64
+import hashlib
+import hmac
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from .config import settings
@@ -52,3 +57,36 @@ def decode_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+def _file_signature(path: str, size: Optional[str], expires: int) -> str:
+    message = f"{path}\n{size or ''}\n{expires}".encode()
+    digest = hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def file_url_expiry() -> int:
+    """
+    Expiry of file URLs signed now
+
+    Rounded up to a multiple of FILE_URL_TTL_SECONDS, so the URL of a file
+    stays the same for a whole period and clients can cache by URL. URLs
+    are valid for between one and two periods.
+    """
+    ttl = settings.FILE_URL_TTL_SECONDS
+    return (int(time.time()) // ttl + 2) * ttl
+
+
+def create_file_url(path: str, size: Optional[str] = None) -> str:
+    """Create a signed, expiring URL for an uploaded file (or one of its renditions)"""
+    expires = file_url_expiry()
+    params = {"size": size} if size else {}
+    params.update({"expires": expires, "sig": _file_signature(path, size, expires)})
+    return f"/files/{quote(path)}?{urlencode(params)}"
+
+
+def verify_file_signature(path: str, size: Optional[str], expires: int, signature: str) -> bool:
+    """Check a signed file URL: signature matches and not expired"""
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(_file_signature(path, size, expires), signature)
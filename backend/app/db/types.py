@@ -0,0 +1,28 @@
+"""
+Column types shared by the models
+
+Production runs on PostgreSQL. The variants below keep the schema creatable
+on SQLite for scripts and benchmarks that don't use the Postgres-only
+features (JSONB operators, full-text search).
+"""
+
+from sqlalchemy import JSON, Text, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+
+# JSONB on Postgres, plain JSON elsewhere
+JSONB_VARIANT = JSON().with_variant(JSONB(), "postgresql")
+
+# tsvector on Postgres, unused text column on SQLite
+TSVECTOR_VARIANT = TSVECTOR().with_variant(Text(), "sqlite")
+
+
+class SearchVectorComputed(Computed):
+    """Generated search vector; SQLite has no to_tsvector, so the column stays empty there"""
+
+    inherit_cache = True
+
+
+@compiles(SearchVectorComputed, "sqlite")
+def _compile_search_vector_sqlite(element, compiler, **kw):
+    return ""
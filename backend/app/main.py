@@ -11,6 +11,7 @@ import platform
 
 from .core.config import settings
 from .api.v1 import api_router
+from .api.pagination import NEXT_CURSOR_HEADER
 from .api.v1.files import router as files_router
 
 START_TIME = time.time()
@@ -29,6 +30,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API router
@@ -10,6 +10,10 @@ from .reminder import Reminder, ReminderSeverity, ReminderStatus
 from .session import Session
 from .calendar_event import CalendarEvent, CalendarSyncStatus
 from .integration import Integration, IntegrationType, SyncDirection
+from .device_token import DeviceToken
+from .task_change import TaskChange
+from .user_summary import UserSummary
+from .deleted_record import DeletedRecord
 
 __all__ = [
     "User",
@@ -27,4 +31,8 @@ __all__ = [
     "Integration",
     "IntegrationType",
     "SyncDirection",
+    "DeviceToken",
+    "TaskChange",
+    "UserSummary",
+    "DeletedRecord",
 ]
@@ -2,7 +2,7 @@
 Calendar Event model
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, JSON, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -24,10 +24,22 @@ class CalendarEvent(Base):
     """Calendar events that sync with external calendars"""
 
     __tablename__ = "calendar_events"
+    __table_args__ = (
+        # One local row per remote event; also the lookup index of the pull loop
+        Index(
+            "ix_calendar_events_integration_external_id",
+            "external_calendar_id", "external_event_id",
+            unique=True
+        ),
+        # Keyset pagination of the event list (start time order)
+        Index("ix_calendar_events_user_start_time_id", "user_id", "start_time", "id"),
+        # Delta sync (changes since a watermark)
+        Index("ix_calendar_events_user_updated_at_id", "user_id", "updated_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True, index=True)
 
     # Event details
     title = Column(String, nullable=False)
@@ -39,12 +51,16 @@ class CalendarEvent(Base):
 
     # External calendar sync
     external_event_id = Column(String, nullable=True)  # ID in external calendar
+    external_href = Column(String, nullable=True)  # CalDAV resource URL
+    external_etag = Column(String, nullable=True)  # Last seen remote ETag
     external_calendar_id = Column(UUID(as_uuid=True), ForeignKey("integrations.id", ondelete="SET NULL"), nullable=True)
 
     # Sync metadata
     sync_status = Column(SQLEnum(CalendarSyncStatus), default=CalendarSyncStatus.PENDING)
     last_synced_at = Column(DateTime, nullable=True)
     conflict_data = Column(JSON, nullable=True)  # Store conflict details
+    content_hash = Column(String(64), nullable=True)  # Hash of the local event content
+    remote_hash = Column(String(64), nullable=True)  # Hash of the content last seen on / pushed to remote
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,36 @@
+"""
+Deleted record (tombstone) model
+"""
+
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from ..db.base import Base
+
+
+class DeletedRecord(Base):
+    """
+    Tombstone of a deleted task, document or calendar event
+
+    Written by AFTER DELETE triggers (see migration d8f5a1b7c346), so
+    cascades and bulk deletes are covered too. Lets clients drop rows
+    they synced earlier (GET /sync/changes).
+    """
+
+    __tablename__ = "deleted_records"
+    __table_args__ = (
+        Index("ix_deleted_records_user_deleted_at_id", "user_id", "deleted_at", "id"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # No foreign key: tombstones are also written while a user is deleted
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+
+    entity_type = Column(String(20), nullable=False)  # task, document, event
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<DeletedRecord {self.entity_type} {self.entity_id}>"
@@ -0,0 +1,37 @@
+"""
+Device token model for push notifications
+"""
+
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import uuid
+
+from ..db.base import Base
+
+
+class DeviceToken(Base):
+    """FCM registration token of a single user device"""
+
+    __tablename__ = "device_tokens"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Device
+    token = Column(String(255), unique=True, nullable=False)
+    platform = Column(String(20))  # android, ios, web
+
+    # Delivery health
+    last_seen = Column(DateTime, nullable=False, default=datetime.utcnow)
+    failure_count = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Relationships
+    user = relationship("User", back_populates="device_tokens")
+
+    def __repr__(self):
+        return f"<DeviceToken {self.platform} for user {self.user_id}>"
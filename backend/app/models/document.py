@@ -2,19 +2,58 @@
 Document model
 """
 
-from sqlalchemy import Column, String, Float, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, String, Float, Text, DateTime, Numeric, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 import uuid
 
 from ..db.base import Base
+from ..db.types import JSONB_VARIANT, TSVECTOR_VARIANT, SearchVectorComputed
+
+# Full-text search vector: title > sender and invoice number > body, German and English stemming.
+# The body is capped so long OCR output stays below the tsvector size limit.
+DOCUMENT_SEARCH_VECTOR = """
+    setweight(to_tsvector('german', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple',
+        coalesce(doc_metadata #>> '{sender,name}', '') || ' ' ||
+        coalesce(doc_metadata ->> 'invoice_number', '')), 'B') ||
+    setweight(to_tsvector('german', left(coalesce(extracted_text, ''), 200000)), 'C') ||
+    setweight(to_tsvector('english', left(coalesce(extracted_text, ''), 200000)), 'C')
+"""
 
 
 class Document(Base):
     """Document model for uploaded files"""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Keyset pagination of the document list (newest first)
+        Index("ix_documents_user_uploaded_at_id", "user_id", text("uploaded_at DESC"), text("id DESC")),
+        # Delta sync (changes since a watermark)
+        Index("ix_documents_user_updated_at_id", "user_id", "updated_at", "id"),
+        # Full-text search and fuzzy invoice number matches (pg_trgm)
+        Index("ix_documents_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_documents_invoice_number_trgm",
+            text("(doc_metadata ->> 'invoice_number') gin_trgm_ops"),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+        # Containment queries on metadata (doc_metadata @> '{...}')
+        Index(
+            "ix_documents_doc_metadata",
+            "doc_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"doc_metadata": "jsonb_path_ops"}
+        ),
+        # Filters on promoted metadata, e.g. invoices due this month over an amount
+        Index("ix_documents_user_type_due_date", "user_id", "type", "due_date"),
+        Index("ix_documents_user_amount", "user_id", "amount"),
+        Index("ix_documents_user_sender_name", "user_id", "sender_name"),
+        Index("ix_documents_needs_review", "user_id", postgresql_where=text("needs_review")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -25,16 +64,27 @@ class Document(Base):
     title = Column(String(255))
 
     # Metadata (flexible JSON storage)
-    doc_metadata = Column(JSON, default={})
+    doc_metadata = Column(MutableDict.as_mutable(JSONB_VARIANT), default={})
+
+    # Metadata promoted to typed columns for filtering and sorting (see document_metadata_service)
+    amount = Column(Numeric(12, 2))
+    currency = Column(String(3))
+    due_date = Column(DateTime)
+    sender_name = Column(String(255))
+    needs_review = Column(Boolean, default=False, nullable=False)
 
     # Processing
     processing_status = Column(String(50), default="pending", index=True)  # pending, processing, done, failed
     confidence_score = Column(Float)
     extracted_text = Column(Text)
 
+    # Search (generated by Postgres, kept up to date on every write)
+    search_vector = deferred(Column(TSVECTOR_VARIANT, SearchVectorComputed(DOCUMENT_SEARCH_VECTOR, persisted=True)))
+
     # Timestamps
     uploaded_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     processed_at = Column(DateTime)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     user = relationship("User", back_populates="documents")
@@ -20,7 +20,7 @@ class File(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # File Info
-    path = Column(String(500), nullable=False)
+    path = Column(String(500), nullable=False, index=True)
     original_filename = Column(String(255), nullable=False)
     size_bytes = Column(BigInteger, nullable=False)
     mime_type = Column(String(100), nullable=False)
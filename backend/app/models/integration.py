@@ -2,7 +2,7 @@
 Integration model for external services
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, JSON, ForeignKey, Enum as SQLEnum, Integer
+from sqlalchemy import Column, String, DateTime, Boolean, JSON, ForeignKey, Enum as SQLEnum, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -30,6 +30,14 @@ class Integration(Base):
     """External service integrations (calendars, etc.)"""
 
     __tablename__ = "integrations"
+    __table_args__ = (
+        # Due-index: the sync scheduler scans auto-sync integrations by next sync time
+        Index(
+            "ix_integrations_next_sync_at",
+            "next_sync_at",
+            postgresql_where=text("auto_sync AND enabled")
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -53,6 +61,23 @@ class Integration(Base):
     last_sync_at = Column(DateTime, nullable=True)
     error_log = Column(String, nullable=True)
 
+    # Background sync scheduling
+    next_sync_at = Column(DateTime, default=datetime.utcnow, nullable=True)
+    sync_lease_until = Column(DateTime, nullable=True)  # Set while a sync is running
+
+    # Google push notification channel (events.watch)
+    watch_channel_id = Column(String, nullable=True, unique=True)
+    watch_resource_id = Column(String, nullable=True)
+    watch_token = Column(String, nullable=True)  # Echoed by Google in X-Goog-Channel-Token
+    watch_expires_at = Column(DateTime, nullable=True)
+    watch_failures = Column(Integer, default=0, nullable=False, server_default="0")  # Failed attempts in a row
+    watch_retry_after = Column(DateTime, nullable=True)  # No new attempt before this
+
+    # Incremental sync state (Google nextSyncToken / CalDAV sync-token and CTag)
+    sync_token = Column(String, nullable=True)
+    sync_ctag = Column(String, nullable=True)
+    sync_skipped_etags = Column(JSON, nullable=True)  # CalDAV href -> ETag of objects without a VEVENT (VTODO, ...)
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -2,7 +2,7 @@
 Reminder model
 """
 
-from sqlalchemy import Column, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Integer, JSON, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -25,12 +25,17 @@ class ReminderStatus(str, Enum):
     PENDING = "pending"
     SENT = "sent"
     FAILED = "failed"
+    DEAD_LETTER = "dead_letter"  # Gave up after max delivery attempts
 
 
 class Reminder(Base):
     """Reminder model"""
 
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Due-index: dispatcher scans pending reminders by trigger time (retries included)
+        Index("ix_reminders_status_trigger_at", "status", "trigger_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -47,6 +52,10 @@ class Reminder(Base):
     sent_at = Column(DateTime)
     error_message = Column(Text)
 
+    # Delivery retries (failed sends are re-queued by moving trigger_at)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_attempt_at = Column(DateTime)
+
     # User Action
     acknowledged_at = Column(DateTime)
     snoozed_until = Column(DateTime)
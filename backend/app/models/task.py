@@ -2,14 +2,23 @@
 Task model
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, Numeric, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Integer, Numeric, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 import uuid
 from enum import Enum
 
 from ..db.base import Base
+from ..db.types import TSVECTOR_VARIANT, SearchVectorComputed
+
+# Full-text search vector: title > description, German and English stemming
+TASK_SEARCH_VECTOR = """
+    setweight(to_tsvector('german', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('german', coalesce(description, '')), 'C') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'C')
+"""
 
 
 class TaskStatus(str, Enum):
@@ -32,6 +41,20 @@ class Task(Base):
     """Task model"""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination of the task list (due date order)
+        Index("ix_tasks_user_due_date_id", "user_id", "due_date", "id"),
+        # Delta sync (changes since a watermark)
+        Index("ix_tasks_user_updated_at_id", "user_id", "updated_at", "id"),
+        # Open tasks of a user (dashboard counters, overdue tasks)
+        Index(
+            "ix_tasks_user_open_due_date",
+            "user_id", "due_date",
+            postgresql_where=text("status IN ('open', 'in_progress')")
+        ),
+        # Full-text search
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -42,6 +65,9 @@ class Task(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text)
 
+    # Search (generated by Postgres)
+    search_vector = deferred(Column(TSVECTOR_VARIANT, SearchVectorComputed(TASK_SEARCH_VECTOR, persisted=True)))
+
     # Scheduling
     due_date = Column(DateTime, index=True)
     estimated_duration_minutes = Column(Integer)
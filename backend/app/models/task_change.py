@@ -0,0 +1,47 @@
+"""
+Task change outbox model
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from ..db.base import Base
+
+
+class TaskChange(Base):
+    """
+    Transactional outbox of task writes
+
+    Rows are inserted in the same transaction as the task change and
+    consumed in the background, where calendar mapping, reminder
+    reconciliation and external pushes happen.
+    """
+
+    __tablename__ = "task_changes"
+    __table_args__ = (
+        # Consumer scans unprocessed changes in insertion order
+        Index(
+            "ix_task_changes_pending", "id",
+            postgresql_where=text("processed_at IS NULL AND dead_lettered_at IS NULL")
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # No foreign key: the change may outlive the task
+    task_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+
+    change_type = Column(String(20), nullable=False)  # created, updated, deleted
+    fields = Column(JSON, nullable=True)  # Names of the changed task fields
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = Column(DateTime, nullable=True)
+
+    # Failed processing attempts; after MAX_ATTEMPTS the change is dead-lettered
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(Text, nullable=True)
+    dead_lettered_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<TaskChange {self.change_type} {self.task_id}>"
@@ -30,9 +30,6 @@ class User(Base):
     notification_preferences = Column(JSON, default={})
     ui_preferences = Column(JSON, default={})
 
-    # Push Notifications
-    fcm_token = Column(String(255), nullable=True)
-
     # Status
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
@@ -51,6 +48,7 @@ class User(Base):
     files = relationship("File", back_populates="user", cascade="all, delete-orphan")
     calendar_events = relationship("CalendarEvent", back_populates="user", cascade="all, delete-orphan")
     integrations = relationship("Integration", back_populates="user", cascade="all, delete-orphan")
+    device_tokens = relationship("DeviceToken", back_populates="user", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<User {self.username}>"
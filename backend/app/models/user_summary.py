@@ -0,0 +1,40 @@
+"""
+User summary model
+"""
+
+from sqlalchemy import Column, Integer, DateTime, JSON, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from ..db.base import Base
+
+
+class UserSummary(Base):
+    """
+    Precomputed dashboard counters of one user
+
+    Refreshed when tasks or documents change (see DashboardSummaryService),
+    so the dashboard reads a single row instead of counting lists.
+    """
+
+    __tablename__ = "user_summaries"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    # Open tasks (open, in progress) by priority
+    open_tasks_low = Column(Integer, nullable=False, default=0)
+    open_tasks_medium = Column(Integer, nullable=False, default=0)
+    open_tasks_high = Column(Integer, nullable=False, default=0)
+    open_tasks_critical = Column(Integer, nullable=False, default=0)
+
+    # Sum of open task amounts per currency, e.g. {"EUR": "89.99"}
+    open_amounts = Column(JSON, nullable=False, default=dict)
+
+    # Documents
+    documents_needing_review = Column(Integer, nullable=False, default=0)
+    documents_processing = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<UserSummary {self.user_id}>"
@@ -2,7 +2,7 @@
 Schemas package
 """
 
-from .user import UserBase, UserCreate, UserUpdate, UserResponse, UserLogin
+from .user import UserBase, UserCreate, UserUpdate, UserResponse, UserLogin, NotificationPreferences
 from .token import Token, TokenPayload
 from .task import TaskBase, TaskCreate, TaskUpdate, TaskResponse
 from .document import (
@@ -11,6 +11,7 @@ from .document import (
     DocumentUpdate,
     DocumentResponse,
     DocumentWithFileResponse,
+    DocumentListItem,
     FileResponse,
 )
 from .calendar import (
@@ -25,6 +26,9 @@ from .calendar import (
     SyncRequest,
     SyncResponse,
 )
+from .search import SearchResult
+from .dashboard import DashboardSummaryResponse
+from .sync import DeletedRecordResponse, SyncChangesResponse
 
 __all__ = [
     "UserBase",
@@ -32,6 +36,7 @@ __all__ = [
     "UserUpdate",
     "UserResponse",
     "UserLogin",
+    "NotificationPreferences",
     "Token",
     "TokenPayload",
     "TaskBase",
@@ -43,6 +48,7 @@ __all__ = [
     "DocumentUpdate",
     "DocumentResponse",
     "DocumentWithFileResponse",
+    "DocumentListItem",
     "FileResponse",
     "CalendarEventBase",
     "CalendarEventCreate",
@@ -54,4 +60,8 @@ __all__ = [
     "IntegrationResponse",
     "SyncRequest",
     "SyncResponse",
+    "SearchResult",
+    "DashboardSummaryResponse",
+    "DeletedRecordResponse",
+    "SyncChangesResponse",
 ]
@@ -0,0 +1,20 @@
+"""
+Dashboard schemas
+"""
+
+from pydantic import BaseModel
+from typing import Dict
+from datetime import datetime
+from decimal import Decimal
+
+
+class DashboardSummaryResponse(BaseModel):
+    """Schema for the dashboard overview"""
+    open_tasks: int
+    open_tasks_by_priority: Dict[str, int]
+    overdue_tasks: int
+    due_soon_tasks: int  # Due within the next 7 days
+    open_amounts: Dict[str, Decimal]  # Sum of open task amounts per currency
+    documents_needing_review: int
+    documents_processing: int
+    updated_at: datetime  # When the stored counters were last refreshed
@@ -2,11 +2,14 @@
 Document schemas
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import Optional, Dict, Any
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
+from ..core.security import create_file_url
+
 
 class DocumentBase(BaseModel):
     """Base document schema"""
@@ -38,6 +41,13 @@ class DocumentResponse(DocumentBase):
     uploaded_at: datetime
     processed_at: Optional[datetime] = None
 
+    # Promoted from doc_metadata
+    amount: Optional[Decimal] = None
+    currency: Optional[str] = None
+    due_date: Optional[datetime] = None
+    sender_name: Optional[str] = None
+    needs_review: bool = False
+
     class Config:
         from_attributes = True
 
@@ -49,11 +59,30 @@ class FileResponse(BaseModel):
     size_bytes: int
     mime_type: str
     path: str
+    thumbnail_path: Optional[str] = None  # Set once renditions exist (GET /files/{path}?size=thumb)
     created_at: datetime
 
     class Config:
         from_attributes = True
 
+    @computed_field
+    @property
+    def url(self) -> str:
+        """Signed URL of the original"""
+        return create_file_url(self.path)
+
+    @computed_field
+    @property
+    def thumbnail_url(self) -> Optional[str]:
+        """Signed URL of the thumbnail, once generated"""
+        return create_file_url(self.path, "thumb") if self.thumbnail_path else None
+
+    @computed_field
+    @property
+    def preview_url(self) -> Optional[str]:
+        """Signed URL of the medium preview, once generated"""
+        return create_file_url(self.path, "preview") if self.thumbnail_path else None
+
 
 class DocumentWithFileResponse(DocumentResponse):
     """Schema for document with file info"""
@@ -61,3 +90,27 @@ class DocumentWithFileResponse(DocumentResponse):
 
     class Config:
         from_attributes = True
+
+
+class DocumentListItem(DocumentBase):
+    """
+    Schema for the document list
+
+    Only the columns the list view needs; doc_metadata and extracted_text
+    are included when requested via the fields parameter.
+    """
+    id: UUID
+    user_id: UUID
+    file_id: UUID
+    processing_status: str
+    confidence_score: Optional[float] = None
+    uploaded_at: datetime
+    processed_at: Optional[datetime] = None
+    amount: Optional[Decimal] = None
+    currency: Optional[str] = None
+    due_date: Optional[datetime] = None
+    sender_name: Optional[str] = None
+    needs_review: bool = False
+    file: FileResponse
+    doc_metadata: Optional[Dict[str, Any]] = None
+    extracted_text: Optional[str] = None
@@ -0,0 +1,18 @@
+"""
+Search schemas
+"""
+
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+
+
+class SearchResult(BaseModel):
+    """Schema for a single search hit"""
+    kind: str  # document, task
+    id: UUID
+    title: Optional[str] = None
+    snippet: Optional[str] = None  # Matches wrapped in <mark></mark>
+    rank: float
+    date: Optional[datetime] = None  # Upload date of documents, due date of tasks
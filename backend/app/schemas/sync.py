@@ -0,0 +1,29 @@
+"""
+Delta sync schemas
+"""
+
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+from uuid import UUID
+
+from .task import TaskResponse
+from .document import DocumentListItem
+from .calendar import CalendarEventResponse
+
+
+class DeletedRecordResponse(BaseModel):
+    """Schema for a tombstone"""
+    kind: str  # task, document, event
+    id: UUID
+    deleted_at: datetime
+
+
+class SyncChangesResponse(BaseModel):
+    """Schema for one page of changes since a sync cursor"""
+    tasks: List[TaskResponse] = []
+    documents: List[DocumentListItem] = []
+    events: List[CalendarEventResponse] = []
+    deleted: List[DeletedRecordResponse] = []
+    next_cursor: str  # Pass as since on the next call
+    has_more: bool  # Call again right away with next_cursor
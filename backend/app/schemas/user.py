@@ -7,6 +7,9 @@ from typing import Optional
 from datetime import datetime
 import uuid
 
+# Local wall-clock time, "HH:MM"
+TIME_OF_DAY_PATTERN = r"^([01]\d|2[0-3]):[0-5]\d$"
+
 
 class UserBase(BaseModel):
     """Base user schema"""
@@ -20,6 +23,24 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=8)
 
 
+class QuietHours(BaseModel):
+    """Window without non-critical reminders, in the user's timezone (may wrap midnight)"""
+    start: str = Field(..., pattern=TIME_OF_DAY_PATTERN, examples=["22:00"])
+    end: str = Field(..., pattern=TIME_OF_DAY_PATTERN, examples=["07:00"])
+
+
+class NotificationPreferences(BaseModel):
+    """
+    Schema for User.notification_preferences
+
+    Example: {"quiet_hours": {"start": "22:00", "end": "07:00"}, "reminder_time": "09:00"}
+    """
+    quiet_hours: Optional[QuietHours] = None
+    reminder_time: Optional[str] = Field(
+        None, pattern=TIME_OF_DAY_PATTERN, description="When reminders for date-only due dates fire"
+    )
+
+
 class UserUpdate(BaseModel):
     """Schema for updating a user"""
     email: Optional[EmailStr] = None
@@ -27,6 +48,7 @@ class UserUpdate(BaseModel):
     full_name: Optional[str] = None
     timezone: Optional[str] = None
     language: Optional[str] = None
+    notification_preferences: Optional[NotificationPreferences] = None
 
 
 class UserResponse(UserBase):
@@ -5,14 +5,45 @@ Handles calendar sync with CalDAV-compatible services (Nextcloud, iCloud, etc.)
 
 import caldav
 from caldav import DAVClient
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from caldav.elements import dav
+from caldav.elements.base import ValuedBaseElement
+from caldav.lib.error import NotFoundError
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Dict, Tuple
 from icalendar import Calendar, Event as iCalEvent
+import time
 import uuid
 import logging
 
+from ..core.config import settings
+from .calendar_io import run_blocking
+
 logger = logging.getLogger(__name__)
 
+# Hrefs fetched per calendar-multiget REPORT
+MULTIGET_BATCH_SIZE = 100
+
+
+class GetCTag(ValuedBaseElement):
+    """CalendarServer collection tag, changes whenever anything in the calendar changes"""
+    tag = "{http://calendarserver.org/ns/}getctag"
+
+
+def _href(resource) -> str:
+    """Canonical URL of a CalDAV resource, used as stable key"""
+    return str(resource.url.canonical())
+
+
+# (server url, username) -> (expires_at, [(url, name, id), ...]) of discovered calendars
+_discovery_cache: Dict[Tuple[str, str], Tuple[float, List[Tuple[str, str, Optional[str]]]]] = {}
+
+
+def _to_naive_utc(value):
+    """Convert aware datetimes to naive UTC, matching our DateTime columns"""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 class CalDAVService:
     """Service for CalDAV calendar integration"""
@@ -21,34 +52,73 @@ class CalDAVService:
         """
         Initialize CalDAV client
 
+        No request is made here; calendars are discovered on first use.
+
         Args:
             url: CalDAV server URL (e.g., https://nextcloud.example.com/remote.php/dav/)
             username: Username for authentication
             password: Password or app-specific password
         """
+        self.url = url
+        self.username = username
         self.client = DAVClient(
             url=url,
             username=username,
             password=password
         )
+        self._calendars = None
+        # UID -> href of events seen during this sync, avoids repeated lookups
+        self._href_cache: Dict[str, str] = {}
+
+    def _discover_calendars(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Blocking principal / calendar-home discovery"""
         try:
-            self.principal = self.client.principal()
-            self.calendars = self.principal.calendars()
-            logger.info(f"Connected to CalDAV server: {url}")
+            calendars = self.client.principal().calendars()
+            logger.info(f"Connected to CalDAV server: {self.url}")
         except Exception as e:
             logger.error(f"Failed to connect to CalDAV: {e}")
             raise
 
-    def list_calendars(self) -> List[Dict]:
+        return [(str(calendar.url), calendar.name, calendar.id) for calendar in calendars]
+
+    async def get_calendars(self, refresh: bool = False) -> List:
+        """
+        Get the user's calendars, discovering them on first use
+
+        Discovery results are shared across service instances for
+        CALDAV_DISCOVERY_TTL_SECONDS, so a sync doesn't repeat the PROPFIND
+        round trips to the principal and calendar home.
+
+        Args:
+            refresh: Ignore cached results and discover again
+        """
+        if self._calendars is not None and not refresh:
+            return self._calendars
+
+        key = (self.url, self.username)
+        cached = _discovery_cache.get(key)
+        if cached and cached[0] > time.monotonic() and not refresh:
+            found = cached[1]
+        else:
+            found = await run_blocking(self._discover_calendars)
+            _discovery_cache[key] = (time.monotonic() + settings.CALDAV_DISCOVERY_TTL_SECONDS, found)
+
+        self._calendars = [
+            caldav.Calendar(client=self.client, url=url, name=name, id=cal_id)
+            for url, name, cal_id in found
+        ]
+        return self._calendars
+
+    async def list_calendars(self) -> List[Dict]:
         """List all available calendars"""
         calendar_list = []
 
-        for calendar in self.calendars:
+        for calendar in await self.get_calendars():
             try:
                 calendar_list.append({
-                    "id": str(calendar.id) if hasattr(calendar, 'id') else calendar.url,
+                    "id": str(calendar.id) if calendar.id else str(calendar.url),
                     "name": calendar.name,
-                    "url": calendar.url
+                    "url": str(calendar.url)
                 })
             except Exception as e:
                 logger.warning(f"Failed to get calendar info: {e}")
@@ -56,9 +126,9 @@ class CalDAVService:
 
         return calendar_list
 
-    def get_calendar_by_name(self, calendar_name: str):
+    async def get_calendar_by_name(self, calendar_name: str):
         """Get calendar object by name"""
-        for calendar in self.calendars:
+        for calendar in await self.get_calendars():
             if calendar.name == calendar_name:
                 return calendar
 
@@ -79,7 +149,7 @@ class CalDAVService:
         Returns:
             External event ID (UID from calendar)
         """
-        calendar = self.get_calendar_by_name(calendar_name)
+        calendar = await self.get_calendar_by_name(calendar_name)
 
         # Build iCal event
         ical = self._build_ical_event(
@@ -92,9 +162,11 @@ class CalDAVService:
 
         # Save to calendar
         try:
-            event = calendar.save_event(ical)
+            event = await run_blocking(calendar.save_event, ical)
             logger.info(f"Created event '{title}' in calendar '{calendar_name}'")
-            return str(event.id) if hasattr(event, 'id') else event.url
+            event_id = str(event.id) if hasattr(event, 'id') else event.url
+            self._href_cache[event_id] = _href(event)
+            return event_id
         except Exception as e:
             logger.error(f"Failed to create event: {e}")
             raise
@@ -106,11 +178,19 @@ class CalDAVService:
         start: datetime,
         end: datetime,
         description: str = None,
-        location: str = None
+        location: str = None,
+        href: Optional[str] = None,
+        calendar_name: Optional[str] = None
     ):
-        """Update existing event"""
-        # Find event by ID
-        event = self._find_event_by_id(event_id)
+        """
+        Update existing event
+
+        Args:
+            event_id: External event ID (UID)
+            href: Stored resource URL of the event, fetched directly if given
+            calendar_name: Calendar to search by UID if the href is unknown or stale
+        """
+        event = await self._find_event(event_id, href=href, calendar_name=calendar_name)
 
         if not event:
             raise ValueError(f"Event {event_id} not found")
@@ -127,19 +207,25 @@ class CalDAVService:
 
         try:
             event.data = ical
-            event.save()
+            await run_blocking(event.save)
             logger.info(f"Updated event {event_id}")
         except Exception as e:
             logger.error(f"Failed to update event: {e}")
             raise
 
-    async def delete_event(self, event_id: str):
+    async def delete_event(
+        self,
+        event_id: str,
+        href: Optional[str] = None,
+        calendar_name: Optional[str] = None
+    ):
         """Delete event from calendar"""
-        event = self._find_event_by_id(event_id)
+        event = await self._find_event(event_id, href=href, calendar_name=calendar_name)
 
         if event:
             try:
-                event.delete()
+                await run_blocking(event.delete)
+                self._href_cache.pop(event_id, None)
                 logger.info(f"Deleted event {event_id}")
             except Exception as e:
                 logger.error(f"Failed to delete event: {e}")
@@ -162,7 +248,7 @@ class CalDAVService:
         Returns:
             List of event dictionaries
         """
-        calendar = self.get_calendar_by_name(calendar_name)
+        calendar = await self.get_calendar_by_name(calendar_name)
 
         # Set default date range
         if start_date is None:
@@ -171,7 +257,7 @@ class CalDAVService:
             end_date = datetime.now() + timedelta(days=365)
 
         try:
-            events = calendar.date_search(start=start_date, end=end_date)
+            events = await run_blocking(calendar.date_search, start=start_date, end=end_date)
             logger.info(f"Fetched {len(events)} events from '{calendar_name}'")
 
             parsed_events = []
@@ -190,6 +276,125 @@ class CalDAVService:
             logger.error(f"Failed to fetch events: {e}")
             raise
 
+    async def get_ctag(self, calendar_name: str) -> Optional[str]:
+        """
+        Get the collection tag of a calendar
+
+        Returns:
+            CTag string, or None if the server doesn't expose one
+        """
+        calendar = await self.get_calendar_by_name(calendar_name)
+
+        try:
+            props = await run_blocking(calendar.get_properties, [GetCTag()])
+            ctag = props.get(GetCTag.tag)
+            return str(ctag) if ctag else None
+        except Exception as e:
+            logger.warning(f"Failed to get CTag of '{calendar_name}': {e}")
+            return None
+
+    async def fetch_changes(
+        self,
+        calendar_name: str,
+        sync_token: Optional[str] = None,
+        known_etags: Optional[Dict[str, str]] = None
+    ) -> Dict:
+        """
+        Fetch events changed since the last sync (RFC 6578 sync-collection)
+
+        The sync-collection REPORT only returns hrefs and ETags. Only hrefs
+        whose ETag differs from the one we stored are downloaded, in batches
+        via calendar-multiget.
+
+        Args:
+            calendar_name: Name of the calendar
+            sync_token: Sync token of the previous sync (None for a full listing)
+            known_etags: Dictionary href -> ETag of events we already have
+
+        Returns:
+            Dictionary with 'events' (parsed, incl. external_id, href, etag),
+            'skipped' (href -> ETag of downloaded objects without a usable
+            VEVENT, e.g. VTODO), 'deleted' (hrefs) and 'sync_token'
+        """
+        calendar = await self.get_calendar_by_name(calendar_name)
+        return await run_blocking(
+            self._collect_changes, calendar, calendar_name, sync_token, known_etags or {}
+        )
+
+    def _collect_changes(
+        self,
+        calendar,
+        calendar_name: str,
+        sync_token: Optional[str],
+        known_etags: Dict[str, str]
+    ) -> Dict:
+        """Blocking part of fetch_changes: sync-collection REPORT and multigets"""
+        try:
+            collection = calendar.objects_by_sync_token(sync_token=sync_token, load_objects=False)
+        except Exception as e:
+            if not sync_token:
+                raise
+            # Token unknown to the server (e.g. expired) - start over
+            logger.info(f"Sync token of '{calendar_name}' rejected ({e}), running full sync")
+            sync_token = None
+            collection = calendar.objects_by_sync_token(sync_token=None, load_objects=False)
+
+        changed = {}
+        deleted = []
+        listed = set()
+
+        for obj in collection:
+            href = _href(obj)
+            listed.add(href)
+            etag = obj.props.get(dav.GetEtag.tag)
+
+            if etag is None:
+                # Incremental reports list removed members without properties
+                if sync_token:
+                    deleted.append(href)
+                continue
+
+            if known_etags.get(href) != etag:
+                changed[href] = (obj.url, etag)
+
+        if not sync_token:
+            # Full listing: whatever we know but the server didn't list is gone
+            deleted.extend(href for href in known_etags if href not in listed)
+
+        events = []
+        skipped = {}
+        urls = [url for url, _ in changed.values()]
+        for i in range(0, len(urls), MULTIGET_BATCH_SIZE):
+            for obj in calendar.calendar_multiget(urls[i:i + MULTIGET_BATCH_SIZE]):
+                href = _href(obj)
+                try:
+                    parsed = self._parse_ical_event(obj.data)
+                except Exception as e:
+                    logger.warning(f"Failed to parse event {href}: {e}")
+                    parsed = None
+                if not parsed:
+                    # Remembered by the caller so it isn't downloaded again until it changes
+                    skipped[href] = changed.get(href, (None, None))[1]
+                    continue
+
+                parsed['external_id'] = parsed['uid']
+                parsed['href'] = href
+                self._href_cache[parsed['uid']] = href
+                parsed['etag'] = changed.get(href, (None, None))[1]
+                events.append(parsed)
+
+        logger.info(
+            f"'{calendar_name}': {len(collection)} listed, {len(events)} changed, "
+            f"{len(skipped)} skipped, {len(deleted)} deleted"
+        )
+
+        return {
+            'events': events,
+            'skipped': skipped,
+            'deleted': deleted,
+            'sync_token': collection.sync_token,
+        }
+
     def _build_ical_event(
         self,
         title: str,
@@ -235,14 +440,22 @@ class CalDAVService:
 
             for component in cal.walk():
                 if component.name == "VEVENT":
+                    start = component.get('dtstart').dt
+                    end = component.get('dtend').dt if component.get('dtend') else start
+                    all_day = isinstance(start, date) and not isinstance(start, datetime)
+                    if all_day:
+                        start = datetime.combine(start, datetime.min.time())
+                        end = datetime.combine(end, datetime.min.time())
+
                     return {
                         'uid': str(component.get('uid')),
                         'title': str(component.get('summary', '')),
                         'description': str(component.get('description', '')),
-                        'start': component.get('dtstart').dt,
-                        'end': component.get('dtend').dt,
+                        'start': _to_naive_utc(start),
+                        'end': _to_naive_utc(end),
+                        'all_day': all_day,
                         'location': str(component.get('location', '')),
-                        'last_modified': component.get('last-modified', datetime.utcnow()).dt
+                        'last_modified': _to_naive_utc(component.get('last-modified').dt)
                             if component.get('last-modified') else datetime.utcnow()
                     }
 
@@ -251,25 +464,67 @@ class CalDAVService:
             logger.error(f"Failed to parse iCal: {e}")
             return None
 
-    def _find_event_by_id(self, event_id: str):
-        """Find event across all calendars by ID/URL"""
-        for calendar in self.calendars:
+    def get_href(self, event_id: str) -> Optional[str]:
+        """Resource URL of an event created, fetched or looked up during this sync"""
+        return self._href_cache.get(event_id)
+
+    async def _find_event(
+        self,
+        event_id: str,
+        href: Optional[str] = None,
+        calendar_name: Optional[str] = None
+    ):
+        """
+        Find an event by href, falling back to a UID calendar-query
+
+        Args:
+            event_id: External event ID (UID)
+            href: Stored resource URL of the event
+            calendar_name: Restrict the UID search to this calendar
+
+        Returns:
+            Loaded event, or None if it doesn't exist anymore
+        """
+        if calendar_name:
+            calendars = [await self.get_calendar_by_name(calendar_name)]
+        else:
+            calendars = await self.get_calendars()
+
+        return await run_blocking(
+            self._lookup_event, event_id, href or self._href_cache.get(event_id), calendars
+        )
+
+    def _lookup_event(self, event_id: str, href: Optional[str], calendars: List):
+        """Blocking part of _find_event"""
+        if href and calendars:
+            try:
+                event = calendars[0].event_by_url(href)
+                event.load()
+                self._href_cache[event_id] = href
+                return event
+            except NotFoundError:
+                logger.info(f"Event {event_id} not found at {href}, searching by UID")
+
+        for calendar in calendars:
             try:
-                events = calendar.events()
-                for event in events:
-                    if (hasattr(event, 'id') and str(event.id) == event_id) or event.url == event_id:
-                        return event
+                event = calendar.event_by_uid(event_id)
+            except NotFoundError:
+                continue
             except Exception as e:
                 logger.warning(f"Error searching calendar: {e}")
                 continue
 
+            self._href_cache[event_id] = _href(event)
+            return event
+
         return None
 
     async def test_connection(self) -> bool:
         """Test if connection is working"""
         try:
-            calendars = self.list_calendars()
-            return len(calendars) >= 0  # Success if we can list calendars
+            # Always go to the server, a cached discovery proves nothing
+            await self.get_calendars(refresh=True)
+            return True
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
             return False
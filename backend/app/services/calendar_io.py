@@ -0,0 +1,31 @@
+"""
+Calendar I/O
+Runs blocking calendar client calls (caldav, googleapiclient) off the event loop
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+
+from ..core.config import settings
+
+# Dedicated pool, so slow calendar servers can't starve the default executor
+_executor = ThreadPoolExecutor(
+    max_workers=settings.CALENDAR_IO_THREADS,
+    thread_name_prefix="calendar-io"
+)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Run a blocking call in the calendar I/O thread pool and await its result
+
+    Args:
+        func: Blocking callable
+        *args, **kwargs: Arguments passed to func
+
+    Returns:
+        Return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
@@ -4,18 +4,106 @@ Handles bidirectional synchronization between local calendar events and external
 """
 
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Tuple, Optional
+import hashlib
+import json
 import logging
 
 from ..models import CalendarEvent, Integration, User
 from ..models.calendar_event import CalendarSyncStatus
 from ..models.integration import IntegrationType, SyncDirection
 from .caldav_service import CalDAVService
-from .google_calendar_service import GoogleCalendarService
+from .google_calendar_service import GoogleCalendarService, SyncTokenExpiredError
 
 logger = logging.getLogger(__name__)
 
+# Event content copied from remote events onto local ones (and covered by the content hash)
+REMOTE_EVENT_FIELDS = ('title', 'description', 'start_time', 'end_time', 'all_day', 'location')
+
+
+def event_content_hash(fields: Dict) -> str:
+    """
+    Normalized hash of the synced content of an event
+
+    Whitespace, missing vs. empty text and sub-second differences don't
+    change the hash; all-day events are compared by date only.
+
+    Args:
+        fields: Dictionary with the REMOTE_EVENT_FIELDS keys
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    all_day = bool(fields.get('all_day'))
+
+    def when(value):
+        if value is None:
+            return None
+        return value.date().isoformat() if all_day else value.replace(microsecond=0).isoformat()
+
+    normalized = [
+        (fields.get('title') or '').strip(),
+        (fields.get('description') or '').strip(),
+        when(fields.get('start_time')),
+        when(fields.get('end_time')),
+        all_day,
+        (fields.get('location') or '').strip(),
+    ]
+    return hashlib.sha256(json.dumps(normalized).encode()).hexdigest()
+
+
+def _caldav_remote_event(ext_event: Dict) -> Dict:
+    """Column form of an event returned by CalDAVService.fetch_changes"""
+    return {
+        'external_event_id': ext_event['external_id'],
+        'title': ext_event['title'],
+        'description': ext_event.get('description', ''),
+        'start_time': ext_event['start'],
+        'end_time': ext_event['end'],
+        'all_day': ext_event.get('all_day', False),
+        'location': ext_event.get('location', ''),
+        'last_modified': ext_event.get('last_modified'),
+        'external_href': ext_event['href'],
+        'external_etag': ext_event['etag'],
+    }
+
+
+def _google_remote_event(ext_event: Dict) -> Dict:
+    """Column form of an event returned by GoogleCalendarService.list_event_changes"""
+    return {
+        'external_event_id': ext_event['id'],
+        'title': ext_event['title'],
+        'description': ext_event.get('description', ''),
+        'start_time': ext_event['start_time'],
+        'end_time': ext_event['end_time'],
+        'all_day': ext_event.get('all_day', False),
+        'location': ext_event.get('location', ''),
+        'last_modified': ext_event.get('last_modified'),
+    }
+
+
+def _validate_remote_event(event: Dict):
+    """
+    Check a pulled event in column form before it is merged
+
+    Raises:
+        ValueError: If the event can't be stored
+    """
+    if not event['external_event_id']:
+        raise ValueError("missing external ID")
+    if not isinstance(event['start_time'], datetime) or not isinstance(event['end_time'], datetime):
+        raise ValueError("start and end must be datetimes")
+    if event['end_time'] < event['start_time']:
+        raise ValueError("end is before start")
+    if event['last_modified'] is not None and not isinstance(event['last_modified'], datetime):
+        raise ValueError("last_modified must be a datetime")
+
+
+def local_content_hash(event: CalendarEvent) -> str:
+    """Content hash of a local calendar event"""
+    return event_content_hash({field: getattr(event, field) for field in REMOTE_EVENT_FIELDS})
+
 
 class SyncResult:
     """Result of a sync operation"""
@@ -145,83 +233,48 @@ class CalendarSyncService:
         """
         Pull events from external CalDAV calendar to local database
 
-        Creates new events or updates existing ones
+        Skipped entirely when the calendar's CTag is unchanged since the last
+        sync. Otherwise a sync-collection REPORT lists changed hrefs, and
+        only events whose ETag differs from the stored one are downloaded.
+        ETags of objects that aren't events are stored on the integration,
+        so those aren't downloaded on every sync either.
+        Creates new events, updates existing ones and removes deleted ones.
         """
         try:
-            # Fetch events from last 30 days to next 365 days
-            start_date = datetime.now() - timedelta(days=30)
-            end_date = datetime.now() + timedelta(days=365)
+            ctag = await caldav_service.get_ctag(calendar_name)
+            if ctag and ctag == integration.sync_ctag and integration.sync_token:
+                logger.debug(f"CalDAV calendar '{calendar_name}' unchanged (CTag {ctag}), skipping pull")
+                return
+
+            known_etags = dict(
+                self.db.query(CalendarEvent.external_href, CalendarEvent.external_etag).filter(
+                    CalendarEvent.external_calendar_id == integration.id,
+                    CalendarEvent.external_href.isnot(None)
+                ).all()
+            )
+            # Objects without events (tasks, journal entries) are only fetched again once they change
+            skipped_etags = integration.sync_skipped_etags or {}
+            known_etags.update(skipped_etags)
 
-            external_events = await caldav_service.fetch_events(
+            changes = await caldav_service.fetch_changes(
                 calendar_name=calendar_name,
-                start_date=start_date,
-                end_date=end_date
+                sync_token=integration.sync_token,
+                known_etags=known_etags
             )
-
-            for ext_event in external_events:
-                try:
-                    # Check if event already exists locally
-                    local_event = self.db.query(CalendarEvent).filter(
-                        CalendarEvent.external_event_id == ext_event['external_id'],
-                        CalendarEvent.user_id == user.id
-                    ).first()
-
-                    if local_event:
-                        # Event exists - check for conflicts
-                        conflict = self._detect_conflict(local_event, ext_event)
-
-                        if conflict:
-                            # Store conflict data and mark as conflict
-                            local_event.sync_status = CalendarSyncStatus.CONFLICT
-                            local_event.conflict_data = {
-                                "local": {
-                                    "title": local_event.title,
-                                    "start_time": local_event.start_time.isoformat(),
-                                    "end_time": local_event.end_time.isoformat(),
-                                    "description": local_event.description,
-                                    "location": local_event.location,
-                                },
-                                "remote": {
-                                    "title": ext_event['title'],
-                                    "start_time": ext_event['start'].isoformat(),
-                                    "end_time": ext_event['end'].isoformat(),
-                                    "description": ext_event['description'],
-                                    "location": ext_event['location'],
-                                },
-                                "detected_at": datetime.utcnow().isoformat()
-                            }
-                            result.conflicts += 1
-                            logger.warning(f"Conflict detected for event {local_event.id}")
-
-                        elif local_event.last_synced_at and ext_event.get('last_modified'):
-                            # Remote is newer - update local
-                            if ext_event['last_modified'] > local_event.last_synced_at:
-                                self._update_local_event(local_event, ext_event)
-                                result.events_updated += 1
-                                logger.info(f"Updated local event {local_event.id} from remote")
-                    else:
-                        # New event from external calendar - create locally
-                        new_event = CalendarEvent(
-                            user_id=user.id,
-                            title=ext_event['title'],
-                            description=ext_event.get('description', ''),
-                            start_time=ext_event['start'],
-                            end_time=ext_event['end'],
-                            location=ext_event.get('location', ''),
-                            external_event_id=ext_event['external_id'],
-                            external_calendar_id=integration.id,
-                            sync_status=CalendarSyncStatus.SYNCED,
-                            last_synced_at=datetime.utcnow()
-                        )
-                        self.db.add(new_event)
-                        result.events_pulled += 1
-                        logger.info(f"Created new local event from external: {ext_event['title']}")
-
-                except Exception as e:
-                    logger.error(f"Error processing event {ext_event.get('title', 'unknown')}: {e}")
-                    result.errors += 1
-                    result.error_messages.append(f"Event pull error: {str(e)}")
-
+            remote_events = self._convert_remote_events(changes['events'], _caldav_remote_event, result)
+            self._apply_remote_events(integration, user, remote_events, result)
+
+            if changes['deleted']:
+                self._remove_deleted_remote_events(integration, result, hrefs=changes['deleted'])
+
+            # Only advance the sync state together with the pulled changes
+            gone = set(changes['deleted']) | {event['href'] for event in changes['events']}
+            integration.sync_skipped_etags = {
+                **{href: etag for href, etag in skipped_etags.items() if href not in gone},
+                **changes['skipped'],
+            }
+            integration.sync_token = changes['sync_token']
+            integration.sync_ctag = ctag
             self.db.commit()
 
         except Exception as e:
@@ -252,6 +305,12 @@ class CalendarSyncService:
 
             for local_event in pending_events:
                 try:
+                    content_hash = local_event.content_hash or local_content_hash(local_event)
+                    if local_event.external_event_id and content_hash == local_event.remote_hash:
+                        # Remote already has this content
+                        local_event.sync_status = CalendarSyncStatus.SYNCED
+                        continue
+
                     if local_event.external_event_id:
                         # Update existing event
                         await caldav_service.update_event(
@@ -260,8 +319,11 @@ class CalendarSyncService:
                             start=local_event.start_time,
                             end=local_event.end_time,
                             description=local_event.description,
-                            location=local_event.location
+                            location=local_event.location,
+                            href=local_event.external_href,
+                            calendar_name=calendar_name
                         )
+                        local_event.external_href = caldav_service.get_href(local_event.external_event_id)
                         result.events_updated += 1
                         logger.info(f"Updated remote event {local_event.external_event_id}")
                     else:
@@ -275,10 +337,13 @@ class CalendarSyncService:
                             location=local_event.location
                         )
                         local_event.external_event_id = external_id
+                        local_event.external_href = caldav_service.get_href(external_id)
                         result.events_pushed += 1
                         logger.info(f"Created new remote event: {local_event.title}")
 
                     # Mark as synced
+                    local_event.content_hash = content_hash
+                    local_event.remote_hash = content_hash
                     local_event.sync_status = CalendarSyncStatus.SYNCED
                     local_event.last_synced_at = datetime.utcnow()
 
@@ -295,6 +360,64 @@ class CalendarSyncService:
             result.errors += 1
             result.error_messages.append(f"Push error: {str(e)}")
 
+    def reset_sync_state(self, integration: Integration):
+        """
+        Forget what was pulled from the integration's calendar (without committing)
+
+        For when it points to another calendar or account: the next pull is
+        a full one, stored ETags no longer short-circuit downloads and the
+        watch channel is replaced on the next renewal run.
+        """
+        integration.sync_token = None
+        integration.sync_ctag = None
+        integration.sync_skipped_etags = None
+        integration.watch_expires_at = None
+        integration.watch_failures = 0
+        integration.watch_retry_after = None
+
+        self.db.query(CalendarEvent).filter(
+            CalendarEvent.external_calendar_id == integration.id
+        ).update(
+            # Not a local edit: keep updated_at
+            {CalendarEvent.external_etag: None, CalendarEvent.updated_at: CalendarEvent.updated_at},
+            synchronize_session=False
+        )
+
+    def _remove_deleted_remote_events(
+        self,
+        integration: Integration,
+        result: SyncResult,
+        external_ids: Optional[List[str]] = None,
+        hrefs: Optional[List[str]] = None
+    ):
+        """
+        Apply remote deletions to local events of an integration
+
+        Events are matched by external ID (Google) or href (CalDAV). Plain
+        events are deleted; events generated from a task stay as local-only
+        events so the task keeps its calendar entry.
+        """
+        query = self.db.query(CalendarEvent).filter(
+            CalendarEvent.external_calendar_id == integration.id
+        )
+        if hrefs is not None:
+            query = query.filter(CalendarEvent.external_href.in_(hrefs))
+        else:
+            query = query.filter(CalendarEvent.external_event_id.in_(external_ids or []))
+        events = query.all()
+
+        for event in events:
+            if event.task_id:
+                event.external_event_id = None
+                event.external_href = None
+                event.external_etag = None
+                event.external_calendar_id = None
+                event.sync_status = CalendarSyncStatus.SYNCED
+            else:
+                self.db.delete(event)
+            result.events_updated += 1
+            logger.info(f"Removed local event {event.id}, deleted in external calendar")
+
     def _detect_conflict(self, local_event: CalendarEvent, external_event: Dict) -> bool:
         """
         Detect if there's a conflict between local and external event
@@ -316,18 +439,183 @@ class CalendarSyncService:
         # Conflict if both were modified
         return local_modified and external_modified
 
-    def _update_local_event(self, local_event: CalendarEvent, external_event: Dict):
+    def _convert_remote_events(self, events: List[Dict], convert, result: SyncResult) -> List[Dict]:
         """
-        Update local event with data from external event
+        Convert pulled events to column form, skipping malformed ones
+
+        A single bad event is counted in result.errors instead of failing
+        the whole pull.
         """
-        local_event.title = external_event['title']
-        local_event.description = external_event.get('description', '')
-        local_event.start_time = external_event['start']
-        local_event.end_time = external_event['end']
-        local_event.location = external_event.get('location', '')
-        local_event.sync_status = CalendarSyncStatus.SYNCED
-        local_event.last_synced_at = datetime.utcnow()
-        local_event.conflict_data = None  # Clear any previous conflict data
+        converted = []
+        for ext_event in events:
+            try:
+                event = convert(ext_event)
+                _validate_remote_event(event)
+                converted.append(event)
+            except Exception as e:
+                title = ext_event.get('title', 'unknown') if isinstance(ext_event, dict) else 'unknown'
+                logger.error(f"Error processing event {title}: {e}")
+                result.errors += 1
+                result.error_messages.append(f"Event pull error: {str(e)}")
+        return converted
+
+    def _apply_remote_events(
+        self,
+        integration: Integration,
+        user: User,
+        remote_events: List[Dict],
+        result: SyncResult
+    ):
+        """
+        Merge pulled remote events into the local calendar
+
+        Local counterparts are loaded with one query keyed by external ID;
+        new events are bulk inserted and changed ones bulk updated, so the
+        number of statements doesn't grow with the number of events. An
+        event that fails to merge is counted in result.errors and skipped.
+
+        Args:
+            integration: Integration the events were pulled from
+            user: Owner of the integration
+            remote_events: Events in column form (external_event_id, title,
+                description, start_time, end_time, all_day, location,
+                last_modified and optionally external_href/external_etag)
+            result: SyncResult to update
+        """
+        # Later entries win if the remote listed an event twice
+        remote_by_id = {event['external_event_id']: event for event in remote_events}
+        if not remote_by_id:
+            return
+
+        local_by_id = {
+            event.external_event_id: event
+            for event in self.db.query(CalendarEvent).filter(
+                CalendarEvent.external_calendar_id == integration.id,
+                CalendarEvent.external_event_id.in_(list(remote_by_id.keys()))
+            ).all()
+        }
+
+        now = datetime.utcnow()
+        inserts: List[Dict] = []
+        updates: List[Dict] = []
+
+        skipped = 0
+
+        for external_id, ext_event in remote_by_id.items():
+            try:
+                location_fields = {
+                    key: ext_event[key] for key in ('external_href', 'external_etag') if key in ext_event
+                }
+                event_fields = {key: ext_event[key] for key in REMOTE_EVENT_FIELDS}
+                remote_hash = event_content_hash(event_fields)
+                local_event = local_by_id.get(external_id)
+
+                if local_event is not None and local_event.remote_hash == remote_hash:
+                    # Remote content unchanged since we last saw it - nothing to merge
+                    skipped += 1
+                    if any(getattr(local_event, key) != value for key, value in location_fields.items()):
+                        updates.append({**location_fields, 'id': local_event.id, 'updated_at': local_event.updated_at})
+
+                elif local_event is not None and local_event.content_hash == remote_hash:
+                    # Both sides already agree (e.g. the same edit made twice)
+                    skipped += 1
+                    updates.append({
+                        **location_fields,
+                        'id': local_event.id,
+                        'remote_hash': remote_hash,
+                        'sync_status': CalendarSyncStatus.SYNCED,
+                        'conflict_data': None,
+                        'last_synced_at': now,
+                        'updated_at': now,
+                    })
+
+                elif local_event is None:
+                    # New event from external calendar - create locally
+                    inserts.append({
+                        **event_fields,
+                        **location_fields,
+                        'content_hash': remote_hash,
+                        'remote_hash': remote_hash,
+                        'user_id': user.id,
+                        'external_event_id': external_id,
+                        'external_calendar_id': integration.id,
+                        'sync_status': CalendarSyncStatus.SYNCED,
+                        'last_synced_at': now,
+                        'created_at': now,
+                        'updated_at': now,
+                    })
+                    result.events_pulled += 1
+                    logger.debug(f"Creating local event from external: {ext_event['title']}")
+
+                elif self._detect_conflict(local_event, ext_event):
+                    # Store conflict data and mark as conflict
+                    updates.append({
+                        **location_fields,
+                        'id': local_event.id,
+                        'sync_status': CalendarSyncStatus.CONFLICT,
+                        'conflict_data': {
+                            "local": {
+                                "title": local_event.title,
+                                "start_time": local_event.start_time.isoformat(),
+                                "end_time": local_event.end_time.isoformat(),
+                                "description": local_event.description,
+                                "location": local_event.location,
+                            },
+                            "remote": {
+                                "title": ext_event['title'],
+                                "start_time": ext_event['start_time'].isoformat(),
+                                "end_time": ext_event['end_time'].isoformat(),
+                                "description": ext_event['description'],
+                                "location": ext_event['location'],
+                            },
+                            "detected_at": now.isoformat()
+                        },
+                    })
+                    result.conflicts += 1
+                    logger.warning(f"Conflict detected for event {local_event.id}")
+
+                elif (
+                    local_event.last_synced_at
+                    and ext_event.get('last_modified')
+                    and ext_event['last_modified'] > local_event.last_synced_at
+                ):
+                    # Remote is newer - update local. updated_at equals last_synced_at
+                    # so the write isn't mistaken for a local change later.
+                    updates.append({
+                        **event_fields,
+                        **location_fields,
+                        'id': local_event.id,
+                        'content_hash': remote_hash,
+                        'remote_hash': remote_hash,
+                        'sync_status': CalendarSyncStatus.SYNCED,
+                        'conflict_data': None,
+                        'last_synced_at': now,
+                        'updated_at': now,
+                    })
+                    result.events_updated += 1
+                    logger.debug(f"Updating local event {local_event.id} from remote")
+
+                elif any(getattr(local_event, key) != value for key, value in location_fields.items()):
+                    # Unchanged content, but remember where the event lives and which version
+                    # we've seen; keep updated_at so this doesn't count as a local edit
+                    updates.append({**location_fields, 'id': local_event.id, 'updated_at': local_event.updated_at})
+
+            except Exception as e:
+                # Skip the event; the bulk write below only gets well-formed rows
+                logger.error(f"Error processing event {ext_event.get('title', 'unknown')}: {e}")
+                result.errors += 1
+                result.error_messages.append(f"Event pull error: {str(e)}")
+
+        if updates:
+            self.db.bulk_update_mappings(CalendarEvent, updates)
+        if inserts:
+            self.db.bulk_insert_mappings(CalendarEvent, inserts)
+
+        logger.info(
+            f"Integration {integration.id}: {len(inserts)} event(s) created, "
+            f"{len(updates)} updated locally, {skipped} unchanged "
+            f"from {len(remote_by_id)} remote change(s)"
+        )
 
     async def _sync_google_calendar(self, integration: Integration, user: User) -> SyncResult:
         """
@@ -344,7 +632,7 @@ class CalendarSyncService:
 
         try:
             # Initialize Google Calendar service with OAuth credentials
-            google_service = GoogleCalendarService(integration.credentials)
+            google_service = GoogleCalendarService(integration.credentials, cache_key=str(integration.id))
 
             calendar_id = integration.config.get('calendar_id', 'primary')
 
@@ -362,10 +650,10 @@ class CalendarSyncService:
                 await self._pull_from_google(google_service, calendar_id, integration, user, result)
                 await self._push_to_google(google_service, calendar_id, integration, user, result)
 
-            # Update credentials in case token was refreshed
-            updated_creds = google_service.get_updated_credentials()
-            integration.credentials = updated_creds
-            self.db.commit()
+            # Save credentials only if the token was refreshed
+            if google_service.credentials_changed:
+                integration.credentials = google_service.get_updated_credentials()
+                self.db.commit()
 
         except Exception as e:
             logger.error(f"Google Calendar sync error: {e}")
@@ -385,91 +673,49 @@ class CalendarSyncService:
         """
         Pull events from Google Calendar to local database
 
-        Creates new events or updates existing ones
+        Uses the integration's sync token so only events changed since the
+        last sync are fetched; falls back to a full sync when there is no
+        token yet or Google expired it (HTTP 410). Creates new events,
+        updates existing ones and removes events deleted remotely; after a
+        full sync, synced events inside its window that Google no longer
+        lists count as deleted.
         """
         try:
-            # Fetch events from last 30 days to next 365 days
-            start_date = datetime.utcnow() - timedelta(days=30)
-            end_date = datetime.utcnow() + timedelta(days=365)
-
-            external_events = await google_service.get_events(
-                calendar_id=calendar_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-
-            for ext_event in external_events:
-                try:
-                    # Check if event already exists locally
-                    local_event = self.db.query(CalendarEvent).filter(
-                        CalendarEvent.external_event_id == ext_event['id'],
-                        CalendarEvent.user_id == user.id
-                    ).first()
-
-                    if local_event:
-                        # Event exists - check for conflicts
-                        conflict = self._detect_conflict(local_event, ext_event)
-
-                        if conflict:
-                            # Store conflict data and mark as conflict
-                            local_event.sync_status = CalendarSyncStatus.CONFLICT
-                            local_event.conflict_data = {
-                                "local": {
-                                    "title": local_event.title,
-                                    "start_time": local_event.start_time.isoformat(),
-                                    "end_time": local_event.end_time.isoformat(),
-                                    "description": local_event.description,
-                                    "location": local_event.location,
-                                },
-                                "remote": {
-                                    "title": ext_event['title'],
-                                    "start_time": ext_event['start_time'].isoformat(),
-                                    "end_time": ext_event['end_time'].isoformat(),
-                                    "description": ext_event['description'],
-                                    "location": ext_event['location'],
-                                },
-                                "detected_at": datetime.utcnow().isoformat()
-                            }
-                            result.conflicts += 1
-                            logger.warning(f"Conflict detected for event {local_event.id}")
-
-                        elif local_event.last_synced_at and ext_event.get('last_modified'):
-                            # Remote is newer - update local
-                            if ext_event['last_modified'] > local_event.last_synced_at:
-                                local_event.title = ext_event['title']
-                                local_event.description = ext_event.get('description', '')
-                                local_event.start_time = ext_event['start_time']
-                                local_event.end_time = ext_event['end_time']
-                                local_event.location = ext_event.get('location', '')
-                                local_event.all_day = ext_event.get('all_day', False)
-                                local_event.sync_status = CalendarSyncStatus.SYNCED
-                                local_event.last_synced_at = datetime.utcnow()
-                                result.events_updated += 1
-                                logger.info(f"Updated local event {local_event.id} from Google Calendar")
-                    else:
-                        # New event from Google Calendar - create locally
-                        new_event = CalendarEvent(
-                            user_id=user.id,
-                            title=ext_event['title'],
-                            description=ext_event.get('description', ''),
-                            start_time=ext_event['start_time'],
-                            end_time=ext_event['end_time'],
-                            location=ext_event.get('location', ''),
-                            all_day=ext_event.get('all_day', False),
-                            external_event_id=ext_event['id'],
-                            external_calendar_id=integration.id,
-                            sync_status=CalendarSyncStatus.SYNCED,
-                            last_synced_at=datetime.utcnow()
-                        )
-                        self.db.add(new_event)
-                        result.events_pulled += 1
-                        logger.info(f"Created new local event from Google Calendar: {ext_event['title']}")
-
-                except Exception as e:
-                    logger.error(f"Error processing Google event {ext_event.get('title', 'unknown')}: {e}")
-                    result.errors += 1
-                    result.error_messages.append(f"Event pull error: {str(e)}")
-
+            try:
+                changes = await google_service.list_event_changes(
+                    calendar_id=calendar_id,
+                    sync_token=integration.sync_token
+                )
+            except SyncTokenExpiredError:
+                logger.info(f"Sync token of integration {integration.id} expired, running full sync")
+                integration.sync_token = None
+                changes = await google_service.list_event_changes(calendar_id=calendar_id)
+
+            remote_events = self._convert_remote_events(changes['events'], _google_remote_event, result)
+            self._apply_remote_events(integration, user, remote_events, result)
+
+            if changes['deleted']:
+                self._remove_deleted_remote_events(integration, result, external_ids=changes['deleted'])
+
+            if changes['time_min'] is not None:
+                # A full list has no cancelled items, so deletions made while
+                # the token was stale only show up as missing events
+                listed = {event['id'] for event in changes['events']} | set(changes['deleted'])
+                missing = [
+                    external_id for external_id, in self.db.query(CalendarEvent.external_event_id).filter(
+                        CalendarEvent.external_calendar_id == integration.id,
+                        CalendarEvent.external_event_id.isnot(None),
+                        CalendarEvent.end_time > changes['time_min'],
+                        # Local edits still waiting to be pushed win
+                        CalendarEvent.sync_status == CalendarSyncStatus.SYNCED
+                    )
+                    if external_id not in listed
+                ]
+                if missing:
+                    self._remove_deleted_remote_events(integration, result, external_ids=missing)
+
+            # Only advance the token together with the pulled changes
+            integration.sync_token = changes['next_sync_token']
             self.db.commit()
 
         except Exception as e:
@@ -488,7 +734,8 @@ class CalendarSyncService:
         """
         Push local events to Google Calendar
 
-        Only pushes events that need syncing (pending or modified)
+        Only pushes events that need syncing (pending or modified). All
+        creates and updates go out as batch requests.
         """
         try:
             # Find all events that need to be pushed
@@ -498,46 +745,57 @@ class CalendarSyncService:
                 CalendarEvent.sync_status == CalendarSyncStatus.PENDING
             ).all()
 
+            events_by_key = {}
+            hashes = {}
             for event in pending_events:
-                try:
-                    if event.external_event_id:
-                        # Update existing event
-                        await google_service.update_event(
-                            calendar_id=calendar_id,
-                            event_id=event.external_event_id,
-                            title=event.title,
-                            start_time=event.start_time,
-                            end_time=event.end_time,
-                            description=event.description,
-                            location=event.location,
-                            all_day=event.all_day
-                        )
-                        result.events_updated += 1
-                        logger.info(f"Updated Google Calendar event: {event.title}")
-                    else:
-                        # Create new event
-                        created_event = await google_service.create_event(
-                            calendar_id=calendar_id,
-                            title=event.title,
-                            start_time=event.start_time,
-                            end_time=event.end_time,
-                            description=event.description,
-                            location=event.location,
-                            all_day=event.all_day
-                        )
-                        event.external_event_id = created_event['id']
-                        result.events_pushed += 1
-                        logger.info(f"Created new Google Calendar event: {event.title}")
-
-                    # Mark as synced
+                hashes[event.id] = event.content_hash or local_content_hash(event)
+                if event.external_event_id and hashes[event.id] == event.remote_hash:
+                    # Remote already has this content
                     event.sync_status = CalendarSyncStatus.SYNCED
-                    event.last_synced_at = datetime.utcnow()
+                else:
+                    events_by_key[str(event.id)] = event
+
+            responses = await google_service.push_events_batch(
+                calendar_id,
+                [
+                    {
+                        'key': key,
+                        'event_id': event.external_event_id,
+                        'title': event.title,
+                        'start_time': event.start_time,
+                        'end_time': event.end_time,
+                        'description': event.description,
+                        'location': event.location,
+                        'all_day': event.all_day,
+                    }
+                    for key, event in events_by_key.items()
+                ]
+            )
 
-                except Exception as e:
-                    logger.error(f"Error pushing event {event.title} to Google: {e}")
+            now = datetime.utcnow()
+            for key, event in events_by_key.items():
+                response = responses.get(key, {'error': 'no response'})
+
+                if 'error' in response:
+                    logger.error(f"Error pushing event {event.title} to Google: {response['error']}")
                     event.sync_status = CalendarSyncStatus.FAILED
                     result.errors += 1
-                    result.error_messages.append(f"Push error for '{event.title}': {str(e)}")
+                    result.error_messages.append(f"Push error for '{event.title}': {response['error']}")
+                    continue
+
+                if event.external_event_id:
+                    result.events_updated += 1
+                else:
+                    event.external_event_id = response['event']['id']
+                    result.events_pushed += 1
+
+                # Mark as synced
+                event.content_hash = hashes[event.id]
+                event.remote_hash = hashes[event.id]
+                event.sync_status = CalendarSyncStatus.SYNCED
+                event.last_synced_at = now
+
+            logger.info(f"Pushed {len(events_by_key)} event(s) to Google Calendar {calendar_id}")
 
             self.db.commit()
 
@@ -581,6 +839,9 @@ class CalendarSyncService:
                 event.end_time = datetime.fromisoformat(remote_data['end_time'])
                 event.description = remote_data.get('description', '')
                 event.location = remote_data.get('location', '')
+                event.content_hash = local_content_hash(event)
+                # Local now matches remote, the next push skips it
+                event.remote_hash = event.content_hash
 
             # For 'keep_local', we don't need to change local data,
             # just mark it for push in next sync
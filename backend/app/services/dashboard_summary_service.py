@@ -0,0 +1,155 @@
+"""
+Dashboard Summary Service
+Maintains the per-user dashboard counters and serves the dashboard summary
+"""
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Dict, Iterable
+import logging
+
+from ..models.document import Document
+from ..models.task import Task, TaskStatus, TaskPriority
+from ..models.user_summary import UserSummary
+
+logger = logging.getLogger(__name__)
+
+# Task states counted as open; matches the ix_tasks_user_open_due_date predicate
+OPEN_TASK_STATUSES = [TaskStatus.OPEN.value, TaskStatus.IN_PROGRESS.value]
+
+# Document states counted as still processing
+PROCESSING_DOCUMENT_STATUSES = ["pending", "processing"]
+
+# Window of the "due soon" counter
+DUE_SOON_DAYS = 7
+
+
+class DashboardSummaryService:
+    """Service for the dashboard summary of a user"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_users(self, user_ids: Iterable, commit: bool = True):
+        """
+        Recompute the stored counters of users
+
+        Only open tasks and flagged documents are read, through partial
+        indexes, so the cost follows the user's current workload rather than
+        their history.
+
+        Args:
+            user_ids: Users whose tasks or documents changed
+            commit: Commit at the end (False to join the caller's transaction)
+        """
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return
+
+        counters: Dict = {user_id: self._empty_counters() for user_id in user_ids}
+
+        open_tasks = self.db.query(
+            Task.user_id, Task.priority, Task.currency, func.count(Task.id), func.sum(Task.amount)
+        ).filter(
+            Task.user_id.in_(user_ids),
+            Task.status.in_(OPEN_TASK_STATUSES)
+        ).group_by(Task.user_id, Task.priority, Task.currency).all()
+
+        for user_id, priority, currency, count, amount in open_tasks:
+            entry = counters[user_id]
+            column = f"open_tasks_{priority}"
+            if column in entry:
+                entry[column] += count
+            if amount:
+                currency = currency or "EUR"
+                entry["open_amounts"][currency] = entry["open_amounts"].get(currency, 0) + amount
+
+        needing_review = self.db.query(Document.user_id, func.count(Document.id)).filter(
+            Document.user_id.in_(user_ids),
+            Document.needs_review.is_(True)
+        ).group_by(Document.user_id).all()
+        for user_id, count in needing_review:
+            counters[user_id]["documents_needing_review"] = count
+
+        processing = self.db.query(Document.user_id, func.count(Document.id)).filter(
+            Document.user_id.in_(user_ids),
+            Document.processing_status.in_(PROCESSING_DOCUMENT_STATUSES)
+        ).group_by(Document.user_id).all()
+        for user_id, count in processing:
+            counters[user_id]["documents_processing"] = count
+
+        now = datetime.utcnow()
+        rows = []
+        for user_id, entry in counters.items():
+            entry["open_amounts"] = {currency: str(amount) for currency, amount in entry["open_amounts"].items()}
+            rows.append({"user_id": user_id, **entry, "updated_at": now})
+
+        # Upsert, so concurrent refreshes of a new user don't collide
+        stmt = pg_insert(UserSummary).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserSummary.user_id],
+            set_={column: stmt.excluded[column] for column in rows[0] if column != "user_id"}
+        )
+        self.db.execute(stmt)
+
+        if commit:
+            self.db.commit()
+
+    def refresh_user(self, user_id, commit: bool = True):
+        """Recompute the stored counters of a single user"""
+        self.refresh_users([user_id], commit=commit)
+
+    def get_summary(self, user_id) -> Dict:
+        """
+        Build the dashboard summary of a user
+
+        Stored counters are read from one row. Overdue and due-soon counts
+        depend on the current time, so they are counted live over the
+        user's open tasks only (partial index on open tasks).
+
+        Returns:
+            Dictionary matching DashboardSummaryResponse
+        """
+        summary = self.db.query(UserSummary).filter(UserSummary.user_id == user_id).first()
+        if summary is None:
+            # First visit (or counters never computed): build them once
+            self.refresh_user(user_id)
+            summary = self.db.query(UserSummary).filter(UserSummary.user_id == user_id).first()
+
+        now = datetime.utcnow()
+        overdue, due_soon = self.db.query(
+            func.count(Task.id).filter(Task.due_date < now),
+            func.count(Task.id).filter(Task.due_date >= now, Task.due_date < now + timedelta(days=DUE_SOON_DAYS)),
+        ).filter(
+            Task.user_id == user_id,
+            Task.status.in_(OPEN_TASK_STATUSES),
+            Task.due_date < now + timedelta(days=DUE_SOON_DAYS)
+        ).one()
+
+        by_priority = {
+            priority.value: getattr(summary, f"open_tasks_{priority.value}")
+            for priority in TaskPriority
+        }
+
+        return {
+            "open_tasks": sum(by_priority.values()),
+            "open_tasks_by_priority": by_priority,
+            "overdue_tasks": overdue,
+            "due_soon_tasks": due_soon,
+            "open_amounts": summary.open_amounts or {},
+            "documents_needing_review": summary.documents_needing_review,
+            "documents_processing": summary.documents_processing,
+            "updated_at": summary.updated_at,
+        }
+
+    @staticmethod
+    def _empty_counters() -> Dict:
+        counters = {f"open_tasks_{priority.value}": 0 for priority in TaskPriority}
+        counters.update({
+            "open_amounts": {},
+            "documents_needing_review": 0,
+            "documents_processing": 0,
+        })
+        return counters
@@ -0,0 +1,138 @@
+"""
+Device Token Service for managing FCM registration tokens
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+
+from ..models.device_token import DeviceToken
+from ..models.user import User
+from .push_notification_service import MulticastResult
+
+
+class DeviceTokenService:
+    """Service for registering device tokens and pruning dead ones"""
+
+    def register_token(
+        self,
+        user: User,
+        token: str,
+        db: Session,
+        platform: Optional[str] = None
+    ) -> DeviceToken:
+        """
+        Register a device token for a user (or refresh an existing one)
+
+        A token belongs to exactly one device, so if it was registered by
+        another account before (e.g. re-login on a shared phone) it moves over.
+
+        Args:
+            user: Owner of the device
+            token: FCM registration token
+            db: Database session
+            platform: Optional platform (android, ios, web)
+
+        Returns:
+            The stored DeviceToken
+        """
+        device_token = db.query(DeviceToken).filter(DeviceToken.token == token).first()
+
+        if device_token:
+            device_token.user_id = user.id
+            device_token.failure_count = 0
+            device_token.last_seen = datetime.utcnow()
+            if platform:
+                device_token.platform = platform
+        else:
+            device_token = DeviceToken(
+                user_id=user.id,
+                token=token,
+                platform=platform,
+            )
+            db.add(device_token)
+
+        db.commit()
+        return device_token
+
+    def unregister_token(
+        self,
+        user: User,
+        db: Session,
+        token: Optional[str] = None
+    ) -> int:
+        """
+        Remove a device token of a user, or all of them if no token is given
+
+        Returns:
+            Number of tokens removed
+        """
+        query = db.query(DeviceToken).filter(DeviceToken.user_id == user.id)
+        if token:
+            query = query.filter(DeviceToken.token == token)
+
+        count = query.delete(synchronize_session=False)
+        db.commit()
+
+        return count
+
+    def get_tokens_for_users(
+        self,
+        user_ids: Iterable,
+        db: Session
+    ) -> Dict:
+        """
+        Load the device tokens of many users in one query
+
+        Returns:
+            Dictionary mapping user_id to a list of tokens
+        """
+        user_ids = list(set(user_ids))
+        tokens: Dict = {user_id: [] for user_id in user_ids}
+        if not user_ids:
+            return tokens
+
+        rows = (
+            db.query(DeviceToken.user_id, DeviceToken.token)
+            .filter(DeviceToken.user_id.in_(user_ids))
+            .all()
+        )
+        for user_id, token in rows:
+            tokens[user_id].append(token)
+
+        return tokens
+
+    def apply_push_result(self, result: MulticastResult, db: Session) -> List[str]:
+        """
+        Record delivery outcome: refresh live tokens, count transient
+        failures and delete tokens FCM reported as permanently dead
+
+        Returns:
+            Tokens that were removed
+        """
+        now = datetime.utcnow()
+
+        if result.delivered:
+            db.query(DeviceToken).filter(
+                DeviceToken.token.in_(result.delivered)
+            ).update(
+                {DeviceToken.last_seen: now, DeviceToken.failure_count: 0},
+                synchronize_session=False
+            )
+
+        if result.failed:
+            db.query(DeviceToken).filter(
+                DeviceToken.token.in_(result.failed)
+            ).update(
+                {DeviceToken.failure_count: DeviceToken.failure_count + 1},
+                synchronize_session=False
+            )
+
+        if result.dead:
+            db.query(DeviceToken).filter(
+                DeviceToken.token.in_(result.dead)
+            ).delete(synchronize_session=False)
+
+        db.commit()
+
+        return result.dead
@@ -0,0 +1,175 @@
+"""
+Document Metadata Service
+Promotes frequently filtered doc_metadata fields to typed document columns
+"""
+
+from sqlalchemy.orm import Session
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Optional
+import logging
+import re
+
+from ..models.document import Document
+
+logger = logging.getLogger(__name__)
+
+# Documents updated per backfill transaction
+BACKFILL_BATCH_SIZE = 500
+
+# Largest amount that fits Document.amount (Numeric(12, 2))
+MAX_AMOUNT = Decimal("9999999999.99")
+
+# A single separator kind followed by groups of exactly three digits is a
+# thousands separator, never a decimal one: 1.234, 12,500, 1.234.567
+THOUSANDS_PATTERN = re.compile(r"^[+-]?[1-9]\d{0,2}([.,])\d{3}(\1\d{3})*$")
+
+
+def _parse_amount(value: Any) -> Optional[Decimal]:
+    """
+    Parse an AI-extracted amount (number or text like '1.234,56 €')
+
+    Not rounded yet, so extract_promoted_fields can tell when the value
+    had more than two decimals.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+
+    if isinstance(value, str):
+        text = value.replace("€", "").replace("EUR", "").replace(" ", "").strip()
+        if "," in text and "." in text:
+            # The later separator is the decimal one: 1.234,56 or 1,234.56
+            if text.rfind(",") > text.rfind("."):
+                text = text.replace(".", "").replace(",", ".")
+            else:
+                text = text.replace(",", "")
+        elif THOUSANDS_PATTERN.match(text):
+            # Only groups of three digits: 1.234 or 12,500 (German invoices)
+            text = text.replace(".", "").replace(",", "")
+        else:
+            text = text.replace(",", ".")
+        value = text
+
+    try:
+        amount = Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+
+    if not amount.is_finite() or abs(amount) > MAX_AMOUNT:
+        return None
+    return amount
+
+
+def _parse_due_date(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+
+    for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _sender_name(sender: Any) -> Optional[str]:
+    if isinstance(sender, dict):
+        sender = sender.get("name")
+    if not isinstance(sender, str) or not sender.strip():
+        return None
+    return sender.strip()[:255]
+
+
+def extract_promoted_fields(metadata: Optional[Dict]) -> Dict:
+    """
+    Compute the typed document columns from AI-extracted metadata
+
+    Values that are missing or can't be parsed become None, so stale values
+    are cleared when the metadata changes. Amounts that had to be rounded
+    are flagged for review.
+
+    Args:
+        metadata: doc_metadata of a document
+
+    Returns:
+        Dictionary with amount, currency, due_date, sender_name and needs_review
+    """
+    metadata = metadata or {}
+    currency = metadata.get("currency")
+
+    raw_amount = _parse_amount(metadata.get("amount"))
+    amount = raw_amount.quantize(Decimal("0.01")) if raw_amount is not None else None
+
+    return {
+        "amount": amount,
+        "currency": currency.strip().upper()[:3] if isinstance(currency, str) and currency.strip() else None,
+        "due_date": _parse_due_date(metadata.get("due_date")),
+        "sender_name": _sender_name(metadata.get("sender")),
+        # More than two decimals (e.g. 1.234 from a misread "1.234") is ambiguous
+        "needs_review": bool(metadata.get("qa_needs_review", False)) or amount != raw_amount,
+    }
+
+
+def apply_promoted_fields(document: Document):
+    """Update the typed columns of a document from its doc_metadata"""
+    for field, value in extract_promoted_fields(document.doc_metadata).items():
+        setattr(document, field, value)
+
+
+class DocumentMetadataService:
+    """Service for keeping promoted metadata columns in line with doc_metadata"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def backfill(self, batch_size: int = BACKFILL_BATCH_SIZE) -> Dict:
+        """
+        Populate the promoted columns of all existing documents
+
+        Walks the documents table in id order, one transaction per batch,
+        so it can run next to normal traffic and be restarted at any time.
+
+        Args:
+            batch_size: Documents per transaction
+
+        Returns:
+            Dictionary with scanned/updated counts
+        """
+        stats = {"scanned": 0, "updated": 0}
+        last_id = None
+
+        while True:
+            query = self.db.query(
+                Document.id,
+                Document.doc_metadata,
+                Document.amount,
+                Document.currency,
+                Document.due_date,
+                Document.sender_name,
+                Document.needs_review,
+            )
+            if last_id is not None:
+                query = query.filter(Document.id > last_id)
+            rows = query.order_by(Document.id).limit(batch_size).all()
+
+            if not rows:
+                break
+
+            now = datetime.utcnow()
+            updates = []
+            for row in rows:
+                fields = extract_promoted_fields(row.doc_metadata)
+                if any(getattr(row, field) != value for field, value in fields.items()):
+                    # updated_at too, so delta sync clients pick up the new columns
+                    updates.append({"id": row.id, **fields, "updated_at": now})
+
+            if updates:
+                self.db.bulk_update_mappings(Document, updates)
+            self.db.commit()
+
+            stats["scanned"] += len(rows)
+            stats["updated"] += len(updates)
+            last_id = rows[-1].id
+
+        logger.info(f"Backfilled promoted document metadata: {stats}")
+        return stats
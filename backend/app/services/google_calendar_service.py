@@ -4,53 +4,194 @@ Google Calendar API Service
 Handles Google Calendar API operations using OAuth2 authentication.
 """
 
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import asyncio
+import json
 import logging
+import random
+import threading
+import weakref
 
+import httplib2
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
 from ..core.config import settings
+from .calendar_io import run_blocking
 
 logger = logging.getLogger(__name__)
 
+# Window fetched on the first (full) sync of a calendar
+FULL_SYNC_LOOKBACK_DAYS = 30
+
+# Requests per batch HTTP call (Google allows up to 50 for Calendar)
+BATCH_SIZE = 50
+
+# Retries of rate-limited / failed batch items, with exponential backoff
+BATCH_MAX_RETRIES = 5
+BATCH_RETRY_BASE_DELAY = 1.0  # seconds
+BATCH_RETRY_MAX_DELAY = 32.0  # seconds
+
+# 403 reasons that mean "slow down" rather than "forbidden"
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+# Access tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Integrations whose credentials are kept in memory
+CREDENTIALS_CACHE_SIZE = 256
+
+# integration id -> credentials, most recently used last
+_credentials_cache: "OrderedDict[str, Credentials]" = OrderedDict()
+_credentials_cache_lock = threading.Lock()
+
+# Per I/O thread: credentials -> authorized HTTP client. httplib2.Http is not
+# thread-safe, so requests are never executed through a shared one.
+_thread_state = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _discovery_document() -> Dict:
+    """Calendar v3 discovery document bundled with googleapiclient, parsed once per process"""
+    return json.loads(get_static_doc('calendar', 'v3'))
+
+
+class SyncTokenExpiredError(Exception):
+    """Google rejected the stored sync token (HTTP 410), a full resync is needed"""
+
+
+def _thread_http(credentials: Credentials) -> AuthorizedHttp:
+    """Authorized HTTP client of the current thread for the given credentials"""
+    clients = getattr(_thread_state, 'clients', None)
+    if clients is None:
+        clients = _thread_state.clients = weakref.WeakKeyDictionary()
+
+    http = clients.get(credentials)
+    if http is None:
+        http = clients[credentials] = AuthorizedHttp(credentials, http=httplib2.Http())
+    return http
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed request should be retried after a backoff"""
+    if not isinstance(error, HttpError):
+        return False
+
+    status = error.resp.status
+    if status == 429 or status >= 500:
+        return True
+    if status == 403:
+        details = getattr(error, 'error_details', None) or []
+        return any(
+            isinstance(detail, dict) and detail.get('reason') in RATE_LIMIT_REASONS
+            for detail in details
+        )
+    return False
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC, matching our DateTime columns"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 class GoogleCalendarService:
     """Service for Google Calendar API operations"""
 
     SCOPES = ['https://www.googleapis.com/auth/calendar']
 
-    def __init__(self, credentials_dict: Dict):
+    def __init__(self, credentials_dict: Dict, cache_key: Optional[str] = None):
         """
         Initialize Google Calendar Service with OAuth credentials
 
         Args:
             credentials_dict: Dictionary containing access_token, refresh_token, etc.
+            cache_key: Integration ID; reuses the (refreshed) credentials of
+                earlier syncs of the same integration in this process
         """
+        self.cache_key = cache_key
+        self._stored_token = credentials_dict.get('access_token')
+        self.service = None
+
+        with _credentials_cache_lock:
+            cached = _credentials_cache.get(cache_key) if cache_key else None
+            if cached:
+                _credentials_cache.move_to_end(cache_key)
+
+        # A different refresh token means the user re-authorized; start over
+        if cached and cached.refresh_token == credentials_dict.get('refresh_token'):
+            self.credentials = cached
+            return
+
+        expiry = credentials_dict.get('expiry')
         self.credentials = Credentials(
             token=credentials_dict.get('access_token'),
             refresh_token=credentials_dict.get('refresh_token'),
             token_uri='https://oauth2.googleapis.com/token',
             client_id=settings.GOOGLE_CLIENT_ID,
             client_secret=settings.GOOGLE_CLIENT_SECRET,
-            scopes=self.SCOPES
+            scopes=self.SCOPES,
+            expiry=datetime.fromisoformat(expiry) if expiry else None
         )
-        self.service = None
 
-    def _get_service(self):
-        """Get or refresh Google Calendar service"""
-        if self.service is None:
-            # Refresh token if expired
-            if self.credentials.expired and self.credentials.refresh_token:
-                self.credentials.refresh(Request())
+        if cache_key:
+            with _credentials_cache_lock:
+                _credentials_cache[cache_key] = self.credentials
+                _credentials_cache.move_to_end(cache_key)
+                while len(_credentials_cache) > CREDENTIALS_CACHE_SIZE:
+                    _credentials_cache.popitem(last=False)
+
+    def _needs_refresh(self) -> bool:
+        """Whether the access token is missing or about to expire"""
+        if not self.credentials.refresh_token:
+            return False
+        if not self.credentials.token:
+            return True
+
+        expiry = self.credentials.expiry
+        return expiry is not None and expiry - TOKEN_REFRESH_MARGIN <= datetime.utcnow()
+
+    def _refresh_credentials(self):
+        """Refresh the access token (blocking)"""
+        self.credentials.refresh(Request())
+        logger.debug(f"Refreshed Google access token of integration {self.cache_key}")
+
+    def _build_service(self):
+        """Build the API client from the bundled discovery document (no network)"""
+        return build_from_document(_discovery_document(), credentials=self.credentials)
+
+    async def _get_service(self):
+        """
+        Get the API client, refreshing the token before it expires
 
-            self.service = build('calendar', 'v3', credentials=self.credentials)
+        The client only builds requests; they are sent with _execute() on
+        the I/O thread's own HTTP connection.
+        """
+        if self._needs_refresh():
+            await run_blocking(self._refresh_credentials)
+
+        if self.service is None:
+            self.service = self._build_service()
 
         return self.service
 
+    def _execute(self, request):
+        """Send a request or batch (blocking) over this thread's HTTP client"""
+        return request.execute(http=_thread_http(self.credentials))
+
+    @property
+    def credentials_changed(self) -> bool:
+        """Whether the access token differs from the stored one and needs to be saved"""
+        return self.credentials.token != self._stored_token
+
     def get_updated_credentials(self) -> Dict:
         """
         Get updated credentials (including refreshed access token)
@@ -63,6 +204,7 @@ class GoogleCalendarService:
             'refresh_token': self.credentials.refresh_token,
             'token_uri': self.credentials.token_uri,
             'scopes': self.credentials.scopes,
+            'expiry': self.credentials.expiry.isoformat() if self.credentials.expiry else None,
         }
 
     async def list_calendars(self) -> List[Dict]:
@@ -73,8 +215,8 @@ class GoogleCalendarService:
             List of calendar dictionaries with id, name, description
         """
         try:
-            service = self._get_service()
-            calendar_list = service.calendarList().list().execute()
+            service = await self._get_service()
+            calendar_list = await run_blocking(self._execute, service.calendarList().list())
 
             calendars = []
             for calendar in calendar_list.get('items', []):
@@ -106,13 +248,13 @@ class GoogleCalendarService:
             calendar_id: Calendar ID (default: 'primary')
             start_date: Start date filter
             end_date: End date filter
-            max_results: Maximum number of events to return
+            max_results: Events per page (all pages are fetched)
 
         Returns:
             List of event dictionaries
         """
         try:
-            service = self._get_service()
+            service = await self._get_service()
 
             # Default to 30 days if no dates provided
             if not start_date:
@@ -124,18 +266,27 @@ class GoogleCalendarService:
             time_min = start_date.isoformat() + 'Z'
             time_max = end_date.isoformat() + 'Z'
 
-            events_result = service.events().list(
-                calendarId=calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
             events = []
-            for event in events_result.get('items', []):
-                events.append(self._parse_event(event))
+            page_token = None
+
+            # Follow nextPageToken so large calendars aren't truncated
+            while True:
+                events_result = await run_blocking(self._execute, service.events().list(
+                    calendarId=calendar_id,
+                    timeMin=time_min,
+                    timeMax=time_max,
+                    maxResults=max_results,
+                    singleEvents=True,
+                    orderBy='startTime',
+                    pageToken=page_token
+                ))
+
+                for event in events_result.get('items', []):
+                    events.append(self._parse_event(event))
+
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    break
 
             return events
 
@@ -143,6 +294,131 @@ class GoogleCalendarService:
             logger.error(f"Error fetching Google Calendar events: {e}")
             raise Exception(f"Failed to fetch events: {e}")
 
+    async def list_event_changes(
+        self,
+        calendar_id: str = 'primary',
+        sync_token: Optional[str] = None,
+        page_size: int = 250
+    ) -> Dict:
+        """
+        Fetch events changed since the last sync
+
+        Without a sync token this is a full sync starting FULL_SYNC_LOOKBACK_DAYS
+        ago; with one, Google only returns events created, updated or deleted
+        since the token was issued. All pages are followed.
+
+        Args:
+            calendar_id: Calendar ID (default: 'primary')
+            sync_token: nextSyncToken of the previous sync
+            page_size: Events per page
+
+        Returns:
+            Dictionary with 'events' (parsed), 'deleted' (event IDs),
+            'next_sync_token' and 'time_min' (start of the window of a full
+            sync, None for an incremental one)
+
+        Raises:
+            SyncTokenExpiredError: If the sync token is no longer valid
+        """
+        service = await self._get_service()
+
+        params = {
+            'calendarId': calendar_id,
+            'maxResults': page_size,
+            'singleEvents': True,
+        }
+        time_min = None
+        if sync_token:
+            params['syncToken'] = sync_token
+        else:
+            time_min = datetime.utcnow() - timedelta(days=FULL_SYNC_LOOKBACK_DAYS)
+            params['timeMin'] = time_min.isoformat() + 'Z'
+
+        events = []
+        deleted = []
+        page_token = None
+
+        while True:
+            try:
+                response = await run_blocking(self._execute, service.events().list(pageToken=page_token, **params))
+            except HttpError as e:
+                if e.resp.status == 410:
+                    raise SyncTokenExpiredError(f"Sync token for calendar {calendar_id} expired")
+                logger.error(f"Error fetching Google Calendar changes: {e}")
+                raise Exception(f"Failed to fetch event changes: {e}")
+
+            for item in response.get('items', []):
+                if item.get('status') == 'cancelled':
+                    deleted.append(item['id'])
+                else:
+                    events.append(self._parse_event(item))
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        return {
+            'events': events,
+            'deleted': deleted,
+            'next_sync_token': response.get('nextSyncToken'),
+            'time_min': time_min,
+        }
+
+    async def watch_events(
+        self,
+        calendar_id: str,
+        channel_id: str,
+        address: str,
+        token: str,
+        ttl_seconds: Optional[int] = None
+    ) -> Dict:
+        """
+        Open a push notification channel for changes to a calendar's events
+
+        Args:
+            calendar_id: Calendar ID
+            channel_id: Our unique ID for the channel
+            address: HTTPS URL Google posts notifications to
+            token: Secret echoed back in the X-Goog-Channel-Token header
+            ttl_seconds: Requested lifetime (Google may grant less)
+
+        Returns:
+            Dictionary with 'resource_id' and 'expires_at' (naive UTC)
+        """
+        service = await self._get_service()
+
+        body = {
+            'id': channel_id,
+            'type': 'web_hook',
+            'address': address,
+            'token': token,
+        }
+        if ttl_seconds:
+            body['params'] = {'ttl': str(ttl_seconds)}
+
+        try:
+            channel = await run_blocking(self._execute, service.events().watch(calendarId=calendar_id, body=body))
+        except HttpError as e:
+            logger.error(f"Error opening Google Calendar watch channel: {e}")
+            raise Exception(f"Failed to watch calendar: {e}")
+
+        return {
+            'resource_id': channel['resourceId'],
+            'expires_at': datetime.utcfromtimestamp(int(channel['expiration']) / 1000),
+        }
+
+    async def stop_channel(self, channel_id: str, resource_id: str):
+        """Stop a push notification channel"""
+        service = await self._get_service()
+
+        try:
+            await run_blocking(self._execute, service.channels().stop(body={'id': channel_id, 'resourceId': resource_id}))
+        except HttpError as e:
+            # Already expired or stopped
+            if e.resp.status != 404:
+                logger.error(f"Error stopping Google Calendar watch channel: {e}")
+                raise Exception(f"Failed to stop channel: {e}")
+
     async def create_event(
         self,
         calendar_id: str,
@@ -160,31 +436,14 @@ class GoogleCalendarService:
             Created event dictionary
         """
         try:
-            service = self._get_service()
+            service = await self._get_service()
 
-            event_body = {
-                'summary': title,
-                'description': description or '',
-                'location': location or '',
-            }
+            event_body = self._event_body(title, start_time, end_time, description, location, all_day)
 
-            if all_day:
-                event_body['start'] = {'date': start_time.date().isoformat()}
-                event_body['end'] = {'date': end_time.date().isoformat()}
-            else:
-                event_body['start'] = {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': 'UTC',
-                }
-                event_body['end'] = {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': 'UTC',
-                }
-
-            created_event = service.events().insert(
+            created_event = await run_blocking(self._execute, service.events().insert(
                 calendarId=calendar_id,
                 body=event_body
-            ).execute()
+            ))
 
             return self._parse_event(created_event)
 
@@ -210,13 +469,13 @@ class GoogleCalendarService:
             Updated event dictionary
         """
         try:
-            service = self._get_service()
+            service = await self._get_service()
 
             # Fetch existing event
-            event = service.events().get(
+            event = await run_blocking(self._execute, service.events().get(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
 
             # Update fields
             if title is not None:
@@ -240,11 +499,11 @@ class GoogleCalendarService:
                         'timeZone': 'UTC',
                     }
 
-            updated_event = service.events().update(
+            updated_event = await run_blocking(self._execute, service.events().update(
                 calendarId=calendar_id,
                 eventId=event_id,
                 body=event
-            ).execute()
+            ))
 
             return self._parse_event(updated_event)
 
@@ -255,16 +514,120 @@ class GoogleCalendarService:
     async def delete_event(self, calendar_id: str, event_id: str):
         """Delete an event from Google Calendar"""
         try:
-            service = self._get_service()
-            service.events().delete(
+            service = await self._get_service()
+            await run_blocking(self._execute, service.events().delete(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
 
         except HttpError as e:
             logger.error(f"Error deleting Google Calendar event: {e}")
             raise Exception(f"Failed to delete event: {e}")
 
+    async def push_events_batch(self, calendar_id: str, items: List[Dict]) -> Dict[str, Dict]:
+        """
+        Create or update many events using batch HTTP requests
+
+        Items are sent BATCH_SIZE at a time. Items with an 'event_id' are
+        patched, the others inserted. Items that fail with a rate limit
+        (403/429) or a server error are retried with exponential backoff.
+
+        Args:
+            calendar_id: Calendar ID
+            items: Dictionaries with 'key' (caller's identifier), optional
+                'event_id', and title, start_time, end_time, description,
+                location, all_day
+
+        Returns:
+            Dictionary key -> {'event': parsed event} or {'error': exception}
+        """
+        if not items:
+            return {}
+
+        service = await self._get_service()
+        results: Dict[str, Dict] = {}
+        pending = list(items)
+
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            retry = []
+
+            for i in range(0, len(pending), BATCH_SIZE):
+                chunk = {item['key']: item for item in pending[i:i + BATCH_SIZE]}
+
+                def callback(request_id, response, exception):
+                    if exception is None:
+                        results[request_id] = {'event': self._parse_event(response)}
+                    elif _is_retryable(exception) and attempt < BATCH_MAX_RETRIES:
+                        retry.append(chunk[request_id])
+                    else:
+                        results[request_id] = {'error': exception}
+
+                batch = service.new_batch_http_request(callback=callback)
+                for key, item in chunk.items():
+                    body = self._event_body(
+                        item['title'], item['start_time'], item['end_time'],
+                        item.get('description'), item.get('location'), item.get('all_day', False)
+                    )
+                    if item.get('event_id'):
+                        request = service.events().patch(
+                            calendarId=calendar_id, eventId=item['event_id'], body=body
+                        )
+                    else:
+                        request = service.events().insert(calendarId=calendar_id, body=body)
+                    batch.add(request, request_id=key)
+
+                try:
+                    await run_blocking(self._execute, batch)
+                except HttpError as e:
+                    # The batch call itself failed, none of its items were applied
+                    if _is_retryable(e) and attempt < BATCH_MAX_RETRIES:
+                        retry.extend(chunk.values())
+                    else:
+                        for key in chunk:
+                            results[key] = {'error': e}
+
+            if not retry:
+                break
+
+            delay = min(BATCH_RETRY_BASE_DELAY * 2 ** attempt, BATCH_RETRY_MAX_DELAY)
+            delay = random.uniform(delay / 2, delay)
+            logger.warning(f"{len(retry)} Google Calendar request(s) rate limited, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            pending = retry
+
+        return results
+
+    def _event_body(
+        self,
+        title: str,
+        start_time: datetime,
+        end_time: datetime,
+        description: Optional[str],
+        location: Optional[str],
+        all_day: bool
+    ) -> Dict:
+        """Build a Google Calendar event resource from our fields"""
+        event_body = {
+            'summary': title,
+            'description': description or '',
+            'location': location or '',
+        }
+
+        if all_day:
+            event_body['start'] = {'date': start_time.date().isoformat()}
+            event_body['end'] = {'date': end_time.date().isoformat()}
+        else:
+            event_body['start'] = {
+                'dateTime': start_time.isoformat(),
+                'timeZone': 'UTC',
+            }
+            event_body['end'] = {
+                'dateTime': end_time.isoformat(),
+                'timeZone': 'UTC',
+            }
+
+        return event_body
+
     def _parse_event(self, event: Dict) -> Dict:
         """
         Parse Google Calendar event to our format
@@ -286,13 +649,13 @@ class GoogleCalendarService:
             all_day = True
         else:
             # Timed event
-            start_time = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00'))
+            start_time = _to_naive_utc(datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00')))
+            end_time = _to_naive_utc(datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00')))
             all_day = False
 
         # Get last modified time
         updated = event.get('updated')
-        last_modified = datetime.fromisoformat(updated.replace('Z', '+00:00')) if updated else datetime.utcnow()
+        last_modified = _to_naive_utc(datetime.fromisoformat(updated.replace('Z', '+00:00'))) if updated else datetime.utcnow()
 
         return {
             'id': event['id'],
@@ -0,0 +1,138 @@
+"""
+Google Watch Service
+Manages Google Calendar push notification channels (events.watch) of integrations
+"""
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import List, Optional
+import logging
+import secrets
+import uuid
+
+from ..core.config import settings
+from ..models.integration import Integration, IntegrationType
+from .google_calendar_service import GoogleCalendarService
+
+logger = logging.getLogger(__name__)
+
+# Backoff after failed channel registrations (seconds), doubling per failure
+WATCH_RETRY_BASE_DELAY = 15 * 60
+WATCH_RETRY_MAX_DELAY = 24 * 60 * 60
+
+
+class GoogleWatchService:
+    """Service for registering, renewing and resolving Google watch channels"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @property
+    def enabled(self) -> bool:
+        """Push notifications need a public HTTPS receiver"""
+        return bool(settings.GOOGLE_WEBHOOK_URL)
+
+    def get_channels_to_renew(self) -> List[Integration]:
+        """
+        Google integrations without a channel or with one about to expire,
+        except the ones backing off after failed attempts
+        """
+        now = datetime.utcnow()
+        renew_before = now + timedelta(hours=settings.GOOGLE_WATCH_RENEW_BEFORE_HOURS)
+
+        return self.db.query(Integration).filter(
+            Integration.integration_type == IntegrationType.GOOGLE_CALENDAR,
+            Integration.auto_sync.is_(True),
+            Integration.enabled.is_(True),
+            Integration.credentials.isnot(None),
+            or_(Integration.watch_expires_at.is_(None), Integration.watch_expires_at < renew_before),
+            or_(Integration.watch_retry_after.is_(None), Integration.watch_retry_after <= now)
+        ).all()
+
+    def record_failure(self, integration: Integration, error: Exception):
+        """
+        Back off after a failed channel registration
+
+        Retries wait WATCH_RETRY_BASE_DELAY, doubling per failure in a row up
+        to WATCH_RETRY_MAX_DELAY, so a permanently failing integration isn't
+        sent to Google on every beat run.
+        """
+        integration.watch_failures = (integration.watch_failures or 0) + 1
+        delay = min(WATCH_RETRY_MAX_DELAY, WATCH_RETRY_BASE_DELAY * 2 ** (integration.watch_failures - 1))
+        integration.watch_retry_after = datetime.utcnow() + timedelta(seconds=delay)
+        self.db.commit()
+
+        logger.warning(
+            f"Watch channel of integration {integration.id} failed {integration.watch_failures} time(s) "
+            f"({error}), next attempt after {integration.watch_retry_after}"
+        )
+
+    async def renew_channel(self, integration: Integration):
+        """
+        Open a new channel for an integration and stop the previous one
+
+        The new channel is opened first so no change falls between the two.
+        """
+        google_service = GoogleCalendarService(integration.credentials, cache_key=str(integration.id))
+        calendar_id = integration.config.get('calendar_id', 'primary')
+
+        channel_id = str(uuid.uuid4())
+        token = secrets.token_urlsafe(32)
+        channel = await google_service.watch_events(
+            calendar_id=calendar_id,
+            channel_id=channel_id,
+            address=settings.GOOGLE_WEBHOOK_URL,
+            token=token,
+            ttl_seconds=settings.GOOGLE_WATCH_TTL_HOURS * 3600
+        )
+
+        old_channel = (integration.watch_channel_id, integration.watch_resource_id)
+
+        integration.watch_channel_id = channel_id
+        integration.watch_resource_id = channel['resource_id']
+        integration.watch_token = token
+        integration.watch_expires_at = channel['expires_at']
+        integration.watch_failures = 0
+        integration.watch_retry_after = None
+        if google_service.credentials_changed:
+            integration.credentials = google_service.get_updated_credentials()
+        self.db.commit()
+
+        logger.info(f"Watching Google Calendar of integration {integration.id} until {channel['expires_at']}")
+
+        if all(old_channel):
+            try:
+                await google_service.stop_channel(*old_channel)
+            except Exception as e:
+                # It expires on its own; notifications for it are ignored meanwhile
+                logger.warning(f"Failed to stop old watch channel of integration {integration.id}: {e}")
+
+    def get_integration_for_notification(
+        self,
+        channel_id: Optional[str],
+        token: Optional[str],
+        resource_id: Optional[str]
+    ) -> Optional[Integration]:
+        """
+        Resolve a push notification to its integration
+
+        Returns:
+            The integration, or None if the channel is unknown, stale or the
+            token doesn't match
+        """
+        if not channel_id or not token:
+            return None
+
+        integration = self.db.query(Integration).filter(
+            Integration.watch_channel_id == channel_id
+        ).first()
+
+        if (
+            not integration
+            or not secrets.compare_digest(integration.watch_token or "", token)
+            or integration.watch_resource_id != resource_id
+        ):
+            return None
+
+        return integration
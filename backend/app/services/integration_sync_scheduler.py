@@ -0,0 +1,132 @@
+"""
+Integration Sync Scheduler
+Decides which integrations are due for a background sync and leases them to a worker
+"""
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import List, Optional
+from urllib.parse import urlparse
+import logging
+import random
+
+from ..core.config import settings
+from ..models.integration import Integration, IntegrationType
+
+logger = logging.getLogger(__name__)
+
+# Sync interval used when an integration has none configured
+DEFAULT_SYNC_INTERVAL_MINUTES = 15
+
+# Concurrent syncs per provider within one scheduler run
+PROVIDER_CONCURRENCY = {
+    IntegrationType.GOOGLE_CALENDAR: 10,
+    IntegrationType.CALDAV: 8,
+    IntegrationType.OUTLOOK_CALENDAR: 4,
+}
+
+# Concurrent syncs against the same server (e.g. one Nextcloud instance)
+HOST_CONCURRENCY = 2
+
+GOOGLE_API_HOST = "www.googleapis.com"
+
+
+def get_sync_host(integration: Integration) -> str:
+    """Host an integration talks to, used for per-host concurrency caps"""
+    if integration.integration_type == IntegrationType.GOOGLE_CALENDAR:
+        return GOOGLE_API_HOST
+
+    url = (integration.config or {}).get('url') or ""
+    return urlparse(url).hostname or url or str(integration.id)
+
+
+def next_sync_time(integration: Integration, now: Optional[datetime] = None) -> datetime:
+    """
+    Compute when an integration should be synced next
+
+    A random offset spreads integrations with the same interval over time,
+    so they don't all hit the providers in the same scheduler run. While a
+    Google push channel is open, changes trigger syncs and polling is only
+    a rare fallback.
+    """
+    now = now or datetime.utcnow()
+    interval = integration.sync_interval_minutes or DEFAULT_SYNC_INTERVAL_MINUTES
+    if integration.watch_expires_at and integration.watch_expires_at > now:
+        interval = max(interval, settings.GOOGLE_WATCH_FALLBACK_SYNC_MINUTES)
+    jitter = random.uniform(0, min(settings.SYNC_JITTER_SECONDS, interval * 60 / 4))
+    return now + timedelta(minutes=interval, seconds=jitter)
+
+
+class IntegrationSyncScheduler:
+    """Service for claiming due integrations and leasing them while they sync"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _lease_free(self, now: datetime):
+        return or_(Integration.sync_lease_until.is_(None), Integration.sync_lease_until < now)
+
+    def claim_due_integrations(self, limit: Optional[int] = None) -> List[Integration]:
+        """
+        Lease the integrations that are due for a background sync
+
+        Due rows are selected through the next_sync_at index and locked with
+        SKIP LOCKED, so concurrent scheduler runs never claim the same
+        integration. Integrations whose lease expired (crashed worker) are
+        claimable again.
+
+        Args:
+            limit: Maximum number of integrations (default: SYNC_SCHEDULER_BATCH_SIZE)
+
+        Returns:
+            List of leased integrations, most overdue first
+        """
+        now = datetime.utcnow()
+        limit = limit or settings.SYNC_SCHEDULER_BATCH_SIZE
+
+        integrations = self.db.query(Integration).filter(
+            Integration.auto_sync.is_(True),
+            Integration.enabled.is_(True),
+            Integration.next_sync_at <= now,
+            self._lease_free(now)
+        ).order_by(
+            Integration.next_sync_at
+        ).limit(limit).with_for_update(skip_locked=True).all()
+
+        lease_until = now + timedelta(seconds=settings.SYNC_LEASE_SECONDS)
+        for integration in integrations:
+            integration.sync_lease_until = lease_until
+            integration.sync_status = "syncing"
+
+        self.db.commit()
+
+        if integrations:
+            logger.info(f"Claimed {len(integrations)} integration(s) for background sync")
+        return integrations
+
+    def acquire_lease(self, integration: Integration) -> bool:
+        """
+        Lease a single integration, e.g. for a manual sync
+
+        Returns:
+            False if a sync of this integration is already running
+        """
+        now = datetime.utcnow()
+
+        updated = self.db.query(Integration).filter(
+            Integration.id == integration.id,
+            self._lease_free(now)
+        ).update({
+            Integration.sync_lease_until: now + timedelta(seconds=settings.SYNC_LEASE_SECONDS),
+            Integration.sync_status: "syncing",
+        }, synchronize_session=False)
+        self.db.commit()
+
+        return updated == 1
+
+    def release_lease(self, integration: Integration):
+        """Release the lease after a sync and schedule the next one"""
+        integration.sync_lease_until = None
+        integration.next_sync_at = next_sync_time(integration)
+        self.db.commit()
@@ -3,12 +3,18 @@ Firebase Cloud Messaging (FCM) push notification service
 """
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 _firebase_initialized = False
 
+# FCM accepts at most 500 tokens per multicast request
+MULTICAST_BATCH_SIZE = 500
+
+# Lines listed in a digest body before it is summarized as "+N weitere"
+DIGEST_MAX_LINES = 5
+
 
 def _init_firebase() -> bool:
     global _firebase_initialized
@@ -32,8 +38,48 @@ def _init_firebase() -> bool:
         return False
 
 
+def _is_dead_token_error(error: Exception) -> bool:
+    """
+    Whether an FCM error means the token will never work again
+
+    UNREGISTERED (app uninstalled / token rotated) and INVALID_ARGUMENT
+    (malformed token) are permanent; everything else may be transient.
+    """
+    from firebase_admin import exceptions, messaging
+    return isinstance(error, (messaging.UnregisteredError, exceptions.InvalidArgumentError))
+
+
+class MulticastResult:
+    """Per-token outcome of a multicast push"""
+    def __init__(self):
+        self.delivered: List[str] = []
+        self.failed: List[str] = []  # Transient errors, token is kept
+        self.dead: List[str] = []  # Permanent errors, token should be removed
+
+    @property
+    def success_count(self) -> int:
+        return len(self.delivered)
+
+
 class PushNotificationService:
 
+    SEVERITY_LABELS = {
+        "info": "Erinnerung",
+        "warning": "Bald fällig",
+        "urgent": "Dringend",
+        "critical": "Kritisch – sofort handeln!",
+    }
+
+    def _android_config(self):
+        from firebase_admin import messaging
+        return messaging.AndroidConfig(
+            priority="high",
+            notification=messaging.AndroidNotification(
+                icon="notification_icon",
+                color="#10b981",
+            ),
+        )
+
     def send(
         self,
         fcm_token: str,
@@ -55,13 +101,7 @@ class PushNotificationService:
                 notification=messaging.Notification(title=title, body=body),
                 data={k: str(v) for k, v in (data or {}).items()},
                 token=fcm_token,
-                android=messaging.AndroidConfig(
-                    priority="high",
-                    notification=messaging.AndroidNotification(
-                        icon="notification_icon",
-                        color="#10b981",
-                    ),
-                ),
+                android=self._android_config(),
             )
             messaging.send(message)
             return True
@@ -70,18 +110,91 @@ class PushNotificationService:
             logger.error(f"FCM send failed (token={fcm_token[:20]}...): {e}")
             return False
 
-    def send_reminder(self, fcm_token: str, task_title: str, severity: str) -> bool:
-        severity_labels = {
-            "info": "Erinnerung",
-            "warning": "Bald fällig",
-            "urgent": "Dringend",
-            "critical": "Kritisch – sofort handeln!",
-        }
-        title = severity_labels.get(severity, "Erinnerung")
+    def send_multicast(
+        self,
+        fcm_tokens: List[str],
+        title: str,
+        body: str,
+        data: Optional[Dict] = None,
+    ) -> MulticastResult:
+        """
+        Send the same notification to all devices of a user in one batch.
+
+        Returns a MulticastResult that classifies every token as delivered,
+        failed (transient) or dead (UNREGISTERED / INVALID_ARGUMENT).
+        """
+        result = MulticastResult()
+        if not fcm_tokens:
+            return result
+
+        if not _init_firebase():
+            result.failed.extend(fcm_tokens)
+            return result
+
+        from firebase_admin import messaging
+
+        payload = {k: str(v) for k, v in (data or {}).items()}
+
+        for i in range(0, len(fcm_tokens), MULTICAST_BATCH_SIZE):
+            batch = fcm_tokens[i:i + MULTICAST_BATCH_SIZE]
+            message = messaging.MulticastMessage(
+                notification=messaging.Notification(title=title, body=body),
+                data=payload,
+                tokens=batch,
+                android=self._android_config(),
+            )
+
+            try:
+                response = messaging.send_each_for_multicast(message)
+            except Exception as e:
+                logger.error(f"FCM multicast failed ({len(batch)} tokens): {e}")
+                result.failed.extend(batch)
+                continue
+
+            for token, send_response in zip(batch, response.responses):
+                if send_response.success:
+                    result.delivered.append(token)
+                elif _is_dead_token_error(send_response.exception):
+                    logger.info(f"FCM token is dead (token={token[:20]}...): {send_response.exception}")
+                    result.dead.append(token)
+                else:
+                    logger.warning(f"FCM send failed (token={token[:20]}...): {send_response.exception}")
+                    result.failed.append(token)
+
+        return result
+
+    def send_reminder(self, fcm_tokens: List[str], task_title: str, severity: str) -> MulticastResult:
+        title = self.SEVERITY_LABELS.get(severity, "Erinnerung")
         body = task_title
-        return self.send(
-            fcm_token=fcm_token,
+        return self.send_multicast(
+            fcm_tokens=fcm_tokens,
             title=title,
             body=body,
             data={"severity": severity, "type": "reminder"},
         )
+
+    def send_digest(self, fcm_tokens: List[str], items: List[Tuple[str, str]]) -> MulticastResult:
+        """
+        Send several reminders as one notification
+
+        Args:
+            fcm_tokens: Devices of the user
+            items: (task_title, severity) pairs, most severe first
+        """
+        if len(items) == 1:
+            task_title, severity = items[0]
+            return self.send_reminder(fcm_tokens, task_title, severity)
+
+        top_severity = items[0][1]
+        title = f"{len(items)} Erinnerungen – {self.SEVERITY_LABELS.get(top_severity, 'Erinnerung')}"
+
+        lines = [f"• {task_title}" for task_title, _ in items[:DIGEST_MAX_LINES]]
+        if len(items) > DIGEST_MAX_LINES:
+            lines.append(f"+{len(items) - DIGEST_MAX_LINES} weitere")
+
+        return self.send_multicast(
+            fcm_tokens=fcm_tokens,
+            title=title,
+            body="\n".join(lines),
+            data={"severity": top_severity, "type": "reminder_digest", "count": len(items)},
+        )
@@ -0,0 +1,148 @@
+"""
+Reminder Reconciliation Service
+Keeps the pending reminders of tasks in line with their due date, priority and status
+"""
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Dict, List
+import logging
+
+from ..models.reminder import Reminder, ReminderStatus
+from ..models.task import Task, TaskStatus
+from .reminder_service import ReminderService
+
+logger = logging.getLogger(__name__)
+
+# Tasks in these states don't get reminders anymore
+INACTIVE_TASK_STATUSES = {TaskStatus.DONE, TaskStatus.CANCELLED}
+
+
+class ReminderReconciliationService:
+    """Service for diffing desired reminder schedules against stored reminders"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.reminder_service = ReminderService()
+
+    def reconcile_tasks(self, tasks: List[Task], commit: bool = True) -> Dict:
+        """
+        Bring the pending reminders of many tasks up to date in one transaction
+
+        Loads the existing pending reminders of all tasks with one query,
+        diffs them per (task, severity) against the desired schedule and
+        applies inserts, trigger updates and deletes as bulk operations.
+        Reminders that are already being retried are left alone as long as
+        their severity is still scheduled. Overdue tasks get an immediate
+        reminder only once per due date: if one was already sent (or
+        dead-lettered) for the current due date, nothing new is queued.
+
+        Args:
+            tasks: Tasks whose reminders should be reconciled
+            commit: Commit at the end (False to join the caller's transaction)
+
+        Returns:
+            Dictionary with created/updated/deleted counts
+        """
+        stats = {"created": 0, "updated": 0, "deleted": 0}
+        if not tasks:
+            return stats
+
+        tasks_by_id = {task.id: task for task in tasks}
+
+        existing: Dict = {}
+        pending = self.db.query(Reminder).filter(
+            Reminder.task_id.in_(list(tasks_by_id.keys())),
+            Reminder.status == ReminderStatus.PENDING
+        ).all()
+        for reminder in pending:
+            existing.setdefault(reminder.task_id, {}).setdefault(reminder.severity, []).append(reminder)
+
+        # Latest delivered (or given up) reminder per (task, severity)
+        finished = dict(
+            ((task_id, severity), trigger_at)
+            for task_id, severity, trigger_at in self.db.query(
+                Reminder.task_id, Reminder.severity, func.max(Reminder.trigger_at)
+            ).filter(
+                Reminder.task_id.in_([task.id for task in tasks if task.due_date]),
+                Reminder.status.in_([ReminderStatus.SENT, ReminderStatus.DEAD_LETTER])
+            ).group_by(Reminder.task_id, Reminder.severity)
+        )
+
+        now = datetime.utcnow()
+        inserts: List[Dict] = []
+        updates: List[Dict] = []
+        deletes: List = []
+
+        for task_id, task in tasks_by_id.items():
+            current = existing.get(task_id, {})
+
+            if task.status in INACTIVE_TASK_STATUSES:
+                desired = []
+            else:
+                desired = self.reminder_service.get_task_schedule(task)
+
+            for entry in desired:
+                severity = entry["severity"]
+                trigger_at = entry["trigger_at"]
+                reminders = current.pop(severity, [])
+
+                # Duplicates of the same severity are stale
+                keep = reminders[0] if reminders else None
+                deletes.extend(r.id for r in reminders[1:])
+
+                if trigger_at < now:
+                    if entry["days_before"] > 0:
+                        # Missed pre-deadline reminder: only keep it if it's exactly the one scheduled
+                        if keep and keep.trigger_at != trigger_at and not keep.attempts:
+                            deletes.append(keep.id)
+                        continue
+                    # Overdue task: fire now unless a reminder is already queued,
+                    # or one was already sent for the current due date
+                    last_finished = finished.get((task_id, severity))
+                    if keep is None and last_finished is not None and last_finished >= trigger_at:
+                        continue
+                    trigger_at = now
+
+                if keep is None:
+                    inserts.append({
+                        "task_id": task_id,
+                        "trigger_at": trigger_at,
+                        "severity": severity,
+                        "channels": self.reminder_service.DEFAULT_CHANNELS.get(severity, ["push"]),
+                        "status": ReminderStatus.PENDING,
+                        "attempts": 0,
+                        "created_at": now,
+                    })
+                elif not keep.attempts and keep.trigger_at != trigger_at and not (
+                    entry["days_before"] == 0 and keep.trigger_at <= now
+                ):
+                    updates.append({"id": keep.id, "trigger_at": trigger_at})
+
+            # Severities that are no longer scheduled
+            for reminders in current.values():
+                deletes.extend(r.id for r in reminders)
+
+        if deletes:
+            self.db.query(Reminder).filter(
+                Reminder.id.in_(deletes)
+            ).delete(synchronize_session=False)
+        if updates:
+            self.db.bulk_update_mappings(Reminder, updates)
+        if inserts:
+            self.db.bulk_insert_mappings(Reminder, inserts)
+
+        stats["created"] = len(inserts)
+        stats["updated"] = len(updates)
+        stats["deleted"] = len(deletes)
+
+        if commit:
+            self.db.commit()
+
+        logger.debug(f"Reconciled reminders of {len(tasks_by_id)} task(s): {stats}")
+        return stats
+
+    def reconcile_task(self, task: Task, commit: bool = True) -> Dict:
+        """Reconcile the pending reminders of a single task"""
+        return self.reconcile_tasks([task], commit=commit)
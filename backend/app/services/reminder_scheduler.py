@@ -0,0 +1,189 @@
+"""
+Reminder Scheduler
+Resolves reminder trigger times in the user's timezone and respects quiet hours
+"""
+
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import logging
+
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Local time at which reminders for date-only due dates fire
+DEFAULT_REMINDER_TIME = "09:00"
+
+# Memoized trigger times kept per schedule before the memo is reset
+MAX_RESOLVED_PER_SCHEDULE = 10000
+
+
+def _parse_time(value: Optional[str]) -> Optional[time]:
+    """Parse a 'HH:MM' preference value"""
+    if not value:
+        return None
+
+    try:
+        return datetime.strptime(value, "%H:%M").time()
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid time preference: {value!r}")
+        return None
+
+
+def _time_preference(value) -> Optional[str]:
+    """A 'HH:MM' preference as stored, None (logged) if it isn't a string"""
+    if value is None or isinstance(value, str):
+        return value
+
+    logger.warning(f"Ignoring invalid time preference: {value!r}")
+    return None
+
+
+class UserSchedule:
+    """
+    Precomputed scheduling context of one user
+
+    Instances are shared through get_user_schedule(), so the timezone lookup
+    and preference parsing happen once per distinct user configuration, and
+    resolved trigger times are memoized per (due_date, days_before).
+    """
+
+    def __init__(
+        self,
+        timezone_name: str,
+        quiet_start: Optional[str],
+        quiet_end: Optional[str],
+        reminder_time: Optional[str]
+    ):
+        try:
+            self.tz = ZoneInfo(timezone_name or "UTC")
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(f"Unknown timezone {timezone_name!r}, falling back to UTC")
+            self.tz = ZoneInfo("UTC")
+
+        self.quiet_start = _parse_time(quiet_start)
+        self.quiet_end = _parse_time(quiet_end)
+        self.reminder_time = _parse_time(reminder_time) or _parse_time(DEFAULT_REMINDER_TIME)
+        self._resolved: Dict[Tuple[datetime, int, bool], datetime] = {}
+
+    @property
+    def has_quiet_hours(self) -> bool:
+        return (
+            self.quiet_start is not None
+            and self.quiet_end is not None
+            and self.quiet_start != self.quiet_end
+        )
+
+    def _in_quiet_hours(self, local: time) -> bool:
+        if self.quiet_start < self.quiet_end:
+            return self.quiet_start <= local < self.quiet_end
+        # Window wraps midnight, e.g. 22:00 – 07:00
+        return local >= self.quiet_start or local < self.quiet_end
+
+    def _after_quiet_hours(self, local: datetime) -> datetime:
+        """Move a local datetime inside quiet hours to the end of the window"""
+        if not self.has_quiet_hours or not self._in_quiet_hours(local.time()):
+            return local
+
+        end = datetime.combine(local.date(), self.quiet_end)
+        if end <= local.replace(tzinfo=None):
+            end += timedelta(days=1)
+        return end.replace(tzinfo=self.tz)
+
+    def outside_quiet_hours(self, moment: datetime) -> datetime:
+        """
+        Move a time inside quiet hours to the end of the window
+
+        Args:
+            moment: Naive UTC time (e.g. a retry or send time)
+
+        Returns:
+            Naive UTC time, unchanged if outside quiet hours
+        """
+        local = moment.replace(tzinfo=dt_timezone.utc).astimezone(self.tz)
+        moved = self._after_quiet_hours(local)
+        if moved is local:
+            return moment
+        return moved.astimezone(dt_timezone.utc).replace(tzinfo=None)
+
+    def resolve(self, due_date: datetime, days_before: int, respect_quiet_hours: bool = True) -> datetime:
+        """
+        Compute the trigger time of a reminder
+
+        Date-only due dates (midnight) are read as a calendar day in the
+        user's timezone and fire at the preferred reminder time. Timed due
+        dates are naive UTC; the offset is applied on the local wall clock so
+        DST changes don't shift reminders by an hour.
+
+        Args:
+            due_date: Task due date (naive UTC)
+            days_before: Days before the due date
+            respect_quiet_hours: Move triggers out of quiet hours
+
+        Returns:
+            Trigger time as naive UTC, matching Reminder.trigger_at
+        """
+        key = (due_date, days_before, respect_quiet_hours)
+        cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+
+        if due_date.time() == time(0, 0):
+            local_day = due_date.date() - timedelta(days=days_before)
+            local = datetime.combine(local_day, self.reminder_time).replace(tzinfo=self.tz)
+        else:
+            local_due = due_date.replace(tzinfo=dt_timezone.utc).astimezone(self.tz)
+            local = (local_due.replace(tzinfo=None) - timedelta(days=days_before)).replace(tzinfo=self.tz)
+
+        if respect_quiet_hours:
+            local = self._after_quiet_hours(local)
+
+        trigger_at = local.astimezone(dt_timezone.utc).replace(tzinfo=None)
+        if len(self._resolved) >= MAX_RESOLVED_PER_SCHEDULE:
+            self._resolved.clear()
+        self._resolved[key] = trigger_at
+        return trigger_at
+
+
+@lru_cache(maxsize=1024)
+def _cached_schedule(
+    timezone_name: str,
+    quiet_start: Optional[str],
+    quiet_end: Optional[str],
+    reminder_time: Optional[str]
+) -> UserSchedule:
+    return UserSchedule(timezone_name, quiet_start, quiet_end, reminder_time)
+
+
+def get_user_schedule(user: Optional[User]) -> UserSchedule:
+    """
+    Get the (cached) schedule for a user
+
+    The cache is keyed by the user's settings rather than the user id, so
+    changing timezone or quiet hours takes effect immediately.
+
+    notification_preferences format (see schemas.user.NotificationPreferences):
+        {"quiet_hours": {"start": "22:00", "end": "07:00"}, "reminder_time": "09:00"}
+    """
+    if user is None:
+        return _cached_schedule("UTC", None, None, None)
+
+    # Free-form JSON: ignore values of the wrong shape instead of failing the whole batch
+    preferences = user.notification_preferences or {}
+    if not isinstance(preferences, dict):
+        logger.warning(f"Ignoring invalid notification preferences of user {user.id}: {preferences!r}")
+        preferences = {}
+
+    quiet_hours = preferences.get("quiet_hours") or {}
+    if not isinstance(quiet_hours, dict):
+        logger.warning(f"Ignoring invalid quiet hours of user {user.id}: {quiet_hours!r}")
+        quiet_hours = {}
+
+    return _cached_schedule(
+        user.timezone or "UTC",
+        _time_preference(quiet_hours.get("start")),
+        _time_preference(quiet_hours.get("end")),
+        _time_preference(preferences.get("reminder_time")),
+    )
@@ -3,11 +3,15 @@ Reminder Service for creating and managing reminders
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+import random
+from sqlalchemy.orm import Session, contains_eager
 
+from ..core.config import settings
 from ..models.reminder import Reminder, ReminderSeverity, ReminderStatus
 from ..models.task import Task
+from ..models.user import User
+from .reminder_scheduler import get_user_schedule
 
 
 class ReminderService:
@@ -42,11 +46,32 @@ class ReminderService:
         ReminderSeverity.INFO: ["push"],
     }
 
+    # Digest ordering, most severe first
+    SEVERITY_RANK = {
+        ReminderSeverity.CRITICAL: 0,
+        ReminderSeverity.URGENT: 1,
+        ReminderSeverity.WARNING: 2,
+        ReminderSeverity.INFO: 3,
+    }
+
+    # Delivery attempts before a reminder is moved to the dead-letter state
+    MAX_ATTEMPTS = {
+        ReminderSeverity.CRITICAL: 10,
+        ReminderSeverity.URGENT: 8,
+        ReminderSeverity.WARNING: 5,
+        ReminderSeverity.INFO: 3,
+    }
+
+    # Exponential backoff between delivery attempts (seconds)
+    RETRY_BASE_DELAY = 60
+    RETRY_MAX_DELAY = 6 * 60 * 60
+
     def create_reminders_for_task(
         self,
         task: Task,
         db: Session,
-        channels: Optional[List[str]] = None
+        channels: Optional[List[str]] = None,
+        user: Optional[User] = None
     ) -> List[Reminder]:
         """
         Create reminders for a task based on its priority and due date
@@ -55,31 +80,25 @@ class ReminderService:
             task: Task to create reminders for
             db: Database session
             channels: Custom notification channels (overrides defaults)
+            user: Owner of the task (default: task.user)
 
         Returns:
             List of created Reminder objects
         """
-        if not task.due_date:
-            # No due date, no reminders
-            return []
-
-        # Get reminder schedule for task priority
-        schedule = self.REMINDER_SCHEDULE.get(task.priority, self.REMINDER_SCHEDULE["medium"])
+        now = datetime.utcnow()
 
         created_reminders = []
 
-        for reminder_config in schedule:
-            days_before = reminder_config["days_before"]
-            severity = reminder_config["severity"]
-
-            # Calculate trigger time
-            trigger_at = task.due_date - timedelta(days=days_before)
+        for entry in self.get_task_schedule(task, user=user):
+            days_before = entry["days_before"]
+            severity = entry["severity"]
+            trigger_at = entry["trigger_at"]
 
             # Don't create reminders in the past
-            if trigger_at < datetime.utcnow():
+            if trigger_at < now:
                 # For overdue tasks, create immediate reminder
                 if days_before == 0:
-                    trigger_at = datetime.utcnow()
+                    trigger_at = now
                 else:
                     continue
 
@@ -105,6 +124,43 @@ class ReminderService:
 
         return created_reminders
 
+    def get_task_schedule(self, task: Task, user: Optional[User] = None) -> List[Dict]:
+        """
+        Resolve the reminder schedule of a task without creating anything
+
+        Trigger times are resolved in the user's timezone and moved out of
+        their quiet hours (critical reminders excepted). Entries in the past
+        are returned as well; callers decide how to handle them.
+
+        Args:
+            task: Task to compute the schedule for
+            user: Owner of the task (default: task.user)
+
+        Returns:
+            List of dicts with days_before, severity and trigger_at
+        """
+        if not task.due_date:
+            # No due date, no reminders
+            return []
+
+        # Get reminder schedule for task priority
+        schedule = self.REMINDER_SCHEDULE.get(task.priority, self.REMINDER_SCHEDULE["medium"])
+        user_schedule = get_user_schedule(user or task.user)
+
+        return [
+            {
+                "days_before": reminder_config["days_before"],
+                "severity": reminder_config["severity"],
+                # Calculate trigger time in the user's timezone
+                "trigger_at": user_schedule.resolve(
+                    task.due_date,
+                    reminder_config["days_before"],
+                    respect_quiet_hours=reminder_config["severity"] != ReminderSeverity.CRITICAL
+                ),
+            }
+            for reminder_config in schedule
+        ]
+
     def get_due_reminders(self, db: Session) -> List[Reminder]:
         """
         Get all pending reminders that are due to be sent
@@ -129,6 +185,108 @@ class ReminderService:
 
         return reminders
 
+    def get_due_reminders_by_user(
+        self,
+        db: Session,
+        window_minutes: Optional[int] = None
+    ) -> Dict:
+        """
+        Load due reminders grouped by user, including the ones that become
+        due within the digest window, in a single query
+
+        A user only shows up if at least one reminder is actually due; the
+        reminders inside the window are then pulled forward into the same
+        digest. Critical reminders are never pulled forward.
+
+        Args:
+            db: Database session
+            window_minutes: Coalescing window (default: REMINDER_DIGEST_WINDOW_MINUTES)
+
+        Returns:
+            Dictionary mapping user_id to that user's reminders (task loaded)
+        """
+        if window_minutes is None:
+            window_minutes = settings.REMINDER_DIGEST_WINDOW_MINUTES
+
+        now = datetime.utcnow()
+        horizon = now + timedelta(minutes=window_minutes)
+
+        reminders = (
+            db.query(Reminder)
+            .join(Reminder.task)
+            .options(contains_eager(Reminder.task).joinedload(Task.user))
+            .filter(
+                Reminder.status == ReminderStatus.PENDING,
+                Reminder.trigger_at <= horizon,
+                Reminder.snoozed_until == None  # Not snoozed
+            )
+            .order_by(Task.user_id, Reminder.trigger_at)
+            .all()
+        )
+
+        grouped: Dict = {}
+        for reminder in reminders:
+            if reminder.trigger_at > now and reminder.severity == ReminderSeverity.CRITICAL:
+                continue
+            grouped.setdefault(reminder.task.user_id, []).append(reminder)
+
+        return {
+            user_id: user_reminders
+            for user_id, user_reminders in grouped.items()
+            if any(r.trigger_at <= now for r in user_reminders)
+        }
+
+    def split_for_digest(self, reminders: List[Reminder]) -> Tuple[List[Reminder], List[Reminder]]:
+        """
+        Split a user's due reminders into ones sent on their own (critical)
+        and ones merged into a digest, ordered by severity
+
+        Returns:
+            Tuple of (immediate, digest)
+        """
+        immediate = [r for r in reminders if r.severity == ReminderSeverity.CRITICAL]
+        digest = sorted(
+            (r for r in reminders if r.severity != ReminderSeverity.CRITICAL),
+            key=lambda r: (self.SEVERITY_RANK.get(r.severity, len(self.SEVERITY_RANK)), r.trigger_at)
+        )
+        return immediate, digest
+
+    def defer_quiet_hours(self, reminders: List[Reminder], db: Session) -> List[Reminder]:
+        """
+        Hold back a user's non-critical reminders while they are in quiet hours
+
+        Applies to everything about to be sent, including reminders pulled
+        forward by the digest window, retries and "fire now" reminders of
+        overdue tasks. Held reminders are moved to the end of the quiet hours.
+
+        Args:
+            reminders: Reminders of one user about to be sent
+            db: Database session
+
+        Returns:
+            The reminders to send now
+        """
+        if not reminders:
+            return reminders
+
+        schedule = get_user_schedule(reminders[0].task.user)
+        if not schedule.has_quiet_hours:
+            return reminders
+
+        now = datetime.utcnow()
+        send_at = schedule.outside_quiet_hours(now)
+        if send_at == now:
+            return reminders
+
+        sendable = []
+        for reminder in reminders:
+            if reminder.severity == ReminderSeverity.CRITICAL:
+                sendable.append(reminder)
+            else:
+                reminder.trigger_at = send_at
+        db.commit()
+        return sendable
+
     def mark_reminder_sent(
         self,
         reminder: Reminder,
@@ -136,21 +294,71 @@ class ReminderService:
         error: Optional[str] = None
     ) -> None:
         """
-        Mark a reminder as sent or failed
+        Mark a reminder as sent, or schedule a retry if sending failed
+
+        Failed reminders stay PENDING and are re-queued by moving trigger_at
+        (out of the user's quiet hours unless critical), so retries go
+        through the same due-index as first attempts. After
+        MAX_ATTEMPTS for the reminder's severity it is moved to DEAD_LETTER.
 
         Args:
             reminder: Reminder to update
             db: Database session
             error: Error message if sending failed
         """
+        self._record_attempt(reminder, datetime.utcnow(), error)
+        db.commit()
+
+    def mark_reminders_sent(
+        self,
+        reminders: List[Reminder],
+        db: Session,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Mark all reminders of a digest with the same delivery outcome
+
+        Args:
+            reminders: Reminders that were delivered together
+            db: Database session
+            error: Error message if sending failed
+        """
+        now = datetime.utcnow()
+        for reminder in reminders:
+            self._record_attempt(reminder, now, error)
+        db.commit()
+
+    def _record_attempt(self, reminder: Reminder, now: datetime, error: Optional[str]) -> None:
+        """Apply one delivery attempt to a reminder (without committing)"""
+        reminder.attempts = (reminder.attempts or 0) + 1
+        reminder.last_attempt_at = now
+
         if error:
-            reminder.status = ReminderStatus.FAILED
             reminder.error_message = error
+            max_attempts = self.MAX_ATTEMPTS.get(reminder.severity, 3)
+
+            if reminder.attempts >= max_attempts:
+                reminder.status = ReminderStatus.DEAD_LETTER
+            else:
+                reminder.status = ReminderStatus.PENDING
+                trigger_at = now + self._retry_delay(reminder.attempts)
+                if reminder.severity != ReminderSeverity.CRITICAL:
+                    trigger_at = get_user_schedule(reminder.task.user).outside_quiet_hours(trigger_at)
+                reminder.trigger_at = trigger_at
         else:
             reminder.status = ReminderStatus.SENT
-            reminder.sent_at = datetime.utcnow()
+            reminder.sent_at = now
+            reminder.error_message = None
 
-        db.commit()
+    def _retry_delay(self, attempt: int) -> timedelta:
+        """
+        Backoff before the next delivery attempt
+
+        Doubles per attempt up to RETRY_MAX_DELAY, with jitter in the upper
+        half so retries of a failed batch don't all fire in the same minute.
+        """
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        return timedelta(seconds=random.uniform(delay / 2, delay))
 
     def snooze_reminder(
         self,
@@ -0,0 +1,168 @@
+"""
+Rendition Service
+Generates and caches downscaled JPEG renditions (thumbnails, previews) of uploaded files
+"""
+
+from PIL import Image, ImageOps
+from sqlalchemy.orm import Session
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+import os
+import tempfile
+
+from ..core.config import settings
+from ..models.document import Document
+from ..models.file import File
+from .file_storage import FileStorageService
+
+logger = logging.getLogger(__name__)
+
+# Rendition name -> longest edge in pixels
+RENDITION_SIZES = {
+    "thumb": 320,
+    "preview": 1280,
+}
+
+RENDITION_MIME_TYPE = "image/jpeg"
+
+
+def rendition_relative_path(checksum: str, size: str) -> str:
+    """
+    Path of a rendition relative to RENDITION_DIR
+
+    Renditions are keyed by the content checksum, so identical uploads share
+    them and a changed file can never be served a stale rendition.
+    """
+    return f"{checksum[:2]}/{checksum}-{size}.jpg"
+
+
+def mark_renditions_ready(db: Session, file: File) -> bool:
+    """
+    Record that the renditions of a file exist (without committing)
+
+    Sets File.thumbnail_path and bumps updated_at of the file's document,
+    so list ETags and delta sync pick up the new thumbnail.
+
+    Returns:
+        True if anything changed
+    """
+    thumbnail_path = rendition_relative_path(file.checksum, "thumb")
+    if file.thumbnail_path == thumbnail_path:
+        return False
+
+    file.thumbnail_path = thumbnail_path
+    db.query(Document).filter(Document.file_id == file.id).update(
+        {Document.updated_at: datetime.utcnow()}, synchronize_session=False
+    )
+    return True
+
+
+class RenditionService:
+    """Service for thumbnail and preview renditions"""
+
+    def __init__(self):
+        self.rendition_dir = Path(settings.RENDITION_DIR)
+        self.file_storage = FileStorageService()
+
+    def get_path(self, checksum: str, size: str) -> Path:
+        """Full path of a rendition (which may not exist yet)"""
+        return self.rendition_dir / rendition_relative_path(checksum, size)
+
+    def supports(self, mime_type: str) -> bool:
+        """Whether renditions can be generated for a file type"""
+        return mime_type.startswith("image/") or mime_type == "application/pdf"
+
+    def ensure(self, file: File, size: str) -> Optional[Path]:
+        """
+        Return the path of a rendition, generating all renditions if missing
+
+        Args:
+            file: File to render
+            size: Rendition name (key of RENDITION_SIZES)
+
+        Returns:
+            Path of the rendition, or None if the file type is not supported
+        """
+        path = self.get_path(file.checksum, size)
+        if path.exists():
+            return path
+        if not self.generate(file):
+            return None
+        return path
+
+    def generate(self, file: File) -> Dict[str, str]:
+        """
+        Generate all missing renditions of a file
+
+        The source is decoded once, at the largest rendition size, and each
+        rendition is downscaled from it. Files are written atomically, so a
+        concurrent reader never sees a partial image.
+
+        Args:
+            file: File to render (must have a checksum)
+
+        Returns:
+            Dictionary of rendition name -> path relative to RENDITION_DIR
+            (empty if the file type is not supported)
+        """
+        if not file.checksum or not self.supports(file.mime_type):
+            return {}
+
+        paths = {size: rendition_relative_path(file.checksum, size) for size in RENDITION_SIZES}
+        missing = [size for size in RENDITION_SIZES if not (self.rendition_dir / paths[size]).exists()]
+        if not missing:
+            return paths
+
+        image = self._load(file, max(RENDITION_SIZES[size] for size in missing))
+
+        # Largest first, so each step downscales the previous, smaller image
+        for size in sorted(missing, key=lambda name: RENDITION_SIZES[name], reverse=True):
+            edge = RENDITION_SIZES[size]
+            image.thumbnail((edge, edge), Image.LANCZOS)
+            self._write(image, self.rendition_dir / paths[size])
+
+        logger.info(f"Generated renditions {missing} for file {file.id}")
+        return paths
+
+    def delete(self, checksum: str):
+        """Delete all renditions of a checksum"""
+        for size in RENDITION_SIZES:
+            path = self.get_path(checksum, size)
+            if path.exists():
+                path.unlink()
+
+    def _load(self, file: File, edge: int) -> Image.Image:
+        """Decode the source as an RGB image no larger than needed"""
+        source = self.file_storage.get_full_path(file.path)
+
+        if file.mime_type == "application/pdf":
+            from pdf2image import convert_from_path
+
+            # Rasterize only the first page, directly at the target width
+            image = convert_from_path(str(source), first_page=1, last_page=1, size=(edge, None))[0]
+        else:
+            image = Image.open(source)
+            # JPEG: let the decoder downscale by up to 8x instead of decoding every pixel
+            image.draft("RGB", (edge, edge))
+            # Phone photos carry their rotation in EXIF
+            image = ImageOps.exif_transpose(image)
+
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            return background
+        return image.convert("RGB")
+
+    def _write(self, image: Image.Image, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                image.save(f, "JPEG", quality=settings.RENDITION_JPEG_QUALITY, optimize=True, progressive=True)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,133 @@
+"""
+Search Service
+Ranked full-text search over a user's documents and tasks
+"""
+
+from sqlalchemy import Float, String, cast, func, literal, literal_column, or_, select, union_all
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List
+import logging
+
+from ..models.document import Document
+from ..models.task import Task
+
+logger = logging.getLogger(__name__)
+
+SEARCH_KINDS = ("document", "task")
+
+# Highlighting of matches in result snippets
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5"
+
+# Text considered for snippets; headlines reparse the text, so keep this bounded
+HEADLINE_MAX_CHARS = 50000
+
+# Same expression as ix_documents_invoice_number_trgm, so the index is used
+INVOICE_NUMBER = Document.doc_metadata.op('->>', return_type=String)(literal_column("'invoice_number'"))
+
+
+def _tsquery(q: str):
+    """Query matching the German, English and unstemmed tokens of the search vectors"""
+    return func.websearch_to_tsquery('german', q).op('||')(
+        func.websearch_to_tsquery('english', q)
+    ).op('||')(
+        func.websearch_to_tsquery('simple', q)
+    )
+
+
+class SearchService:
+    """Service for full-text search"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def match(self, user_id, q: str, kinds: Iterable[str] = SEARCH_KINDS):
+        """
+        Build the ranked matches of a search as a subquery
+
+        Documents match on their search vector or on a fuzzy (trigram)
+        invoice number match; tasks on their search vector. Both are ranked
+        with ts_rank_cd, so title hits outrank sender and body hits.
+
+        Args:
+            user_id: Owner of the searched rows
+            q: Search text (web search syntax: "quoted phrases", -exclusions, or)
+            kinds: Result kinds to include
+
+        Returns:
+            Subquery with kind, id, title, rank and date columns
+        """
+        query = _tsquery(q)
+        selects = []
+
+        if "document" in kinds:
+            rank = func.ts_rank_cd(Document.search_vector, query) + func.coalesce(
+                func.similarity(INVOICE_NUMBER, q), 0
+            )
+            selects.append(
+                select(
+                    literal("document").label("kind"),
+                    Document.id.label("id"),
+                    Document.title.label("title"),
+                    cast(rank, Float).label("rank"),
+                    Document.uploaded_at.label("date"),
+                ).where(
+                    Document.user_id == user_id,
+                    or_(
+                        Document.search_vector.op('@@')(query),
+                        INVOICE_NUMBER.op('%')(q),
+                    )
+                )
+            )
+
+        if "task" in kinds:
+            selects.append(
+                select(
+                    literal("task").label("kind"),
+                    Task.id.label("id"),
+                    Task.title.label("title"),
+                    cast(func.ts_rank_cd(Task.search_vector, query), Float).label("rank"),
+                    Task.due_date.label("date"),
+                ).where(
+                    Task.user_id == user_id,
+                    Task.search_vector.op('@@')(query)
+                )
+            )
+
+        if len(selects) == 1:
+            return selects[0].subquery("results")
+        return union_all(*selects).subquery("results")
+
+    def snippets(self, rows: List, q: str) -> Dict:
+        """
+        Highlight the matches of one page of results
+
+        Headlines are computed here rather than in match(), so only the
+        rows of the returned page pay for them.
+
+        Args:
+            rows: Rows of match() with kind and id
+            q: Search text
+
+        Returns:
+            Dictionary of id -> snippet
+        """
+        query = _tsquery(q)
+        document_ids = [row.id for row in rows if row.kind == "document"]
+        task_ids = [row.id for row in rows if row.kind == "task"]
+        snippets: Dict = {}
+
+        if document_ids:
+            text = func.left(func.coalesce(Document.extracted_text, ''), HEADLINE_MAX_CHARS)
+            snippets.update(self.db.query(
+                Document.id,
+                func.ts_headline('german', text, query, HEADLINE_OPTIONS)
+            ).filter(Document.id.in_(document_ids)).all())
+
+        if task_ids:
+            text = func.coalesce(Task.description, Task.title)
+            snippets.update(self.db.query(
+                Task.id,
+                func.ts_headline('german', text, query, HEADLINE_OPTIONS)
+            ).filter(Task.id.in_(task_ids)).all())
+
+        return snippets
@@ -3,17 +3,26 @@ Task-Event Mapping Service
 Automatically creates and syncs calendar events from tasks with deadlines
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 
 from ..models import Task, CalendarEvent, Integration, User
 from ..models.calendar_event import CalendarSyncStatus
 from ..models.integration import SyncDirection
+from .calendar_sync_service import event_content_hash, local_content_hash
 
 logger = logging.getLogger(__name__)
 
+# Priority indicator prefixed to event titles
+PRIORITY_EMOJI = {
+    "low": "🔵",
+    "medium": "🟡",
+    "high": "🟠",
+    "critical": "🔴"
+}
+
 
 class TaskEventMappingService:
     """Service for mapping tasks to calendar events"""
@@ -21,33 +30,13 @@ class TaskEventMappingService:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_event_from_task(
-        self,
-        task: Task,
-        integration_id: Optional[str] = None,
-        auto_sync: bool = True
-    ) -> Optional[CalendarEvent]:
+    def _build_event_fields(self, task: Task) -> Dict:
         """
-        Create a calendar event from a task
-
-        Args:
-            task: Task to create event from
-            integration_id: Optional integration to sync to (if None, uses default or creates local-only event)
-            auto_sync: Whether to automatically sync to external calendar
+        Compute the calendar event content of a task
 
         Returns:
-            Created CalendarEvent or None if task has no due_date
+            Dictionary with title, description, start_time and end_time
         """
-        # Only create event if task has a due_date
-        if not task.due_date:
-            logger.debug(f"Task {task.id} has no due_date, skipping event creation")
-            return None
-
-        # Check if event already exists
-        if task.calendar_event:
-            logger.debug(f"Task {task.id} already has a calendar event")
-            return task.calendar_event
-
         # Determine event duration
         if task.estimated_duration_minutes:
             duration = timedelta(minutes=task.estimated_duration_minutes)
@@ -55,19 +44,12 @@ class TaskEventMappingService:
             # Default to 1 hour
             duration = timedelta(hours=1)
 
-        # Calculate start and end times
         # For tasks, we treat due_date as the deadline, so event ends at due_date
         end_time = task.due_date
         start_time = end_time - duration
 
         # Create title with task priority indicator
-        priority_emoji = {
-            "low": "🔵",
-            "medium": "🟡",
-            "high": "🟠",
-            "critical": "🔴"
-        }
-        emoji = priority_emoji.get(task.priority, "📋")
+        emoji = PRIORITY_EMOJI.get(task.priority, "📋")
         title = f"{emoji} {task.title}"
 
         # Create description with task details
@@ -78,7 +60,44 @@ class TaskEventMappingService:
         description_parts.append(f"Priority: {task.priority}")
         if task.amount:
             description_parts.append(f"Amount: {task.amount} {task.currency}")
-        description = "\n".join(description_parts)
+
+        return {
+            "title": title,
+            "description": "\n".join(description_parts),
+            "start_time": start_time,
+            "end_time": end_time,
+        }
+
+    def create_event_from_task(
+        self,
+        task: Task,
+        integration_id: Optional[str] = None,
+        auto_sync: bool = True,
+        commit: bool = True
+    ) -> Optional[CalendarEvent]:
+        """
+        Create a calendar event from a task
+
+        Args:
+            task: Task to create event from
+            integration_id: Optional integration to sync to (if None, uses default or creates local-only event)
+            auto_sync: Whether to automatically sync to external calendar
+            commit: Commit the new event (False to only flush it into the caller's transaction)
+
+        Returns:
+            Created CalendarEvent or None if task has no due_date
+        """
+        # Only create event if task has a due_date
+        if not task.due_date:
+            logger.debug(f"Task {task.id} has no due_date, skipping event creation")
+            return None
+
+        # Check if event already exists
+        if task.calendar_event:
+            logger.debug(f"Task {task.id} already has a calendar event")
+            return task.calendar_event
+
+        fields = self._build_event_fields(task)
 
         # Validate integration if provided
         if integration_id:
@@ -93,29 +112,31 @@ class TaskEventMappingService:
         # Create calendar event
         new_event = CalendarEvent(
             user_id=task.user_id,
-            task_id=str(task.id),
-            title=title,
-            description=description,
-            start_time=start_time,
-            end_time=end_time,
+            task_id=task.id,
+            **fields,
             all_day=False,
             external_calendar_id=integration_id,
             sync_status=CalendarSyncStatus.PENDING if (integration_id and auto_sync) else CalendarSyncStatus.SYNCED
         )
+        new_event.content_hash = local_content_hash(new_event)
 
         self.db.add(new_event)
-        self.db.commit()
-        self.db.refresh(new_event)
+        if commit:
+            self.db.commit()
+            self.db.refresh(new_event)
+        else:
+            self.db.flush()
 
         logger.info(f"Created calendar event for task {task.id}: {new_event.id}")
         return new_event
 
-    def update_event_from_task(self, task: Task) -> Optional[CalendarEvent]:
+    def update_event_from_task(self, task: Task, commit: bool = True) -> Optional[CalendarEvent]:
         """
         Update existing calendar event when task changes
 
         Args:
             task: Updated task
+            commit: Commit the change (False to join the caller's transaction)
 
         Returns:
             Updated CalendarEvent or None
@@ -127,43 +148,23 @@ class TaskEventMappingService:
             if event:
                 logger.info(f"Task {task.id} no longer has due_date, deleting event {event.id}")
                 self.db.delete(event)
-                self.db.commit()
+                if commit:
+                    self.db.commit()
+                else:
+                    self.db.flush()
             return None
 
         if not event:
             # No event exists but task now has due_date - create one
             logger.info(f"Task {task.id} now has due_date, creating event")
-            return self.create_event_from_task(task)
+            return self.create_event_from_task(task, commit=commit)
 
         # Update existing event
-        # Recalculate duration
-        if task.estimated_duration_minutes:
-            duration = timedelta(minutes=task.estimated_duration_minutes)
-        else:
-            duration = timedelta(hours=1)
-
-        end_time = task.due_date
-        start_time = end_time - duration
-
-        # Update title with priority
-        priority_emoji = {
-            "low": "🔵",
-            "medium": "🟡",
-            "high": "🟠",
-            "critical": "🔴"
-        }
-        emoji = priority_emoji.get(task.priority, "📋")
-        title = f"{emoji} {task.title}"
-
-        # Update description
-        description_parts = []
-        if task.description:
-            description_parts.append(task.description)
-        description_parts.append(f"\nStatus: {task.status}")
-        description_parts.append(f"Priority: {task.priority}")
-        if task.amount:
-            description_parts.append(f"Amount: {task.amount} {task.currency}")
-        description = "\n".join(description_parts)
+        fields = self._build_event_fields(task)
+        title = fields["title"]
+        description = fields["description"]
+        start_time = fields["start_time"]
+        end_time = fields["end_time"]
 
         # Check if anything actually changed
         changed = (
@@ -178,13 +179,19 @@ class TaskEventMappingService:
             event.description = description
             event.start_time = start_time
             event.end_time = end_time
-
-            # Mark for re-sync if it was previously synced
-            if event.sync_status == CalendarSyncStatus.SYNCED and event.external_calendar_id:
+            event.content_hash = local_content_hash(event)
+
+            # Mark for re-sync if it was previously synced and the remote copy differs
+            if (
+                event.sync_status == CalendarSyncStatus.SYNCED
+                and event.external_calendar_id
+                and event.content_hash != event.remote_hash
+            ):
                 event.sync_status = CalendarSyncStatus.PENDING
 
-            self.db.commit()
-            self.db.refresh(event)
+            if commit:
+                self.db.commit()
+                self.db.refresh(event)
             logger.info(f"Updated calendar event {event.id} for task {task.id}")
         else:
             logger.debug(f"No changes to event {event.id} for task {task.id}")
@@ -244,6 +251,11 @@ class TaskEventMappingService:
         """
         Sync all tasks with due_dates for a user
 
+        Tasks are loaded together with their events in one query and the
+        default integration is resolved once. Desired events are computed in
+        memory and the differences applied as bulk inserts, updates and
+        deletes in a single transaction.
+
         Args:
             user: User to sync tasks for
             force: Force recreation of all events
@@ -255,51 +267,91 @@ class TaskEventMappingService:
             "processed": 0,
             "created": 0,
             "updated": 0,
+            "unchanged": 0,
             "deleted": 0,
             "errors": 0
         }
 
         try:
-            # Get all tasks with due_dates
-            tasks = self.db.query(Task).filter(
+            # Get all tasks with due_dates, with their events
+            tasks = self.db.query(Task).options(
+                joinedload(Task.calendar_event)
+            ).filter(
                 Task.user_id == user.id,
                 Task.due_date.isnot(None)
             ).all()
 
+            default_integration = self.get_default_integration(user.id)
+            integration_id = default_integration.id if default_integration else None
+
+            now = datetime.utcnow()
+            inserts: List[Dict] = []
+            updates: List[Dict] = []
+            deletes: List = []
+
             for task in tasks:
-                try:
-                    stats["processed"] += 1
-
-                    if force and task.calendar_event:
-                        self.db.delete(task.calendar_event)
-                        self.db.commit()
-                        stats["deleted"] += 1
-
-                    if task.calendar_event:
-                        self.update_event_from_task(task)
-                        stats["updated"] += 1
-                    else:
-                        default_integration = self.get_default_integration(user.id)
-                        integration_id = str(default_integration.id) if default_integration else None
-                        self.create_event_from_task(task, integration_id=integration_id)
-                        stats["created"] += 1
-
-                except Exception as e:
-                    logger.error(f"Error syncing task {task.id}: {e}")
-                    stats["errors"] += 1
+                stats["processed"] += 1
+                fields = self._build_event_fields(task)
+                event = task.calendar_event
+
+                if force and event:
+                    deletes.append(event.id)
+                    event = None
+
+                if event is None:
+                    fields["all_day"] = False
+                    inserts.append({
+                        **fields,
+                        "user_id": user.id,
+                        "task_id": task.id,
+                        "external_calendar_id": integration_id,
+                        "sync_status": CalendarSyncStatus.PENDING if integration_id else CalendarSyncStatus.SYNCED,
+                        "content_hash": event_content_hash(fields),
+                        "created_at": now,
+                        "updated_at": now,
+                    })
+                    continue
+
+                if all(getattr(event, key) == value for key, value in fields.items()):
+                    stats["unchanged"] += 1
+                    continue
+
+                content_hash = event_content_hash({**fields, "all_day": event.all_day, "location": event.location})
+                update = {**fields, "id": event.id, "content_hash": content_hash, "updated_at": now}
+                # Mark for re-sync if it was previously synced and the remote copy differs
+                if (
+                    event.sync_status == CalendarSyncStatus.SYNCED
+                    and event.external_calendar_id
+                    and content_hash != event.remote_hash
+                ):
+                    update["sync_status"] = CalendarSyncStatus.PENDING
+                updates.append(update)
+
+            if deletes:
+                self.db.query(CalendarEvent).filter(
+                    CalendarEvent.id.in_(deletes)
+                ).delete(synchronize_session=False)
+            if updates:
+                self.db.bulk_update_mappings(CalendarEvent, updates)
+            if inserts:
+                self.db.bulk_insert_mappings(CalendarEvent, inserts)
 
             # Also clean up events for tasks without due_dates
-            orphaned_events = self.db.query(CalendarEvent).join(Task).filter(
+            orphaned = self.db.query(CalendarEvent).filter(
                 CalendarEvent.user_id == user.id,
-                CalendarEvent.task_id.isnot(None),
-                Task.due_date.is_(None)
-            ).all()
-
-            for event in orphaned_events:
-                self.db.delete(event)
-                stats["deleted"] += 1
+                CalendarEvent.task_id.in_(
+                    self.db.query(Task.id).filter(
+                        Task.user_id == user.id,
+                        Task.due_date.is_(None)
+                    )
+                )
+            ).delete(synchronize_session=False)
 
             self.db.commit()
+
+            stats["created"] = len(inserts)
+            stats["updated"] = len(updates)
+            stats["deleted"] = len(deletes) + orphaned
             logger.info(f"Bulk sync completed for user {user.id}: {stats}")
 
         except Exception as e:
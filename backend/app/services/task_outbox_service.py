@@ -0,0 +1,242 @@
+"""
+Task Outbox Service
+Records task writes in a transactional outbox and applies their side effects in the background
+"""
+
+from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+import logging
+
+from ..models.task import Task
+from ..models.task_change import TaskChange
+from ..models.calendar_event import CalendarSyncStatus
+from .dashboard_summary_service import DashboardSummaryService
+from .reminder_reconciliation_service import ReminderReconciliationService
+from .task_event_mapping_service import TaskEventMappingService
+
+logger = logging.getLogger(__name__)
+
+# Task fields that affect the reminder schedule
+REMINDER_FIELDS = {"due_date", "priority", "status"}
+
+# Task fields that affect the calendar event of a task
+EVENT_FIELDS = {"title", "description", "due_date", "priority", "status", "amount", "currency", "estimated_duration_minutes"}
+
+# Task fields stored in the dashboard counters (due dates are counted live)
+SUMMARY_FIELDS = {"status", "priority", "amount", "currency"}
+
+# Outbox rows consumed per run
+DEFAULT_BATCH_SIZE = 500
+
+# Failed processing attempts before a change is dead-lettered
+MAX_ATTEMPTS = 5
+
+
+class TaskOutboxResult:
+    """Result of one outbox consumer run"""
+
+    def __init__(self):
+        self.changes = 0
+        self.tasks = 0
+        self.events_written = 0
+        self.reminders = {"created": 0, "updated": 0, "deleted": 0}
+        self.failed = 0
+        self.dead_lettered = 0
+        # Integrations with events waiting to be pushed
+        self.integration_ids: Set = set()
+
+    def to_dict(self) -> Dict:
+        return {
+            "changes": self.changes,
+            "tasks": self.tasks,
+            "events_written": self.events_written,
+            "reminders": self.reminders,
+            "failed": self.failed,
+            "dead_lettered": self.dead_lettered,
+            "integrations_to_push": len(self.integration_ids),
+        }
+
+
+class TaskOutboxService:
+    """Service for the task change outbox"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_change(self, task: Task, change_type: str, fields: Optional[Iterable[str]] = None):
+        """
+        Record a task write in the caller's transaction
+
+        Nothing is committed here: the change becomes visible to the consumer
+        together with the task write itself, or not at all.
+
+        Args:
+            task: Created, updated or deleted task (must have an id, i.e. be flushed)
+            change_type: "created", "updated" or "deleted"
+            fields: Names of the changed fields (None for all)
+        """
+        self.db.add(TaskChange(
+            task_id=task.id,
+            user_id=task.user_id,
+            change_type=change_type,
+            fields=sorted(fields) if fields is not None else None,
+        ))
+
+    def process_pending(self, limit: int = DEFAULT_BATCH_SIZE) -> TaskOutboxResult:
+        """
+        Apply the side effects of pending task changes
+
+        The oldest pending rows are locked with SKIP LOCKED, so concurrent
+        consumers work on disjoint batches. Changes are coalesced per task:
+        a task edited several times since the last run is mapped to its
+        calendar event and reconciled once, against its current state. The
+        dashboard counters of the affected users are refreshed as well.
+
+        The batch is applied in one savepoint. If that fails, every task is
+        retried in its own savepoint, so one broken task doesn't hold back
+        the others: its changes stay pending with the error recorded and are
+        dead-lettered after MAX_ATTEMPTS. Marking rows processed commits
+        together with the applied side effects.
+
+        Args:
+            limit: Maximum number of outbox rows to consume
+
+        Returns:
+            TaskOutboxResult with counts and the integrations to push
+        """
+        result = TaskOutboxResult()
+
+        changes = self.db.query(TaskChange).filter(
+            TaskChange.processed_at.is_(None),
+            TaskChange.dead_lettered_at.is_(None)
+        ).order_by(
+            TaskChange.id
+        ).limit(limit).with_for_update(skip_locked=True).all()
+
+        if not changes:
+            self.db.commit()
+            return result
+
+        # Coalesce: per task, the union of changed fields (None = everything)
+        changed_fields: Dict = {}
+        for change in changes:
+            if change.change_type != "updated" or change.fields is None:
+                changed_fields[change.task_id] = None
+            elif change.task_id not in changed_fields:
+                changed_fields[change.task_id] = set(change.fields)
+            elif changed_fields[change.task_id] is not None:
+                changed_fields[change.task_id].update(change.fields)
+
+        # Deleted tasks are simply skipped; their events and reminders cascade
+        tasks: List[Task] = self.db.query(Task).options(
+            joinedload(Task.calendar_event),
+            joinedload(Task.user)
+        ).filter(
+            Task.id.in_(list(changed_fields.keys()))
+        ).all()
+
+        errors: Dict = {}
+        try:
+            with self.db.begin_nested():
+                applied = self._apply(tasks, changed_fields)
+            self._add_to_result(result, applied)
+        except Exception as e:
+            logger.warning(f"Applying {len(tasks)} task change(s) failed ({e}), retrying task by task")
+            for task in tasks:
+                try:
+                    with self.db.begin_nested():
+                        applied = self._apply([task], changed_fields)
+                    self._add_to_result(result, applied)
+                except Exception as task_error:
+                    logger.exception(f"Applying changes of task {task.id} failed")
+                    errors[task.id] = f"{type(task_error).__name__}: {task_error}"
+
+        try:
+            with self.db.begin_nested():
+                DashboardSummaryService(self.db).refresh_users(
+                    (
+                        change.user_id for change in changes
+                        if change.change_type != "updated" or change.fields is None or SUMMARY_FIELDS & set(change.fields)
+                    ),
+                    commit=False
+                )
+        except Exception:
+            # Counters are recomputed on the user's next change
+            logger.exception("Refreshing dashboard summaries failed")
+
+        now = datetime.utcnow()
+        for change in changes:
+            error = errors.get(change.task_id)
+            if error is None:
+                change.processed_at = now
+                continue
+
+            change.attempts = (change.attempts or 0) + 1
+            change.last_error = error[:2000]
+            result.failed += 1
+            if change.attempts >= MAX_ATTEMPTS:
+                change.dead_lettered_at = now
+                result.dead_lettered += 1
+                logger.error(f"Dead-lettered task change {change.id} of task {change.task_id}: {error}")
+
+        self.db.commit()
+
+        result.changes = len(changes)
+        result.tasks = len(tasks)
+        logger.info(f"Processed {result.changes} task change(s) for {result.tasks} task(s), {result.failed} failed")
+        return result
+
+    def _apply(self, tasks: List[Task], changed_fields: Dict) -> Dict:
+        """
+        Reconcile reminders and write calendar events of changed tasks
+
+        Nothing is committed; the caller wraps this in a savepoint.
+
+        Returns:
+            Dictionary with reminders stats, events_written and integration_ids
+        """
+        reminder_tasks = []
+        event_tasks = []
+        for task in tasks:
+            fields = changed_fields[task.id]
+            if fields is None or fields & REMINDER_FIELDS:
+                reminder_tasks.append(task)
+            if fields is None or fields & EVENT_FIELDS:
+                event_tasks.append(task)
+
+        applied = {
+            "reminders": ReminderReconciliationService(self.db).reconcile_tasks(reminder_tasks, commit=False),
+            "events_written": 0,
+            "integration_ids": set(),
+        }
+
+        mapping_service = TaskEventMappingService(self.db)
+        for task in event_tasks:
+            if task.calendar_event is None and not task.due_date:
+                continue
+
+            event = mapping_service.update_event_from_task(task, commit=False)
+            applied["events_written"] += 1
+            if event is not None and event.external_calendar_id and event.sync_status == CalendarSyncStatus.PENDING:
+                applied["integration_ids"].add(event.external_calendar_id)
+
+        # Surface errors of the flushed writes inside the savepoint
+        self.db.flush()
+        return applied
+
+    @staticmethod
+    def _add_to_result(result: TaskOutboxResult, applied: Dict):
+        for key, count in applied["reminders"].items():
+            result.reminders[key] = result.reminders.get(key, 0) + count
+        result.events_written += applied["events_written"]
+        result.integration_ids.update(applied["integration_ids"])
+
+    def purge_processed(self, older_than: datetime) -> int:
+        """Delete processed outbox rows older than a cutoff"""
+        deleted = self.db.query(TaskChange).filter(
+            TaskChange.processed_at.isnot(None),
+            TaskChange.processed_at < older_than
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
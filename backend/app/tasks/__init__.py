@@ -2,6 +2,22 @@
 Background tasks for Workmate Private
 """
 
-from .document_processing import process_document
+from .document_processing import process_document, backfill_document_metadata
+from .reminder_dispatch import dispatch_reminders
+from .integration_sync import sync_due_integrations, sync_integration_now, renew_google_watch_channels
+from .task_changes import process_task_changes, purge_task_changes
+from .tombstones import purge_deleted_records
+from .renditions import generate_renditions
 
-__all__ = ["process_document"]
+__all__ = [
+    "process_document",
+    "backfill_document_metadata",
+    "dispatch_reminders",
+    "sync_due_integrations",
+    "sync_integration_now",
+    "renew_google_watch_channels",
+    "process_task_changes",
+    "purge_task_changes",
+    "purge_deleted_records",
+    "generate_renditions",
+]
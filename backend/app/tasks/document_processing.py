@@ -14,7 +14,9 @@ from ..models.task import Task as TaskModel
 from ..services.ocr_service import OCRService
 from ..services.claude_service import ClaudeService
 from ..services.file_storage import FileStorageService
-from ..services.reminder_service import ReminderService
+from ..services.task_outbox_service import TaskOutboxService
+from ..services.document_metadata_service import DocumentMetadataService, apply_promoted_fields
+from ..services.dashboard_summary_service import DashboardSummaryService
 
 
 # Quality Assurance Thresholds
@@ -132,6 +134,9 @@ def process_document(document_id: str):
         if review_reason:
             document.doc_metadata["qa_review_reason"] = review_reason
 
+        # Typed columns for filtering (amount, due date, sender, review flag)
+        apply_promoted_fields(document)
+
         # Step 4: Auto-create task if action required and confidence is sufficient
         task_created = False
         if metadata.get("action_required", False):
@@ -152,12 +157,11 @@ def process_document(document_id: str):
                         status="open",
                     )
                     db.add(new_task)
-                    db.commit()
-                    db.refresh(new_task)  # Refresh to get the ID
+                    db.flush()  # Flush to get the ID
 
-                    # Create reminders for the task
-                    reminder_service = ReminderService()
-                    reminders = reminder_service.create_reminders_for_task(new_task, db)
+                    # Reminders, calendar event and dashboard counters follow via the outbox
+                    TaskOutboxService(db).record_change(new_task, "created")
+                    db.commit()
 
                     task_created = True
                 else:
@@ -171,6 +175,7 @@ def process_document(document_id: str):
             document.processing_status = "done"
 
         document.processed_at = datetime.utcnow()
+        DashboardSummaryService(db).refresh_user(document.user_id, commit=False)
         db.commit()
 
         return {
@@ -188,6 +193,7 @@ def process_document(document_id: str):
             if not document.doc_metadata:
                 document.doc_metadata = {}
             document.doc_metadata["error"] = str(e)
+            DashboardSummaryService(db).refresh_user(document.user_id, commit=False)
             db.commit()
 
         # Re-raise for Celery to handle
@@ -197,6 +203,20 @@ def process_document(document_id: str):
         db.close()
 
 
+@celery_app.task(name="app.tasks.backfill_document_metadata")
+def backfill_document_metadata():
+    """
+    Fill the promoted metadata columns (amount, due date, sender, review flag)
+    of existing documents. Safe to run again; unchanged rows are skipped.
+    """
+    db = SessionLocal()
+
+    try:
+        return DocumentMetadataService(db).backfill()
+    finally:
+        db.close()
+
+
 def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse date string from AI response"""
     if not date_str:
@@ -0,0 +1,146 @@
+"""
+Celery tasks: scheduled and push-triggered syncs of calendar integrations
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict
+
+from ..celery import celery_app
+from ..db.session import SessionLocal
+from ..models.integration import Integration
+from ..services.calendar_sync_service import CalendarSyncService
+from ..services.google_watch_service import GoogleWatchService
+from ..services.integration_sync_scheduler import (
+    HOST_CONCURRENCY,
+    PROVIDER_CONCURRENCY,
+    IntegrationSyncScheduler,
+    get_sync_host,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying a push-triggered sync while another sync is running
+BUSY_RETRY_DELAY = 30
+
+
+@celery_app.task(name="app.tasks.sync_due_integrations")
+def sync_due_integrations():
+    """
+    Claim due integrations and sync them concurrently.
+
+    Each integration is leased before it starts, so an overlapping run (or
+    a manual sync) never syncs it twice. Concurrency is capped per provider
+    and per host.
+    """
+    db = SessionLocal()
+
+    try:
+        claimed = [
+            (integration.id, integration.integration_type, get_sync_host(integration))
+            for integration in IntegrationSyncScheduler(db).claim_due_integrations()
+        ]
+    finally:
+        db.close()
+
+    if not claimed:
+        return {"synced": 0, "failed": 0}
+
+    return asyncio.run(_run_syncs(claimed))
+
+
+@celery_app.task(name="app.tasks.sync_integration_now", bind=True, max_retries=10)
+def sync_integration_now(self, integration_id: str):
+    """
+    Sync one integration right away, e.g. after a Google push notification.
+
+    If a sync of the integration is already running, the task is retried
+    later: the running sync may have fetched its changes before the
+    notified change happened.
+    """
+    db = SessionLocal()
+
+    try:
+        integration = db.query(Integration).filter(Integration.id == integration_id).first()
+        if not integration or not integration.enabled:
+            return {"synced": 0, "failed": 0}
+
+        if not IntegrationSyncScheduler(db).acquire_lease(integration):
+            raise self.retry(countdown=BUSY_RETRY_DELAY)
+    finally:
+        db.close()
+
+    ok = asyncio.run(_sync_one(integration_id))
+    return {"synced": int(ok), "failed": int(not ok)}
+
+
+@celery_app.task(name="app.tasks.renew_google_watch_channels")
+def renew_google_watch_channels():
+    """Open push notification channels for Google integrations and renew expiring ones."""
+    db = SessionLocal()
+
+    try:
+        watch_service = GoogleWatchService(db)
+        if not watch_service.enabled:
+            return {"renewed": 0, "failed": 0}
+
+        return asyncio.run(_renew_channels(watch_service))
+    finally:
+        db.close()
+
+
+async def _renew_channels(watch_service: GoogleWatchService) -> Dict:
+    stats = {"renewed": 0, "failed": 0}
+
+    for integration in watch_service.get_channels_to_renew():
+        try:
+            await watch_service.renew_channel(integration)
+            stats["renewed"] += 1
+        except Exception as e:
+            logger.error(f"Failed to renew watch channel of integration {integration.id}: {e}")
+            watch_service.db.rollback()
+            watch_service.record_failure(integration, e)
+            stats["failed"] += 1
+
+    return stats
+
+
+async def _run_syncs(claimed) -> Dict:
+    provider_limits = {
+        provider: asyncio.Semaphore(limit) for provider, limit in PROVIDER_CONCURRENCY.items()
+    }
+    host_limits = defaultdict(lambda: asyncio.Semaphore(HOST_CONCURRENCY))
+    stats = {"synced": 0, "failed": 0}
+
+    async def run(integration_id, provider, host):
+        async with provider_limits[provider], host_limits[host]:
+            ok = await _sync_one(integration_id)
+        stats["synced" if ok else "failed"] += 1
+
+    await asyncio.gather(*(run(*entry) for entry in claimed))
+    return stats
+
+
+async def _sync_one(integration_id) -> bool:
+    """Sync one leased integration in its own session and release the lease."""
+    db = SessionLocal()
+
+    try:
+        integration = db.query(Integration).filter(Integration.id == integration_id).first()
+        if not integration:
+            return False
+
+        scheduler = IntegrationSyncScheduler(db)
+        try:
+            result = await CalendarSyncService(db).sync_integration(integration, integration.user)
+            return result.errors == 0
+        except Exception as e:
+            logger.error(f"Background sync of integration {integration_id} failed: {e}")
+            db.rollback()
+            return False
+        finally:
+            scheduler.release_lease(integration)
+
+    finally:
+        db.close()
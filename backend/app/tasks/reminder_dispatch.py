@@ -2,48 +2,90 @@
 Celery beat task: dispatches due reminders every minute
 """
 
+from typing import Dict, List
+
 from ..celery import celery_app
 from ..db.session import SessionLocal
+from ..models.reminder import Reminder
 from ..services.reminder_service import ReminderService
 from ..services.push_notification_service import PushNotificationService
-from ..models.user import User
+from ..services.device_token_service import DeviceTokenService
 
 
 @celery_app.task(name="app.tasks.dispatch_reminders")
 def dispatch_reminders():
-    """Check for due reminders and send push notifications."""
+    """
+    Check for due reminders and send push notifications.
+
+    Reminders of a user that fall into the digest window are merged into a
+    single notification; critical reminders are still sent on their own.
+    During a user's quiet hours only critical reminders go out, the rest
+    are moved to the end of the quiet hours.
+    """
     db = SessionLocal()
     reminder_service = ReminderService()
     push_service = PushNotificationService()
+    token_service = DeviceTokenService()
 
     try:
-        due = reminder_service.get_due_reminders(db)
-
-        for reminder in due:
-            task = reminder.task
-            if not task:
-                continue
+        due_by_user = reminder_service.get_due_reminders_by_user(db)
 
-            user = db.query(User).filter(User.id == task.user_id).first()
-            if not user:
-                continue
+        # Load the devices of all affected users in one query
+        tokens_by_user = token_service.get_tokens_for_users(due_by_user.keys(), db)
+        stats = {"dispatched": 0, "notifications": 0, "pruned_tokens": 0}
 
-            sent = False
-            error = None
+        for user_id, reminders in due_by_user.items():
+            reminders = reminder_service.defer_quiet_hours(reminders, db)
+            immediate, digest = reminder_service.split_for_digest(reminders)
+            batches = [[reminder] for reminder in immediate]
+            if digest:
+                batches.append(digest)
 
-            if "push" in (reminder.channels or []) and user.fcm_token:
-                ok = push_service.send_reminder(
-                    fcm_token=user.fcm_token,
-                    task_title=task.title,
-                    severity=reminder.severity,
-                )
-                sent = ok
-                if not ok:
-                    error = "FCM delivery failed"
+            for batch in batches:
+                _deliver(batch, user_id, tokens_by_user, stats, reminder_service, push_service, token_service, db)
 
-            reminder_service.mark_reminder_sent(reminder, db, error=error if not sent else None)
-
-        return {"dispatched": len(due)}
+        return stats
 
     finally:
         db.close()
+
+
+def _deliver(
+    reminders: List[Reminder],
+    user_id,
+    tokens_by_user: Dict,
+    stats: Dict,
+    reminder_service: ReminderService,
+    push_service: PushNotificationService,
+    token_service: DeviceTokenService,
+    db,
+) -> None:
+    """Send one notification for a batch of reminders and record the outcome."""
+    tokens = tokens_by_user.get(user_id, [])
+    push_reminders = [r for r in reminders if "push" in (r.channels or [])]
+    other_reminders = [r for r in reminders if "push" not in (r.channels or [])]
+
+    if other_reminders:
+        # No other channel is implemented yet
+        reminder_service.mark_reminders_sent(other_reminders, db)
+
+    if push_reminders:
+        error = None
+
+        if tokens:
+            result = push_service.send_digest(
+                fcm_tokens=tokens,
+                items=[(r.task.title, r.severity) for r in push_reminders],
+            )
+            dead = token_service.apply_push_result(result, db)
+            if dead:
+                stats["pruned_tokens"] += len(dead)
+                tokens_by_user[user_id] = [t for t in tokens if t not in dead]
+
+            stats["notifications"] += 1
+            if result.success_count == 0:
+                error = f"FCM delivery failed on all {len(tokens)} device(s)"
+
+        reminder_service.mark_reminders_sent(push_reminders, db, error=error)
+
+    stats["dispatched"] += len(reminders)
@@ -0,0 +1,37 @@
+"""
+Rendition background tasks
+"""
+
+from uuid import UUID
+
+from ..celery import celery_app
+from ..db.session import SessionLocal
+from ..models.file import File as FileModel
+from ..services.rendition_service import RenditionService, mark_renditions_ready
+
+
+@celery_app.task(name="app.tasks.generate_renditions")
+def generate_renditions(file_id: str):
+    """
+    Generate the thumbnail and preview of an uploaded file.
+
+    Sets File.thumbnail_path once the renditions exist and bumps the
+    document's updated_at, so list ETags and delta sync pick it up.
+    """
+    db = SessionLocal()
+
+    try:
+        file = db.query(FileModel).filter(FileModel.id == UUID(file_id)).first()
+        if not file:
+            return {"generated": False}
+
+        paths = RenditionService().generate(file)
+        if not paths:
+            return {"generated": False}
+
+        if mark_renditions_ready(db, file):
+            db.commit()
+
+        return {"generated": True, "renditions": paths}
+    finally:
+        db.close()
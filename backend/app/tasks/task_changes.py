@@ -0,0 +1,48 @@
+"""
+Celery beat task: applies the side effects of task writes from the outbox
+"""
+
+from datetime import datetime, timedelta
+
+from ..celery import celery_app
+from ..db.session import SessionLocal
+from ..services.task_outbox_service import TaskOutboxService
+from .integration_sync import sync_integration_now
+
+# Processed outbox rows are kept this long for debugging
+PROCESSED_RETENTION = timedelta(days=1)
+
+
+@celery_app.task(name="app.tasks.process_task_changes")
+def process_task_changes():
+    """
+    Map changed tasks to calendar events and reconcile their reminders.
+
+    Task endpoints only insert an outbox row next to the task write; the
+    calendar mapping and reminder reconciliation run here, coalesced per
+    task. Integrations that got pending events are pushed right away
+    instead of waiting for their next scheduled sync.
+    """
+    db = SessionLocal()
+
+    try:
+        result = TaskOutboxService(db).process_pending()
+    finally:
+        db.close()
+
+    for integration_id in result.integration_ids:
+        sync_integration_now.delay(str(integration_id))
+
+    return result.to_dict()
+
+
+@celery_app.task(name="app.tasks.purge_task_changes")
+def purge_task_changes():
+    """Delete processed outbox rows past their retention."""
+    db = SessionLocal()
+
+    try:
+        deleted = TaskOutboxService(db).purge_processed(datetime.utcnow() - PROCESSED_RETENTION)
+        return {"deleted": deleted}
+    finally:
+        db.close()
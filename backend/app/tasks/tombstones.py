@@ -0,0 +1,31 @@
+"""
+Celery beat task: purges delete tombstones used by delta sync
+"""
+
+from datetime import datetime, timedelta
+
+from ..celery import celery_app
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.deleted_record import DeletedRecord
+
+
+@celery_app.task(name="app.tasks.purge_deleted_records")
+def purge_deleted_records():
+    """
+    Delete tombstones past TOMBSTONE_RETENTION_DAYS.
+
+    Sync cursors older than the retention are answered with 410, so these
+    rows can no longer be asked for.
+    """
+    db = SessionLocal()
+
+    try:
+        cutoff = datetime.utcnow() - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS)
+        deleted = db.query(DeletedRecord).filter(
+            DeletedRecord.deleted_at < cutoff
+        ).delete(synchronize_session=False)
+        db.commit()
+        return {"deleted": deleted}
+    finally:
+        db.close()
@@ -0,0 +1,27 @@
+"""Add watch channel retry state to integrations
+
+Revision ID: a1c8d4e2f679
+Revises: f0b7c3d9e568
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a1c8d4e2f679'
+down_revision: Union[str, None] = 'f0b7c3d9e568'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('integrations', sa.Column('watch_failures', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('integrations', sa.Column('watch_retry_after', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('integrations', 'watch_retry_after')
+    op.drop_column('integrations', 'watch_failures')
@@ -0,0 +1,75 @@
+"""Add full-text search to documents and tasks
+
+Revision ID: a5c2d8e4f013
+Revises: f4b1c7d3e902
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'a5c2d8e4f013'
+down_revision: Union[str, None] = 'f4b1c7d3e902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DOCUMENT_SEARCH_VECTOR = """
+    setweight(to_tsvector('german', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple',
+        coalesce(doc_metadata #>> '{sender,name}', '') || ' ' ||
+        coalesce(doc_metadata ->> 'invoice_number', '')), 'B') ||
+    setweight(to_tsvector('german', left(coalesce(extracted_text, ''), 200000)), 'C') ||
+    setweight(to_tsvector('english', left(coalesce(extracted_text, ''), 200000)), 'C')
+"""
+
+TASK_SEARCH_VECTOR = """
+    setweight(to_tsvector('german', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('german', coalesce(description, '')), 'C') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'C')
+"""
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Generated columns are computed for existing rows when added
+    op.add_column(
+        'documents',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(DOCUMENT_SEARCH_VECTOR, persisted=True)
+        )
+    )
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(TASK_SEARCH_VECTOR, persisted=True)
+        )
+    )
+
+    op.create_index('ix_documents_search_vector', 'documents', ['search_vector'], postgresql_using='gin')
+    op.create_index(
+        'ix_documents_invoice_number_trgm',
+        'documents',
+        [sa.text("(doc_metadata ->> 'invoice_number') gin_trgm_ops")],
+        postgresql_using='gin'
+    )
+    op.create_index('ix_tasks_search_vector', 'tasks', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_search_vector', table_name='tasks')
+    op.drop_index('ix_documents_invoice_number_trgm', table_name='documents')
+    op.drop_index('ix_documents_search_vector', table_name='documents')
+    op.drop_column('tasks', 'search_vector')
+    op.drop_column('documents', 'search_vector')
@@ -0,0 +1,44 @@
+"""Add integration sync scheduling (next sync time, lease)
+
+Revision ID: a9c6d2e8f457
+Revises: f8b5c1d7e346
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a9c6d2e8f457'
+down_revision: Union[str, None] = 'f8b5c1d7e346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('integrations', sa.Column('next_sync_at', sa.DateTime(), nullable=True))
+    op.add_column('integrations', sa.Column('sync_lease_until', sa.DateTime(), nullable=True))
+
+    # Existing integrations continue their interval; never-synced ones are due now
+    op.execute("""
+        UPDATE integrations
+        SET next_sync_at = COALESCE(
+            last_sync_at + make_interval(mins => COALESCE(sync_interval_minutes, 15)),
+            now() AT TIME ZONE 'utc'
+        )
+    """)
+
+    op.create_index(
+        'ix_integrations_next_sync_at',
+        'integrations',
+        ['next_sync_at'],
+        postgresql_where=sa.text('auto_sync AND enabled')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_integrations_next_sync_at', table_name='integrations')
+    op.drop_column('integrations', 'sync_lease_until')
+    op.drop_column('integrations', 'next_sync_at')
@@ -0,0 +1,29 @@
+"""Add content hashes to calendar events
+
+Revision ID: b0d7e3f9a568
+Revises: a9c6d2e8f457
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b0d7e3f9a568'
+down_revision: Union[str, None] = 'a9c6d2e8f457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Left empty for existing rows: unknown hashes never match, so those
+    # events are compared and pushed as before until their next sync
+    op.add_column('calendar_events', sa.Column('content_hash', sa.String(64), nullable=True))
+    op.add_column('calendar_events', sa.Column('remote_hash', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('calendar_events', 'remote_hash')
+    op.drop_column('calendar_events', 'content_hash')
@@ -0,0 +1,25 @@
+"""Remember CalDAV objects without events on integrations
+
+Revision ID: b2d9e5f3a780
+Revises: a1c8d4e2f679
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b2d9e5f3a780'
+down_revision: Union[str, None] = 'a1c8d4e2f679'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('integrations', sa.Column('sync_skipped_etags', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('integrations', 'sync_skipped_etags')
@@ -0,0 +1,59 @@
+"""Add device_tokens table, replacing users.fcm_token
+
+Revision ID: b4d1e7f3a902
+Revises: 0002_fix_documents_files_schema
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'b4d1e7f3a902'
+down_revision: Union[str, None] = '0002_fix_documents_files_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('device_tokens',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('token', sa.String(255), nullable=False),
+        sa.Column('platform', sa.String(20), nullable=True),
+        sa.Column('last_seen', sa.DateTime(), nullable=False),
+        sa.Column('failure_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('token')
+    )
+    op.create_index('ix_device_tokens_user_id', 'device_tokens', ['user_id'])
+
+    # Carry over the single token each user had so far
+    op.execute("""
+        INSERT INTO device_tokens (id, user_id, token, platform, last_seen, failure_count, created_at)
+        SELECT gen_random_uuid(), id, fcm_token, NULL, now(), 0, now()
+        FROM users
+        WHERE fcm_token IS NOT NULL
+        ON CONFLICT (token) DO NOTHING
+    """)
+
+    op.drop_column('users', 'fcm_token')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('fcm_token', sa.String(255), nullable=True))
+    op.execute("""
+        UPDATE users SET fcm_token = (
+            SELECT token FROM device_tokens
+            WHERE device_tokens.user_id = users.id
+            ORDER BY last_seen DESC
+            LIMIT 1
+        )
+    """)
+    op.drop_index('ix_device_tokens_user_id', table_name='device_tokens')
+    op.drop_table('device_tokens')
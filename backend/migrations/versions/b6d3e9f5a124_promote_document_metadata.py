@@ -0,0 +1,115 @@
+"""Convert doc_metadata to JSONB and promote hot fields to columns
+
+Revision ID: b6d3e9f5a124
+Revises: a5c2d8e4f013
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'b6d3e9f5a124'
+down_revision: Union[str, None] = 'a5c2d8e4f013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DOCUMENT_SEARCH_VECTOR = """
+    setweight(to_tsvector('german', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple',
+        coalesce(doc_metadata #>> '{sender,name}', '') || ' ' ||
+        coalesce(doc_metadata ->> 'invoice_number', '')), 'B') ||
+    setweight(to_tsvector('german', left(coalesce(extracted_text, ''), 200000)), 'C') ||
+    setweight(to_tsvector('english', left(coalesce(extracted_text, ''), 200000)), 'C')
+"""
+
+
+def _drop_metadata_dependents() -> None:
+    # The generated search vector and the trigram index depend on doc_metadata's type
+    op.drop_index('ix_documents_invoice_number_trgm', table_name='documents')
+    op.drop_index('ix_documents_search_vector', table_name='documents')
+    op.drop_column('documents', 'search_vector')
+
+
+def _create_metadata_dependents() -> None:
+    op.add_column(
+        'documents',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(DOCUMENT_SEARCH_VECTOR, persisted=True)
+        )
+    )
+    op.create_index('ix_documents_search_vector', 'documents', ['search_vector'], postgresql_using='gin')
+    op.create_index(
+        'ix_documents_invoice_number_trgm',
+        'documents',
+        [sa.text("(doc_metadata ->> 'invoice_number') gin_trgm_ops")],
+        postgresql_using='gin'
+    )
+
+
+def upgrade() -> None:
+    _drop_metadata_dependents()
+    op.alter_column(
+        'documents',
+        'doc_metadata',
+        type_=postgresql.JSONB(),
+        postgresql_using='doc_metadata::jsonb'
+    )
+    _create_metadata_dependents()
+
+    op.create_index(
+        'ix_documents_doc_metadata',
+        'documents',
+        ['doc_metadata'],
+        postgresql_using='gin',
+        postgresql_ops={'doc_metadata': 'jsonb_path_ops'}
+    )
+
+    # Promoted columns, filled by process_document and the backfill_document_metadata task
+    op.add_column('documents', sa.Column('amount', sa.Numeric(12, 2), nullable=True))
+    op.add_column('documents', sa.Column('currency', sa.String(3), nullable=True))
+    op.add_column('documents', sa.Column('due_date', sa.DateTime(), nullable=True))
+    op.add_column('documents', sa.Column('sender_name', sa.String(255), nullable=True))
+    op.add_column(
+        'documents',
+        sa.Column('needs_review', sa.Boolean(), nullable=False, server_default=sa.false())
+    )
+
+    op.create_index('ix_documents_user_type_due_date', 'documents', ['user_id', 'type', 'due_date'])
+    op.create_index('ix_documents_user_amount', 'documents', ['user_id', 'amount'])
+    op.create_index('ix_documents_user_sender_name', 'documents', ['user_id', 'sender_name'])
+    op.create_index(
+        'ix_documents_needs_review',
+        'documents',
+        ['user_id'],
+        postgresql_where=sa.text('needs_review')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_needs_review', table_name='documents')
+    op.drop_index('ix_documents_user_sender_name', table_name='documents')
+    op.drop_index('ix_documents_user_amount', table_name='documents')
+    op.drop_index('ix_documents_user_type_due_date', table_name='documents')
+    op.drop_column('documents', 'needs_review')
+    op.drop_column('documents', 'sender_name')
+    op.drop_column('documents', 'due_date')
+    op.drop_column('documents', 'currency')
+    op.drop_column('documents', 'amount')
+
+    op.drop_index('ix_documents_doc_metadata', table_name='documents')
+    _drop_metadata_dependents()
+    op.alter_column(
+        'documents',
+        'doc_metadata',
+        type_=sa.JSON(),
+        postgresql_using='doc_metadata::json'
+    )
+    _create_metadata_dependents()
@@ -0,0 +1,33 @@
+"""Add Google push notification channel to integrations
+
+Revision ID: c1e8f4a0b679
+Revises: b0d7e3f9a568
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c1e8f4a0b679'
+down_revision: Union[str, None] = 'b0d7e3f9a568'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('integrations', sa.Column('watch_channel_id', sa.String(), nullable=True))
+    op.add_column('integrations', sa.Column('watch_resource_id', sa.String(), nullable=True))
+    op.add_column('integrations', sa.Column('watch_token', sa.String(), nullable=True))
+    op.add_column('integrations', sa.Column('watch_expires_at', sa.DateTime(), nullable=True))
+    op.create_unique_constraint('uq_integrations_watch_channel_id', 'integrations', ['watch_channel_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_integrations_watch_channel_id', 'integrations', type_='unique')
+    op.drop_column('integrations', 'watch_expires_at')
+    op.drop_column('integrations', 'watch_token')
+    op.drop_column('integrations', 'watch_resource_id')
+    op.drop_column('integrations', 'watch_channel_id')
@@ -0,0 +1,29 @@
+"""Add reminder retry columns and due-index
+
+Revision ID: c5e2f8a4b013
+Revises: b4d1e7f3a902
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c5e2f8a4b013'
+down_revision: Union[str, None] = 'b4d1e7f3a902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('reminders', sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('reminders', sa.Column('last_attempt_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_reminders_status_trigger_at', 'reminders', ['status', 'trigger_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reminders_status_trigger_at', table_name='reminders')
+    op.drop_column('reminders', 'last_attempt_at')
+    op.drop_column('reminders', 'attempts')
@@ -0,0 +1,51 @@
+"""Add user_summaries for the dashboard
+
+Revision ID: c7e4f0a6b235
+Revises: b6d3e9f5a124
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'c7e4f0a6b235'
+down_revision: Union[str, None] = 'b6d3e9f5a124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_summaries',
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            primary_key=True
+        ),
+        sa.Column('open_tasks_low', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('open_tasks_medium', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('open_tasks_high', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('open_tasks_critical', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('open_amounts', sa.JSON(), nullable=False, server_default='{}'),
+        sa.Column('documents_needing_review', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('documents_processing', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    # Rows are created on a user's first dashboard visit or task/document change
+
+    op.create_index(
+        'ix_tasks_user_open_due_date',
+        'tasks',
+        ['user_id', 'due_date'],
+        postgresql_where=sa.text("status IN ('open', 'in_progress')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_user_open_due_date', table_name='tasks')
+    op.drop_table('user_summaries')
@@ -0,0 +1,25 @@
+"""Index calendar_events.task_id
+
+Revision ID: d2f9a5b1c780
+Revises: c1e8f4a0b679
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'd2f9a5b1c780'
+down_revision: Union[str, None] = 'c1e8f4a0b679'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Task -> event lookups (bulk task sync, Task.calendar_event) join on it
+    op.create_index('ix_calendar_events_task_id', 'calendar_events', ['task_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_calendar_events_task_id', table_name='calendar_events')
@@ -0,0 +1,25 @@
+"""Add sync_token to integrations
+
+Revision ID: d6f3a9b5c124
+Revises: c5e2f8a4b013
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd6f3a9b5c124'
+down_revision: Union[str, None] = 'c5e2f8a4b013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('integrations', sa.Column('sync_token', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('integrations', 'sync_token')
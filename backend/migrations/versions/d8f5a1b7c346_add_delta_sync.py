@@ -0,0 +1,78 @@
+"""Add delta sync: document updated_at, watermark indexes and tombstones
+
+Revision ID: d8f5a1b7c346
+Revises: c7e4f0a6b235
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'd8f5a1b7c346'
+down_revision: Union[str, None] = 'c7e4f0a6b235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Table -> entity type recorded in deleted_records
+TOMBSTONED_TABLES = {
+    'tasks': 'task',
+    'documents': 'document',
+    'calendar_events': 'event',
+}
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute('UPDATE documents SET updated_at = coalesce(processed_at, uploaded_at)')
+    op.alter_column('documents', 'updated_at', nullable=False)
+
+    op.create_index('ix_documents_user_updated_at_id', 'documents', ['user_id', 'updated_at', 'id'])
+    op.create_index('ix_tasks_user_updated_at_id', 'tasks', ['user_id', 'updated_at', 'id'])
+    op.create_index('ix_calendar_events_user_updated_at_id', 'calendar_events', ['user_id', 'updated_at', 'id'])
+
+    op.create_table(
+        'deleted_records',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entity_type', sa.String(20), nullable=False),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_deleted_records_user_deleted_at_id', 'deleted_records', ['user_id', 'deleted_at', 'id'])
+    op.create_index('ix_deleted_records_deleted_at', 'deleted_records', ['deleted_at'])
+
+    # Triggers catch every delete: endpoints, bulk deletes and FK cascades
+    op.execute("""
+        CREATE FUNCTION record_tombstone() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO deleted_records (user_id, entity_type, entity_id, deleted_at)
+            VALUES (OLD.user_id, TG_ARGV[0], OLD.id, clock_timestamp() AT TIME ZONE 'UTC');
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table, entity_type in TOMBSTONED_TABLES.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_tombstone AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_tombstone('{entity_type}')"
+        )
+
+
+def downgrade() -> None:
+    for table in TOMBSTONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_tombstone ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_tombstone()")
+
+    op.drop_index('ix_deleted_records_deleted_at', table_name='deleted_records')
+    op.drop_index('ix_deleted_records_user_deleted_at_id', table_name='deleted_records')
+    op.drop_table('deleted_records')
+
+    op.drop_index('ix_calendar_events_user_updated_at_id', table_name='calendar_events')
+    op.drop_index('ix_tasks_user_updated_at_id', table_name='tasks')
+    op.drop_index('ix_documents_user_updated_at_id', table_name='documents')
+    op.drop_column('documents', 'updated_at')
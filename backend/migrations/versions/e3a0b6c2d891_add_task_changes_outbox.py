@@ -0,0 +1,44 @@
+"""Add task_changes outbox
+
+Revision ID: e3a0b6c2d891
+Revises: d2f9a5b1c780
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'e3a0b6c2d891'
+down_revision: Union[str, None] = 'd2f9a5b1c780'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_changes',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('task_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('change_type', sa.String(20), nullable=False),
+        sa.Column('fields', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_task_changes_task_id', 'task_changes', ['task_id'])
+    op.create_index(
+        'ix_task_changes_pending',
+        'task_changes',
+        ['id'],
+        postgresql_where=sa.text('processed_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_changes_pending', table_name='task_changes')
+    op.drop_index('ix_task_changes_task_id', table_name='task_changes')
+    op.drop_table('task_changes')
@@ -0,0 +1,29 @@
+"""Add CalDAV incremental sync state (CTag, href, ETag)
+
+Revision ID: e7a4b0c6d235
+Revises: d6f3a9b5c124
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e7a4b0c6d235'
+down_revision: Union[str, None] = 'd6f3a9b5c124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('integrations', sa.Column('sync_ctag', sa.String(), nullable=True))
+    op.add_column('calendar_events', sa.Column('external_href', sa.String(), nullable=True))
+    op.add_column('calendar_events', sa.Column('external_etag', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('calendar_events', 'external_etag')
+    op.drop_column('calendar_events', 'external_href')
+    op.drop_column('integrations', 'sync_ctag')
@@ -0,0 +1,25 @@
+"""Index files.path for rendition lookups
+
+Revision ID: e9a6b2c8d457
+Revises: d8f5a1b7c346
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'e9a6b2c8d457'
+down_revision: Union[str, None] = 'd8f5a1b7c346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /files/{path}?size= resolves the file (and its checksum) by path
+    op.create_index('ix_files_path', 'files', ['path'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_files_path', table_name='files')
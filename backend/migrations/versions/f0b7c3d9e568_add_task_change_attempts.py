@@ -0,0 +1,45 @@
+"""Add attempts and dead-lettering to task_changes
+
+Revision ID: f0b7c3d9e568
+Revises: e9a6b2c8d457
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'f0b7c3d9e568'
+down_revision: Union[str, None] = 'e9a6b2c8d457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('task_changes', sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('task_changes', sa.Column('last_error', sa.Text(), nullable=True))
+    op.add_column('task_changes', sa.Column('dead_lettered_at', sa.DateTime(), nullable=True))
+
+    # Dead-lettered changes are no longer pending
+    op.drop_index('ix_task_changes_pending', table_name='task_changes')
+    op.create_index(
+        'ix_task_changes_pending',
+        'task_changes',
+        ['id'],
+        postgresql_where=sa.text('processed_at IS NULL AND dead_lettered_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_changes_pending', table_name='task_changes')
+    op.create_index(
+        'ix_task_changes_pending',
+        'task_changes',
+        ['id'],
+        postgresql_where=sa.text('processed_at IS NULL')
+    )
+    op.drop_column('task_changes', 'dead_lettered_at')
+    op.drop_column('task_changes', 'last_error')
+    op.drop_column('task_changes', 'attempts')
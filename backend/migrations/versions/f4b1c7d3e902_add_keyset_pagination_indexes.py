@@ -0,0 +1,41 @@
+"""Add keyset pagination indexes
+
+Revision ID: f4b1c7d3e902
+Revises: e3a0b6c2d891
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'f4b1c7d3e902'
+down_revision: Union[str, None] = 'e3a0b6c2d891'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_user_due_date_id',
+        'tasks',
+        ['user_id', 'due_date', 'id']
+    )
+    op.create_index(
+        'ix_documents_user_uploaded_at_id',
+        'documents',
+        ['user_id', sa.text('uploaded_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'ix_calendar_events_user_start_time_id',
+        'calendar_events',
+        ['user_id', 'start_time', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_calendar_events_user_start_time_id', table_name='calendar_events')
+    op.drop_index('ix_documents_user_uploaded_at_id', table_name='documents')
+    op.drop_index('ix_tasks_user_due_date_id', table_name='tasks')
@@ -0,0 +1,37 @@
+"""Unique index on calendar event external IDs per integration
+
+Revision ID: f8b5c1d7e346
+Revises: e7a4b0c6d235
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'f8b5c1d7e346'
+down_revision: Union[str, None] = 'e7a4b0c6d235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicates left behind by earlier pulls, keeping the most recently updated row
+    op.execute("""
+        DELETE FROM calendar_events a
+        USING calendar_events b
+        WHERE a.external_calendar_id = b.external_calendar_id
+          AND a.external_event_id = b.external_event_id
+          AND (a.updated_at, a.id) < (b.updated_at, b.id)
+    """)
+    op.create_index(
+        'ix_calendar_events_integration_external_id',
+        'calendar_events',
+        ['external_calendar_id', 'external_event_id'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_calendar_events_integration_external_id', table_name='calendar_events')
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark TaskEventMappingService.bulk_sync_user_tasks
+
+Seeds one user with N tasks (default 10,000) in a throwaway database and
+times the bulk task -> calendar event sync in its typical situations:
+first sync, no-op resync, resync after 10% of the tasks changed, and a
+forced rebuild.
+
+Usage:
+    python scripts/benchmark_bulk_task_sync.py [--tasks 10000] [--database-url sqlite://]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# Add app directory to path
+sys.path.append(str(Path(__file__).parents[1]))
+
+from app.db.base import Base
+from app.models import CalendarEvent, Task, User
+from app.services.task_event_mapping_service import TaskEventMappingService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000, help="Number of tasks to seed")
+    parser.add_argument("--database-url", default="sqlite://", help="Empty database to run against")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+
+    # Count statements, the number that should stay flat as tasks grow
+    statements = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statement(*_):
+        statements["count"] += 1
+
+    db = sessionmaker(bind=engine)()
+
+    try:
+        user = User(email="benchmark@example.com", username="benchmark", password_hash="-")
+        db.add(user)
+        db.flush()
+
+        now = datetime.utcnow()
+        db.bulk_insert_mappings(Task, [
+            {
+                "user_id": user.id,
+                "title": f"Task {i}",
+                "due_date": now + timedelta(hours=i),
+                "priority": ("low", "medium", "high", "critical")[i % 4],
+                "status": "open",
+            }
+            for i in range(args.tasks)
+        ])
+        db.commit()
+
+        service = TaskEventMappingService(db)
+
+        def run(label, **kwargs):
+            db.expire_all()
+            statements["count"] = 0
+            start = time.perf_counter()
+            stats = service.bulk_sync_user_tasks(user, **kwargs)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<28} {elapsed:7.2f}s  {statements['count']:>5} statements  {stats}")
+
+        print(f"🚀 bulk_sync_user_tasks with {args.tasks} tasks")
+        run("first sync")
+        run("no-op resync")
+
+        db.query(Task).filter(Task.title.like("%0")).update(
+            {Task.priority: "critical"}, synchronize_session=False
+        )
+        db.commit()
+        run("resync, 10% changed")
+
+        run("forced rebuild", force=True)
+
+        events = db.query(CalendarEvent).count()
+        print(f"✅ {events} calendar events")
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
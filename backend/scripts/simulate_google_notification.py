@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Send a fake Google Calendar push notification to a local backend
+
+Stand-in for Google's push service during development: looks up the watch
+channel of an integration and posts the headers Google would send.
+
+Usage:
+    python scripts/simulate_google_notification.py <integration_id> [base_url]
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+
+# Add app directory to path
+sys.path.append(str(Path(__file__).parents[1]))
+
+from app.db.session import SessionLocal
+from app.models import Integration
+from app.core.config import settings
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    integration_id = sys.argv[1]
+    base_url = sys.argv[2] if len(sys.argv) > 2 else "http://localhost:8000"
+
+    db = SessionLocal()
+    try:
+        integration = db.query(Integration).filter(Integration.id == integration_id).first()
+        if not integration or not integration.watch_channel_id:
+            print("❌ Integration not found or no watch channel registered")
+            sys.exit(1)
+
+        headers = {
+            "X-Goog-Channel-ID": integration.watch_channel_id,
+            "X-Goog-Channel-Token": integration.watch_token,
+            "X-Goog-Resource-ID": integration.watch_resource_id,
+            "X-Goog-Resource-State": "exists",
+            "X-Goog-Message-Number": "1",
+        }
+    finally:
+        db.close()
+
+    response = httpx.post(f"{base_url}{settings.API_V1_PREFIX}/calendar/webhooks/google", headers=headers)
+    print(f"✅ Notification sent, backend answered {response.status_code}")
+
+
+if __name__ == "__main__":
+    main()
@@ -77,6 +77,7 @@ class DocumentFile {
   final int sizeBytes;
   final String mimeType;
   final String path;
+  final String? url; // Signed /files URL, expires (see FILE_URL_TTL_SECONDS)
   final DateTime createdAt;
 
   DocumentFile({
@@ -85,6 +86,7 @@ class DocumentFile {
     required this.sizeBytes,
     required this.mimeType,
     required this.path,
+    this.url,
     required this.createdAt,
   });
 
@@ -95,6 +97,7 @@ class DocumentFile {
       sizeBytes: json['size_bytes'] as int,
       mimeType: json['mime_type'] as String,
       path: json['path'] as String,
+      url: json['url'] as String?,
       createdAt: DateTime.parse(json['created_at']),
     );
   }
@@ -55,10 +55,11 @@ class _DocumentDetailPageState extends State<DocumentDetailPage> {
     }
   }
 
-  String _getImageUrl(String path) {
+  String _getImageUrl(DocumentFile file) {
     // Remove /api/v1 from base URL for image serving
     final baseUrl = ApiConfig.baseUrl.replaceAll('/api/v1', '');
-    return '$baseUrl/files/$path';
+    // Files are only served through the signed URL from the API
+    return '$baseUrl${file.url ?? '/files/${file.path}'}';
   }
 
   Color _getStatusColor() {
@@ -203,7 +204,7 @@ class _DocumentDetailPageState extends State<DocumentDetailPage> {
       color: Colors.grey[200],
       child: file.mimeType.startsWith('image/')
           ? Image.network(
-              _getImageUrl(file.path),
+              _getImageUrl(file),
               fit: BoxFit.contain,
               loadingBuilder: (context, child, loadingProgress) {
                 if (loadingProgress == null) return child;
@@ -56,7 +56,12 @@ class PushNotificationService {
 
   Future<void> unregisterToken() async {
     try {
-      await _api.delete('/notifications/fcm-token');
+      final token = await _messaging.getToken();
+      if (token != null) {
+        // Only remove this device – other devices keep receiving reminders
+        await _api.delete(
+            '/notifications/fcm-token?token=${Uri.encodeQueryComponent(token)}');
+      }
       await _messaging.deleteToken();
     } catch (e) {
       debugPrint('FCM Token-Deregistrierung fehlgeschlagen: $e');
@@ -65,13 +70,21 @@ class PushNotificationService {
 
   Future<void> _registerTokenWithBackend(String token) async {
     try {
-      await _api.post('/notifications/fcm-token', data: {'token': token});
+      await _api.post('/notifications/fcm-token', data: {
+        'token': token,
+        'platform': _platform,
+      });
       debugPrint('FCM Token registriert');
     } catch (e) {
       debugPrint('FCM Token Backend-Registrierung fehlgeschlagen: $e');
     }
   }
 
+  String get _platform {
+    if (kIsWeb) return 'web';
+    return defaultTargetPlatform == TargetPlatform.iOS ? 'ios' : 'android';
+  }
+
   void _handleForegroundMessage(RemoteMessage message) {
     debugPrint('Foreground-Nachricht: ${message.notification?.title}');
     // TODO: In-App Snackbar/Banner anzeigen